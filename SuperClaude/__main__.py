@@ -8,15 +8,20 @@ Usage:
     SuperClaude update [options]
     SuperClaude uninstall [options]
     SuperClaude backup [options]
+    SuperClaude serve [options]
     SuperClaude --help
 """
 
+import os
 import sys
 import argparse
 import subprocess
+import tempfile
 import difflib
+import time
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional
 
 # Add the 'setup' directory to the Python import path (with deprecation-safe logic)
 
@@ -41,6 +46,8 @@ try:
         display_warning, Colors
     )
     from setup.utils.logger import setup_logging, get_logger, LogLevel
+    from setup.utils.profiler import enable_profiling
+    from setup.utils.events import enable_event_output, emit_event
     from setup import DEFAULT_INSTALL_DIR
 except ImportError:
     # Provide minimal fallback functions and constants if imports fail
@@ -54,6 +61,9 @@ except ImportError:
     def display_header(title, subtitle): print(f"{title} - {subtitle}")
     def get_logger(): return None
     def setup_logging(*args, **kwargs): pass
+    def enable_profiling(): return None
+    def enable_event_output(stream): return None
+    def emit_event(event, **fields): pass
     class LogLevel:
         ERROR = 40
         INFO = 20
@@ -76,6 +86,10 @@ def create_global_parser() -> argparse.ArgumentParser:
                                help="Force execution, skipping checks")
     global_parser.add_argument("--yes", "-y", action="store_true",
                                help="Automatically answer yes to all prompts")
+    global_parser.add_argument("--perf-profile", action="store_true",
+                               help="Record import and phase timings to <install-dir>/logs/profile_<timestamp>.json")
+    global_parser.add_argument("--output", choices=["text", "jsonl"], default="text",
+                               help="Output format: colored text or JSON-lines events on stdout (text goes to stderr)")
 
     return global_parser
 
@@ -118,6 +132,11 @@ def setup_global_environment(args: argparse.Namespace):
     else:
         level = LogLevel.INFO
 
+    # Structured output: events own stdout, human-readable text moves to stderr
+    if args.output == "jsonl":
+        enable_event_output(sys.stdout)
+        sys.stdout = sys.stderr
+
     # Define log directory unless it's a dry run
     log_dir = args.install_dir / "logs" if not args.dry_run else None
     setup_logging("superclaude_hub", log_dir=log_dir, console_level=level)
@@ -135,10 +154,26 @@ def get_operation_modules() -> Dict[str, str]:
         "install": "Install SuperClaude framework components",
         "update": "Update existing SuperClaude installation",
         "uninstall": "Remove SuperClaude installation",
-        "backup": "Backup and restore operations"
+        "backup": "Backup and restore operations",
+        "serve": "Run a persistent daemon over a Unix socket"
     }
 
 
+def run_operation(run_func: Callable, args: argparse.Namespace) -> int:
+    """Run an operation, reporting its start and end as events"""
+    emit_event("operation_start", operation=args.operation,
+               install_dir=str(args.install_dir), dry_run=args.dry_run)
+    start_time = time.perf_counter()
+    exit_code = 1
+
+    try:
+        exit_code = run_func(args)
+        return exit_code
+    finally:
+        emit_event("operation_end", operation=args.operation, exit_code=exit_code,
+                   duration_ms=round((time.perf_counter() - start_time) * 1000, 3))
+
+
 def load_operation_module(name: str):
     """Try to dynamically import an operation module"""
     try:
@@ -150,10 +185,51 @@ def load_operation_module(name: str):
         return None
 
 
-def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]:
-    """Register subcommand parsers and map operation names to their run functions"""
+def detect_requested_operation(argv: List[str], global_parser: argparse.ArgumentParser) -> Optional[str]:
+    """Find the operation named on the command line without fully parsing it"""
+    # Global options that consume the following token (e.g. --install-dir PATH)
+    value_options = {
+        option
+        for action in global_parser._actions
+        if action.nargs != 0
+        for option in action.option_strings
+    }
+
+    skip_next = False
+    for token in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if token == "--":
+            break
+        if token.startswith("-"):
+            skip_next = token in value_options
+            continue
+        return token if token in get_operation_modules() else None
+
+    return None
+
+
+def register_operation_parsers(subparsers, global_parser,
+                               argv: Optional[List[str]] = None) -> Dict[str, Optional[Callable]]:
+    """
+    Register subcommand parsers and map operation names to their run functions
+
+    Only the operation being dispatched is imported. Every other operation gets
+    a lightweight placeholder parser built from its spec so that top-level help
+    and argument validation still list it.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    requested = detect_requested_operation(argv, global_parser)
+
     operations = {}
     for name, desc in get_operation_modules().items():
+        if name != requested:
+            subparsers.add_parser(name, help=desc, parents=[global_parser])
+            operations[name] = None
+            continue
+
         module = load_operation_module(name)
         if module and hasattr(module, 'register_parser') and hasattr(module, 'run'):
             module.register_parser(subparsers, global_parser)
@@ -166,6 +242,64 @@ def register_operation_parsers(subparsers, global_parser) -> Dict[str, Callable]
     return operations
 
 
+def dispatch_operation(argv: List[str], allowed_operations: Optional[tuple] = None) -> int:
+    """
+    Parse argv and run a single operation in this process
+
+    Used by the serve daemon to execute forwarded requests. The daemon
+    can't prompt, so requests must pass --yes.
+    """
+    parser, subparsers, global_parser = create_parser()
+    operations = register_operation_parsers(subparsers, global_parser, argv)
+    args = parser.parse_args(argv)
+
+    if not args.operation or (allowed_operations and args.operation not in allowed_operations):
+        display_error(f"Operation not available here: '{args.operation}'")
+        return 1
+
+    run_func = operations.get(args.operation)
+    if not run_func:
+        display_error(f"Module for '{args.operation}' could not be loaded")
+        return 1
+
+    if not args.yes:
+        display_error("Requests run by the daemon can't prompt; pass --yes")
+        return 1
+
+    setup_global_environment(args)
+    return run_operation(run_func, args)
+
+
+def try_daemon_forwarding(argv: List[str]) -> Optional[int]:
+    """
+    Run the invocation inside a serve daemon when SUPERCLAUDE_SOCKET is set
+
+    Only invocations with --yes are forwarded: the daemon can't show menus or
+    ask for confirmation, so anything that may prompt runs locally.
+
+    Returns:
+        The daemon's exit code, or None to run locally
+    """
+    socket_path = os.environ.get("SUPERCLAUDE_SOCKET")
+    if not socket_path or "--perf-profile" in argv:
+        return None
+    if "--yes" not in argv and "-y" not in argv:
+        return None
+
+    from setup.utils.daemon import DAEMON_OPERATIONS, forward_to_daemon
+
+    if detect_requested_operation(argv, create_global_parser()) not in DAEMON_OPERATIONS:
+        return None
+
+    response = forward_to_daemon(Path(socket_path), argv)
+    if response is None or "exit_code" not in response:
+        return None
+
+    print(response.get("output", ""), end="")
+    print(response.get("errors", ""), end="", file=sys.stderr)
+    return response["exit_code"]
+
+
 def handle_legacy_fallback(op: str, args: argparse.Namespace) -> int:
     """Run a legacy operation script if module is unavailable"""
     script_path = Path(__file__).parent / f"{op}.py"
@@ -197,10 +331,20 @@ def handle_legacy_fallback(op: str, args: argparse.Namespace) -> int:
 
 def main() -> int:
     """Main entry point"""
+    # Profiling has to start before the operation modules are imported
+    profiler = enable_profiling() if "--perf-profile" in sys.argv[1:] else None
+    args = None
+
+    # Hand supported operations to a running daemon when one is configured
+    exit_code = try_daemon_forwarding(sys.argv[1:])
+    if exit_code is not None:
+        return exit_code
+
     try:
-        parser, subparsers, global_parser = create_parser()
-        operations = register_operation_parsers(subparsers, global_parser)
-        args = parser.parse_args()
+        with profiler.phase("arg_parsing") if profiler else nullcontext():
+            parser, subparsers, global_parser = create_parser()
+            operations = register_operation_parsers(subparsers, global_parser)
+            args = parser.parse_args()
 
         # No operation provided? Show help manually unless in quiet mode
         if not args.operation:
@@ -227,7 +371,7 @@ def main() -> int:
         if run_func:
             if logger:
                 logger.info(f"Executing operation: {args.operation}")
-            return run_func(args)
+            return run_operation(run_func, args)
         else:
             # Fallback to legacy script
             if logger:
@@ -245,6 +389,15 @@ def main() -> int:
         except:
             print(f"{Colors.RED}[ERROR] {e}{Colors.RESET}")
         return 1
+    finally:
+        if profiler:
+            install_dir = args.install_dir if args is not None else DEFAULT_INSTALL_DIR
+            dry_run = args.dry_run if args is not None else "--dry-run" in sys.argv[1:]
+            # A dry run leaves the install dir untouched, so its report goes to the temp dir
+            log_dir = Path(tempfile.gettempdir()) / "superclaude" if dry_run else install_dir / "logs"
+            report_file = profiler.write_report(log_dir)
+            if report_file:
+                print(f"Profile report written to {report_file}", file=sys.stderr)
 
 
 # Entrypoint guard
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark FileManager.copy_directory on a large synthetic tree
+
+Builds a source tree (50,000 files by default, one in ten ignored by the
+default patterns) and reports:
+
+- ignore matching: the per-pattern fnmatch loop copy_directory used to run
+  for every entry, against the compiled expression it uses now
+- the rglob walk over the target that used to follow every copy
+- the whole copy_directory call
+
+Usage:
+    python benchmarks/bench_copy_directory.py [--files 50000] [--dir PATH] [--keep]
+"""
+
+import argparse
+import fnmatch
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup.managers.file_manager import FileManager, _compile_ignore_patterns  # noqa: E402
+
+
+DEFAULT_IGNORES = ['.git', '.gitignore', '__pycache__', '*.pyc', '.DS_Store']
+PATTERNS = ["*.log", "build", "docs/*.tmp", "*.bak", "node_modules"]
+FILES_PER_DIRECTORY = 100
+
+
+def build_tree(source: Path, file_count: int) -> None:
+    """Create file_count files in package/module directories, with __pycache__ dirs and .pyc files"""
+    for index in range(file_count):
+        directory = source / f"pkg{index // (FILES_PER_DIRECTORY * 10)}" / f"mod{index // FILES_PER_DIRECTORY}"
+        if index % FILES_PER_DIRECTORY == 0:
+            (directory / "__pycache__").mkdir(parents=True, exist_ok=True)
+        suffix = ".pyc" if index % 10 == 0 else ".md"
+        (directory / f"file{index}{suffix}").write_bytes(b"x" * 64)
+
+
+def listings(source: Path):
+    """(directory, entries) pairs as copytree passes them to the ignore callback"""
+    return [(directory, sorted(dirs + files)) for directory, dirs, files in os.walk(source)]
+
+
+def time_fnmatch(source: Path, entries, patterns) -> float:
+    start = time.perf_counter()
+    for directory, names in entries:
+        for name in names:
+            relative = str((Path(directory) / name).relative_to(source))
+            any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative, pattern) for pattern in patterns)
+    return time.perf_counter() - start
+
+
+def time_compiled(source: Path, entries, patterns) -> float:
+    start = time.perf_counter()
+    compiled = _compile_ignore_patterns(tuple(patterns))
+    for directory, names in entries:
+        relative_dir = os.path.relpath(directory, source)
+        prefix = "" if relative_dir == os.curdir else os.path.normcase(relative_dir + os.sep)
+        for name in names:
+            name = os.path.normcase(name)
+            compiled.match(name) or compiled.match(prefix + name)
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=50_000, help="Number of source files (default: 50000)")
+    parser.add_argument("--dir", type=Path, help="Directory for the trees (default: a temporary directory)")
+    parser.add_argument("--keep", action="store_true", help="Keep the trees afterwards")
+    args = parser.parse_args()
+
+    work_dir = Path(tempfile.mkdtemp(prefix="sc-bench-", dir=args.dir))
+    try:
+        source = work_dir / "source"
+        target = work_dir / "target"
+        build_tree(source, args.files)
+        entries = listings(source)
+        patterns = PATTERNS + DEFAULT_IGNORES
+        entry_count = sum(len(names) for _, names in entries)
+
+        fnmatch_time = time_fnmatch(source, entries, patterns)
+        compiled_time = time_compiled(source, entries, patterns)
+
+        file_manager = FileManager()
+        start = time.perf_counter()
+        if not file_manager.copy_directory(source, target, PATTERNS):
+            print("copy_directory failed", file=sys.stderr)
+            return 1
+        copy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        walked = 0
+        for item in target.rglob('*'):
+            item.is_dir()
+            walked += 1
+        walk_time = time.perf_counter() - start
+
+        print(f"Source: {args.files} files, {entry_count} entries in {len(entries)} directories")
+        print(f"Copied: {len(file_manager.copied_files)} files, {len(file_manager.created_dirs)} directories")
+        print(f"{'ignore matching (fnmatch loop)':<36} {fnmatch_time * 1000:10.1f} ms")
+        print(f"{'ignore matching (compiled)':<36} {compiled_time * 1000:10.1f} ms")
+        print(f"{'post-copy rglob walk (removed)':<36} {walk_time * 1000:10.1f} ms ({walked} entries)")
+        print(f"{'copy_directory':<36} {copy_time * 1000:10.1f} ms")
+        return 0
+    finally:
+        if args.keep:
+            print(f"Trees kept in {work_dir}")
+        else:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Hatch build hook generating SuperClaude/source-manifest.json for wheels and sdists
+"""
+
+import importlib.util
+import tempfile
+from pathlib import Path
+
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+def _load_source_manifest_module(root: Path):
+    """Load setup/utils/source_manifest.py by path (the setup package isn't importable at build time)"""
+    spec = importlib.util.spec_from_file_location(
+        "_superclaude_source_manifest", root / "setup" / "utils" / "source_manifest.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class SourceManifestBuildHook(BuildHookInterface):
+    """Ship a manifest of the framework sources so installs don't scan them"""
+
+    PLUGIN_NAME = "custom"
+
+    def initialize(self, version, build_data):
+        # Editable installs read the live tree and keep scanning it
+        if version == "editable":
+            return
+
+        root = Path(self.root)
+        source_manifest = _load_source_manifest_module(root)
+        package_dir = root / "SuperClaude"
+        target = f"SuperClaude/{source_manifest.SOURCE_MANIFEST_FILE}"
+
+        self._tempdir = tempfile.TemporaryDirectory()
+        path = Path(self._tempdir.name) / source_manifest.SOURCE_MANIFEST_FILE
+        source_manifest.write_source_manifest(package_dir, self.metadata.version, path)
+
+        # Building from an unpacked sdist: the shipped copy is replaced, not duplicated
+        shipped = package_dir / source_manifest.SOURCE_MANIFEST_FILE
+        if shipped.is_file():
+            shipped.write_bytes(path.read_bytes())
+        else:
+            build_data["force_include"][str(path)] = target
+
+    def finalize(self, version, build_data, artifact_path):
+        tempdir = getattr(self, "_tempdir", None)
+        if tempdir is not None:
+            tempdir.cleanup()
@@ -6,6 +6,7 @@ Pure Python installation system for SuperClaude framework
 __version__ = "3.0.0"
 __author__ = "SuperClaude Team"
 
+import os
 from pathlib import Path
 
 # Core paths
@@ -15,4 +16,11 @@ CONFIG_DIR = PROJECT_ROOT / "config"
 PROFILES_DIR = PROJECT_ROOT / "profiles"
 
 # Installation target
-DEFAULT_INSTALL_DIR = Path.home() / ".claude"
\ No newline at end of file
+DEFAULT_INSTALL_DIR = Path.home() / ".claude"
+
+# Per-user caches of the installer itself
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "superclaude"
+
+# Content store that link-mode installs share (outside any install dir, so
+# removing or backing up one installation leaves it alone)
+DEFAULT_STORE_DIR = Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share") / "superclaude" / "store"
@@ -3,46 +3,109 @@ Abstract base class for installable components
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Mapping, ClassVar, TYPE_CHECKING
 from pathlib import Path
-import json
+from ..managers.content_store import ContentStore, LINK_MODE_COPY
 from ..managers.file_manager import FileManager
 from ..managers.settings_manager import SettingsManager
 from ..utils.logger import get_logger
 from ..utils.security import SecurityValidator
+from ..utils.source_manifest import get_source_manifest
+from .file_spec import FileSpec, list_source_files
+
+if TYPE_CHECKING:
+    from .plan import ComponentPlan, PlannedFile
 
 
 class Component(ABC):
     """Base class for all installable components"""
     
+    # Declared by subclasses so the registry can read them without instantiating:
+    # name, version, description and category, and the names of required components
+    METADATA: ClassVar[Mapping[str, str]] = {}
+    DEPENDENCIES: ClassVar[Tuple[str, ...]] = ()
+    # Files of the component, as globs relative to its source directory
+    FILE_SPEC: ClassVar[FileSpec] = FileSpec(
+        include=("*.md",),
+        exclude=("README.md", "CHANGELOG.md", "LICENSE.md")
+    )
+    
     def __init__(self, install_dir: Optional[Path] = None, component_subdir: Path = Path('')):
         """
         Initialize component with installation directory
         
+        Construction has no side effects; the settings and file managers are
+        created and the source directory scanned on first use.
+        
         Args:
             install_dir: Target installation directory (defaults to ~/.claude)
         """
         from .. import DEFAULT_INSTALL_DIR
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
-        self.settings_manager = SettingsManager(self.install_dir)
         self.logger = get_logger()
-        self.component_files = self._discover_component_files()
-        self.file_manager = FileManager()
+        self._settings_manager: Optional[SettingsManager] = None
+        self._file_manager: Optional[FileManager] = None
+        self._component_files: Optional[List[str]] = None
         self.install_component_subdir = self.install_dir / component_subdir
+        # Differs from install_dir when installing into a staging tree
+        self.live_install_dir = self.install_dir
+        # Set by the installer for the current run; file lists come from it when present
+        self.plan: Optional["ComponentPlan"] = None
+        self._prerequisites_plan: Optional["ComponentPlan"] = None
+        # Per-run manifest state, reset by install()
+        self._installed_manifest: Dict[str, Dict[str, Any]] = {}
+        self._manifest_entries: Dict[str, Dict[str, Any]] = {}
+        self._force_copy = False
+        self._link_mode = LINK_MODE_COPY
+        self.unchanged_files = 0
+    
+    @property
+    def settings_manager(self) -> SettingsManager:
+        """Settings manager of the installation directory (created on first use)"""
+        if self._settings_manager is None:
+            self._settings_manager = SettingsManager(self.install_dir)
+        return self._settings_manager
+    
+    @settings_manager.setter
+    def settings_manager(self, settings_manager: SettingsManager) -> None:
+        self._settings_manager = settings_manager
+    
+    @property
+    def file_manager(self) -> FileManager:
+        """File manager collecting this component's copy statistics (created on first use)"""
+        if self._file_manager is None:
+            # Files linked from a content store release their refs when removed
+            store = self.settings_manager.get_content_store()
+            self._file_manager = FileManager(store=ContentStore(Path(store["path"])) if store else None)
+        return self._file_manager
+    
+    @file_manager.setter
+    def file_manager(self, file_manager: FileManager) -> None:
+        self._file_manager = file_manager
+    
+    @property
+    def component_files(self) -> List[str]:
+        """Source files of the component (the source directory is scanned on first access)"""
+        if self._component_files is None:
+            self._component_files = self._discover_component_files()
+        return self._component_files
+    
+    @component_files.setter
+    def component_files(self, component_files: List[str]) -> None:
+        self._component_files = component_files
     
-    @abstractmethod
     def get_metadata(self) -> Dict[str, str]:
         """
         Return component metadata
         
         Returns:
-            Dict containing:
+            Dict containing (from the class's METADATA):
                 - name: Component name
                 - version: Component version
                 - description: Component description
                 - category: Component category (core, command, integration, etc.)
         """
-        pass
+        return dict(self.METADATA)
     
     def validate_prerequisites(self, installSubPath: Optional[Path] = None) -> Tuple[bool, List[str]]:
         """
@@ -60,11 +123,14 @@ class Component(ABC):
             return False, errors
 
         # Check if all required framework files exist
-        missing_files = []
-        for filename in self.component_files:
-            source_file = source_dir / filename
-            if not source_file.exists():
-                missing_files.append(filename)
+        if self.plan is not None:
+            missing_files = list(self.plan.missing_files)
+        else:
+            missing_files = []
+            for filename in self.component_files:
+                source_file = source_dir / filename
+                if not source_file.exists():
+                    missing_files.append(filename)
 
         if missing_files:
             errors.append(f"Missing component files: {missing_files}")
@@ -96,6 +162,24 @@ class Component(ABC):
 
         return len(errors) == 0, errors
     
+    def check_prerequisites(self) -> Tuple[bool, List[str]]:
+        """
+        Validate prerequisites once per install plan
+        
+        The installer checks prerequisites before install() and _install()
+        checks them again; with a plan attached, the second check is skipped.
+        
+        Returns:
+            Tuple of (success: bool, error_messages: List[str])
+        """
+        if self.plan is not None and self._prerequisites_plan is self.plan:
+            return True, []
+
+        success, errors = self.validate_prerequisites()
+        if success:
+            self._prerequisites_plan = self.plan
+        return success, errors
+    
     def get_files_to_install(self) -> List[Tuple[Path, Path]]:
         """
         Return list of files to install
@@ -103,17 +187,64 @@ class Component(ABC):
         Returns:
             List of tuples (source_path, target_path)
         """
+        if self.plan is not None:
+            return [(planned.source, self.install_dir / planned.relative_target) for planned in self.plan.files]
+
         source_dir = self._get_source_dir()
         files = []
 
         if source_dir:
             for filename in self.component_files:
                 source = source_dir / filename
+                if not self._is_installable(source):
+                    continue
                 target = self.install_component_subdir / filename
                 files.append((source, target))
 
         return files
     
+    def _is_installable(self, source: Path) -> bool:
+        """
+        Check whether a source file is installed at all
+        
+        Components that skip some of their sources (e.g. agents with invalid
+        frontmatter) filter them here, so the plan and the manifest check
+        only see the files actually installed.
+        
+        Args:
+            source: Source file of component_files
+            
+        Returns:
+            True if the file is installed
+        """
+        return True
+    
+    def get_directories_to_create(self) -> List[Path]:
+        """
+        Return directories this component creates, relative to the install directory
+        
+        Returns:
+            List of relative paths
+        """
+        subdir = self.install_component_subdir.relative_to(self.install_dir)
+        return [subdir] if subdir != Path('') else []
+    
+    def get_managed_paths(self) -> List[Path]:
+        """
+        Return paths owned by this component, relative to the install directory
+        
+        Staged installs publish these into the live directory by rename:
+        a component subdirectory is swapped as a whole, otherwise each
+        component file is replaced individually.
+        
+        Returns:
+            List of relative paths
+        """
+        subdir = self.install_component_subdir.relative_to(self.install_dir)
+        if subdir != Path(''):
+            return [subdir]
+        return [Path(filename) for filename in self.component_files]
+    
     def get_settings_modifications(self) -> Dict[str, Any]:
         """
         Return settings.json modifications to apply
@@ -126,12 +257,311 @@ class Component(ABC):
         return {}
     
     def install(self, config: Dict[str, Any]) -> bool:
+        component_name = self.get_metadata()['name']
+        self._installed_manifest = self.settings_manager.get_component_manifest(component_name)
+        self._manifest_entries = {}
+        self._force_copy = bool(config.get("force"))
+        self._link_mode = config.get("link_mode", LINK_MODE_COPY)
+        if self._link_mode != LINK_MODE_COPY:
+            self.file_manager.store = ContentStore(Path(config["store"]))
+        self.unchanged_files = 0
+
         try:
-            return self._install(config)
+            success = self._install(config)
+            if success:
+                self.settings_manager.set_component_manifest(component_name, self._manifest_entries)
+            return success
         except Exception as e:
             self.logger.exception(f"Unexpected error during {repr(self)} installation: {e}")
             return False
 
+    def has_changes(self) -> bool:
+        """
+        Check whether installing would change anything in the install directory
+        
+        True unless the component is registered at its current version and
+        every file to install matches its manifest entry, both in the source
+        and in the installed copy.
+        
+        Returns:
+            True if the component needs installing, False if it is up to date
+        """
+        metadata = self.get_metadata()
+        if self.settings_manager.get_component_version(metadata['name']) != metadata['version']:
+            return True
+
+        manifest = self.settings_manager.get_component_manifest(metadata['name'])
+        files_to_install = self.get_files_to_install()
+        if len(manifest) != len(files_to_install):
+            return True
+
+        for source, target in files_to_install:
+            if not self._is_file_unchanged(source, target, manifest):
+                return True
+
+        return False
+
+    def get_preimage_paths(self) -> List[Path]:
+        """
+        Return installed files that installing this component would overwrite or delete
+        
+        Used for pre-image backups; files whose installed copy already
+        matches the source are left out.
+        
+        Returns:
+            List of absolute paths in the live installation directory
+        """
+        manifest = self.settings_manager.get_component_manifest(self.get_metadata()['name'])
+        paths = []
+
+        for source, target in self.get_files_to_install():
+            live_target = self._get_live_path(target)
+            if live_target.is_file() and not self._is_file_unchanged(source, target, manifest):
+                paths.append(live_target)
+
+        paths.extend(self.get_paths_to_delete())
+        return paths
+
+    def get_paths_to_delete(self) -> List[Path]:
+        """
+        Return installed files that installing this component removes
+        
+        Returns:
+            List of absolute paths in the live installation directory
+        """
+        return []
+
+    def get_file_changes(self) -> List[Dict[str, Any]]:
+        """
+        Work out what installing this component would do to each file, without writing
+        
+        Returns:
+            List of {"action": "add" | "modify" | "delete", "path": path relative
+            to the install directory, "bytes": size}; unchanged files are left out
+        """
+        manifest = self.settings_manager.get_component_manifest(self.get_metadata()['name'])
+        changes = []
+
+        for source, target in self.get_files_to_install():
+            planned = self._get_planned_file(target)
+            if planned is not None:
+                size = planned.size
+            else:
+                try:
+                    size = source.stat().st_size
+                except OSError:
+                    continue
+
+            if not self._get_live_path(target).is_file():
+                action = "add"
+            elif self._is_file_unchanged(source, target, manifest):
+                continue
+            else:
+                action = "modify"
+
+            changes.append({"action": action, "path": self._get_manifest_key(target), "bytes": size})
+
+        for path in self.get_paths_to_delete():
+            changes.append({
+                "action": "delete",
+                "path": path.relative_to(self.live_install_dir).as_posix(),
+                "bytes": path.stat().st_size
+            })
+
+        return changes
+
+    def get_metadata_changes(self) -> List[str]:
+        """
+        Return metadata keys (dot notation) whose value installing this component changes
+        
+        Returns:
+            Sorted list of keys
+        """
+        metadata = self.get_metadata()
+        current = self.settings_manager.load_metadata()
+
+        if self.plan is not None:
+            mutations = self.plan.metadata_mutations
+        else:
+            get_modifications = getattr(self, "get_metadata_modifications", None)
+            mutations = get_modifications() if get_modifications else {}
+
+        changed = set()
+
+        def collect(modifications, existing, prefix):
+            for key, value in modifications.items():
+                path = f"{prefix}{key}"
+                existing_value = existing.get(key) if isinstance(existing, dict) else None
+                if isinstance(value, Mapping) and value:
+                    collect(value, existing_value, f"{path}.")
+                elif existing_value != value:
+                    changed.add(path)
+
+        collect(mutations, current, "")
+
+        # The component registration replaces components.<name> as a whole after the mutations
+        registration = f"components.{metadata['name']}."
+        changed = {key for key in changed if not key.startswith(registration)}
+        registered = current.get("components", {}).get(metadata['name'], {})
+        if registered.get("version") != metadata['version']:
+            changed.add(f"{registration}version")
+
+        return sorted(changed)
+
+    def _install_file(self, source: Path, target: Path) -> bool:
+        """
+        Install one file unless the installed copy already matches the source
+        
+        Args:
+            source: Source file
+            target: Target path (under install_dir)
+            
+        Returns:
+            True if the target is up to date afterwards, False otherwise
+        """
+        failures = self._install_files([(source, target)])
+        for error in failures.values():
+            self.logger.error(f"Failed to copy {source.name}: {error}")
+        return not failures
+
+    def _install_files(self, files: List[Tuple[Path, Path]]) -> Dict[Path, str]:
+        """
+        Install files in one batch, skipping those whose installed copy already matches
+        
+        Args:
+            files: (source, target) pairs, targets under install_dir
+            
+        Returns:
+            Dict mapping each target that could not be installed to the error
+        """
+        to_copy = [(source, target) for source, target in files if not self._keep_installed_file(source, target)]
+
+        if self._link_mode == LINK_MODE_COPY:
+            failures = self.file_manager.copy_many(to_copy)
+        else:
+            digests = {}
+            for _, target in to_copy:
+                planned = self._get_planned_file(target)
+                if planned is not None:
+                    digests[target] = planned.sha256
+            ref_paths = {target: self._get_live_path(target) for _, target in to_copy}
+            failures = self.file_manager.link_many(to_copy, self._link_mode, digests, ref_paths)
+
+        for _, target in to_copy:
+            if target not in failures:
+                self._record_copied_file(target)
+        return failures
+
+    def _keep_installed_file(self, source: Path, target: Path) -> bool:
+        """
+        Keep the installed copy of a file if it already matches the source
+        
+        Returns:
+            True if kept (and recorded in the manifest), False if it must be copied
+        """
+        if self._force_copy or not self._is_file_unchanged(source, target, self._installed_manifest):
+            return False
+
+        key = self._get_manifest_key(target)
+        if self._link_mode != LINK_MODE_COPY:
+            # Switching to a link mode relinks files that are still copies
+            sha256 = (self._installed_manifest.get(key) or {}).get("sha256")
+            if not sha256 or not self.file_manager.store.is_linked(self._get_live_path(target), sha256):
+                return False
+
+        try:
+            if self.install_dir != self.live_install_dir:
+                # Staged trees must be complete for validation; link the live copy in
+                self.file_manager.link_or_copy(self._get_live_path(target), target)
+            self._manifest_entries[key] = self._installed_manifest.get(key) or \
+                self._make_manifest_entry(self._get_live_path(target), self._get_planned_file(target).sha256)
+            self.unchanged_files += 1
+            return True
+        except OSError:
+            return False
+
+    def _record_copied_file(self, target: Path) -> None:
+        """Record a freshly copied file in the manifest"""
+        planned = self._get_planned_file(target)
+        self._manifest_entries[self._get_manifest_key(target)] = self._make_manifest_entry(
+            target, planned.sha256 if planned is not None else self.file_manager.get_file_hash(target)
+        )
+
+    def _make_manifest_entry(self, path: Path, sha256: Optional[str]) -> Dict[str, Any]:
+        """Build the manifest entry of an installed file"""
+        path_stat = path.stat()
+        return {
+            "size": path_stat.st_size,
+            "mtime": path_stat.st_mtime_ns,
+            "sha256": sha256
+        }
+
+    def _is_file_unchanged(self, source: Path, target: Path, manifest: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Check a source file against its manifest entry and the installed copy
+        
+        Copies keep the source mtime, so a matching size and mtime on both
+        sides is trusted without hashing; the sha256 is only compared when the
+        source was touched but kept its size, or when an installed file has no
+        manifest entry yet.
+        
+        Args:
+            source: Source file
+            target: Target path (under install_dir)
+            manifest: Manifest entries of this component
+            
+        Returns:
+            True if copying source would not change the installed file
+        """
+        entry = manifest.get(self._get_manifest_key(target))
+        planned = self._get_planned_file(target)
+
+        try:
+            installed_stat = self._get_live_path(target).stat()
+        except OSError:
+            return False
+
+        if not entry:
+            # Installed before the manifest existed: adopt it if the content matches
+            if planned is None or installed_stat.st_size != planned.size:
+                return False
+            return self.file_manager.get_file_hash(self._get_live_path(target)) == planned.sha256
+
+        # The installed copy was edited or replaced since it was recorded
+        if installed_stat.st_size != entry["size"] or installed_stat.st_mtime_ns != entry["mtime"]:
+            return False
+
+        # The plan already holds the source size and hash
+        if planned is not None:
+            return planned.size == entry["size"] and planned.sha256 == entry["sha256"]
+
+        try:
+            source_stat = source.stat()
+        except OSError:
+            return False
+
+        if source_stat.st_size != entry["size"]:
+            return False
+
+        if source_stat.st_mtime_ns == entry["mtime"]:
+            return True
+
+        return self.file_manager.get_file_hash(source) == entry["sha256"]
+
+    def _get_planned_file(self, target: Path) -> Optional["PlannedFile"]:
+        """Look up the planned file for a target path (None without a plan)"""
+        if self.plan is None:
+            return None
+        return self.plan.get_file(target.relative_to(self.install_dir))
+
+    def _get_manifest_key(self, target: Path) -> str:
+        """Manifest key of a target path: its path relative to install_dir"""
+        return target.relative_to(self.install_dir).as_posix()
+
+    def _get_live_path(self, target: Path) -> Path:
+        """Map a target path under install_dir to the live installation directory"""
+        return self.live_install_dir / target.relative_to(self.install_dir)
+
     @abstractmethod
     def _install(self, config: Dict[str, Any]) -> bool:
         """
@@ -144,7 +574,7 @@ class Component(ABC):
             True if successful, False otherwise
         """
         # Validate installation
-        success, errors = self.validate_prerequisites()
+        success, errors = self.check_prerequisites()
         if not success:
             for error in errors:
                 self.logger.error(error)
@@ -154,21 +584,17 @@ class Component(ABC):
         files_to_install = self.get_files_to_install()
 
         # Copy framework files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        failures = self._install_files(files_to_install)
+        for target, error in failures.items():
+            self.logger.error(f"Failed to copy {target.name}: {error}")
 
+        success_count = len(files_to_install) - len(failures)
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} files copied successfully")
             return False
 
-        self.logger.success(f"{repr(self)} component installed successfully ({success_count} files)")
+        self.logger.success(f"{repr(self)} component installed successfully "
+                            f"({success_count} files, {self.unchanged_files} unchanged)")
 
         return self._post_install()
 
@@ -187,16 +613,27 @@ class Component(ABC):
             True if successful, False otherwise
         """
         pass
+
+    def rollback_operation(self, operation: Dict[str, Any]) -> bool:
+        """
+        Undo a journaled operation this component performed outside the file system
+        
+        Args:
+            operation: Journal record (e.g. an "mcp" server registration)
+            
+        Returns:
+            True if undone, False if the component doesn't know the operation
+        """
+        return False
     
-    @abstractmethod
     def get_dependencies(self) -> List[str]:
         """
         Return list of component dependencies
         
         Returns:
-            List of component names this component depends on
+            List of component names this component depends on (the class's DEPENDENCIES)
         """
-        pass
+        return list(self.DEPENDENCIES)
 
     @abstractmethod
     def _get_source_dir(self) -> Optional[Path]:
@@ -225,19 +662,15 @@ class Component(ABC):
         Returns:
             Version string if installed, None otherwise
         """
-        print("GETTING INSTALLED VERSION")
-        settings_file = self.install_dir / "settings.json"
-        if settings_file.exists():
-            print("SETTINGS.JSON EXISTS")
-            try:
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
-                component_name = self.get_metadata()['name']
-                return settings.get('components', {}).get(component_name, {}).get('version')
-            except Exception:
-                pass
-        print("SETTINGS.JSON DOESNT EXIST RETURNING NONE")
-        return None
+        component_name = self.get_metadata()['name']
+        try:
+            version = self.settings_manager.get_component_version(component_name)
+            if version is None:
+                # Installations that predate the metadata file registered in settings.json
+                version = self.settings_manager.get_setting(f"components.{component_name}.version")
+            return version
+        except ValueError:
+            return None
     
     def is_installed(self) -> bool:
         """
@@ -255,18 +688,28 @@ class Component(ABC):
         Returns:
             Tuple of (success: bool, error_messages: List[str])
         """
-        errors = []
+        from .validation import ValidationEngine
+        
+        result = ValidationEngine().validate([self])[self.get_metadata()['name']]
+        return result.success, result.errors
+    
+    def validate_registration(self) -> List[str]:
+        """
+        Run the component's checks beyond its installed files
         
-        # Check if all files exist
-        for _, target in self.get_files_to_install():
-            if not target.exists():
-                errors.append(f"Missing file: {target}")
+        Installed files are checked against the plan by the validation
+        engine; components override this for metadata and other state.
+        
+        Returns:
+            List of error messages (empty if valid)
+        """
+        errors = []
         
         # Check version in settings
         if not self.get_installed_version():
-            errors.append("Component not registered in settings.json")
+            errors.append("Component not registered in metadata")
         
-        return len(errors) == 0, errors
+        return errors
     
     def get_size_estimate(self) -> int:
         """
@@ -275,9 +718,16 @@ class Component(ABC):
         Returns:
             Estimated size in bytes
         """
+        if self.plan is not None:
+            return self.plan.total_size
+
+        manifest = get_source_manifest()
         total_size = 0
         for source, _ in self.get_files_to_install():
-            if source.exists():
+            entry = manifest.get_entry(source) if manifest else None
+            if entry is not None:
+                total_size += entry["size"]
+            elif source.exists():
                 if source.is_file():
                     total_size += source.stat().st_size
                 elif source.is_dir():
@@ -286,70 +736,45 @@ class Component(ABC):
 
     def _discover_component_files(self) -> List[str]:
         """
-        Dynamically discover framework .md files in the Core directory
+        Select the component's source files with its FILE_SPEC
 
         Returns:
-            List of framework filenames (e.g., ['CLAUDE.md', 'COMMANDS.md', ...])
+            Paths relative to the source directory (e.g. ['CLAUDE.md', 'sub/FILE.md', ...])
         """
         source_dir = self._get_source_dir()
 
         if not source_dir:
             return []
 
-        return self._discover_files_in_directory(
-            source_dir,
-            extension='.md',
-            exclude_patterns=['README.md', 'CHANGELOG.md', 'LICENSE.md']
-        )
+        source_files = list_source_files(source_dir)
+        if source_files is None:
+            self.logger.warning(f"Source directory not found: {source_dir}")
+            return []
 
-    def _discover_files_in_directory(self, directory: Path, extension: str = '.md',
-                                   exclude_patterns: Optional[List[str]] = None) -> List[str]:
+        files = self.FILE_SPEC.select(source_files)
+        self.logger.debug(f"Discovered {len(files)} files in {source_dir}")
+        return files
+
+    def _prune_empty_directories(self, directory: Path) -> None:
         """
-        Shared utility for discovering files in a directory
+        Remove subdirectories of directory left empty by removing the component's files
 
         Args:
-            directory: Directory to scan
-            extension: File extension to look for (default: '.md')
-            exclude_patterns: List of filename patterns to exclude
-
-        Returns:
-            List of filenames found in the directory
+            directory: Directory the component files were installed into
         """
-        if exclude_patterns is None:
-            exclude_patterns = []
-
-        try:
-            if not directory.exists():
-                self.logger.warning(f"Source directory not found: {directory}")
-                return []
-
-            if not directory.is_dir():
-                self.logger.warning(f"Source path is not a directory: {directory}")
-                return []
-
-            # Discover files with the specified extension
-            files = []
-            for file_path in directory.iterdir():
-                if (file_path.is_file() and
-                    file_path.suffix.lower() == extension.lower() and
-                    file_path.name not in exclude_patterns):
-                    files.append(file_path.name)
-
-            # Sort for consistent ordering
-            files.sort()
-
-            self.logger.debug(f"Discovered {len(files)} {extension} files in {directory}")
-            if files:
-                self.logger.debug(f"Files found: {files}")
-
-            return files
-
-        except PermissionError:
-            self.logger.error(f"Permission denied accessing directory: {directory}")
-            return []
-        except Exception as e:
-            self.logger.error(f"Error discovering files in {directory}: {e}")
-            return []
+        parents = {Path(filename).parent for filename in self.component_files}
+        parents.discard(Path('.'))
+        candidates = set()
+        for parent in parents:
+            candidates.update(parent_dir for parent_dir in [parent, *parent.parents] if parent_dir != Path('.'))
+
+        # Deepest first, so a directory is empty once its subdirectories are gone
+        for relative in sorted(candidates, key=lambda path: len(path.parts), reverse=True):
+            try:
+                (directory / relative).rmdir()
+                self.logger.debug(f"Removed empty directory {relative}")
+            except OSError:
+                pass
     
     def __str__(self) -> str:
         """String representation of component"""
@@ -0,0 +1,170 @@
+"""
+Declarative file sets of components
+A component names its files with include/exclude globs relative to its source
+directory; the source tree is walked once and shared by every component
+"""
+
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from ..utils.source_manifest import get_source_manifest
+
+
+# Never part of a component's files
+_IGNORED_DIRECTORIES = {"__pycache__"}
+
+
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate a glob into a regular expression over '/'-separated relative paths
+
+    '*' and '?' don't cross directory boundaries, '**/' matches any number of
+    directories (including none) and '[...]' is a character class.
+    """
+    regex = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            regex.append("(?:[^/]+/)*")
+            i += 3
+        elif pattern.startswith("**", i):
+            regex.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            regex.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            regex.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2:]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            regex.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+        else:
+            regex.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(regex)
+
+
+def _compile_globs(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Compile globs into one case-insensitive alternation (None if there are none)"""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{_translate_glob(pattern)})" for pattern in patterns), re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class FileSpec:
+    """
+    Files of a component, relative to its source directory
+
+    Patterns are anchored at the source directory: "*.md" only matches files
+    directly inside it, "**/*.md" matches them at any depth. Matching is
+    case-insensitive.
+    """
+
+    include: Tuple[str, ...]
+    exclude: Tuple[str, ...] = ()
+    _include_regex: Optional[Pattern[str]] = field(init=False, repr=False, compare=False)
+    _exclude_regex: Optional[Pattern[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_include_regex", _compile_globs(self.include))
+        object.__setattr__(self, "_exclude_regex", _compile_globs(self.exclude))
+
+    def matches(self, relative_path: str) -> bool:
+        """Check whether a '/'-separated path relative to the source directory belongs to the set"""
+        if self._include_regex is None or not self._include_regex.fullmatch(relative_path):
+            return False
+        return self._exclude_regex is None or not self._exclude_regex.fullmatch(relative_path)
+
+    def select(self, relative_paths: List[str]) -> List[str]:
+        """
+        Filter paths relative to the source directory
+
+        Returns:
+            Matching paths, sorted
+        """
+        return sorted(path for path in relative_paths if self.matches(path))
+
+
+def _walk(root: Path) -> List[str]:
+    """List every file below root as a '/'-separated relative path, with one scandir per directory"""
+    files = []
+    pending = [(str(root), "")]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if entry.name not in _IGNORED_DIRECTORIES:
+                            pending.append((entry.path, f"{prefix}{entry.name}/"))
+                    elif entry.is_file():
+                        files.append(prefix + entry.name)
+        except OSError:
+            continue
+    return sorted(files)
+
+
+# Walked source roots -> their files, shared by all components of the process
+_source_trees: Dict[Path, List[str]] = {}
+_source_trees_lock = threading.Lock()
+
+
+def _get_source_tree(root: Path, package_dir: Path) -> List[str]:
+    """Files below root, from the shipped source manifest or a single walk"""
+    with _source_trees_lock:
+        if root not in _source_trees:
+            manifest = get_source_manifest() if root == package_dir else None
+            _source_trees[root] = sorted(manifest.files) if manifest is not None else _walk(root)
+        return _source_trees[root]
+
+
+def list_source_files(directory: Path) -> Optional[List[str]]:
+    """
+    List the files below a source directory
+
+    Directories inside the SuperClaude package are served from one walk of
+    the whole package (or its shipped manifest); other directories are
+    walked once on their own.
+
+    Args:
+        directory: Source directory
+
+    Returns:
+        '/'-separated paths relative to directory, sorted; None if it isn't a directory
+    """
+    from .. import PROJECT_ROOT
+
+    package_dir = PROJECT_ROOT / "SuperClaude"
+    try:
+        prefix = directory.relative_to(package_dir).as_posix() + "/"
+    except ValueError:
+        if not directory.is_dir():
+            return None
+        return _get_source_tree(directory, package_dir)
+
+    if prefix == "./":
+        return _get_source_tree(package_dir, package_dir)
+
+    listing = [
+        path[len(prefix):] for path in _get_source_tree(package_dir, package_dir)
+        if path.startswith(prefix)
+    ]
+    if not listing and not directory.is_dir():
+        return None
+    return listing
+
+
+def reset_source_trees() -> None:
+    """Forget walked source trees so the next listing walks them again"""
+    with _source_trees_lock:
+        _source_trees.clear()
@@ -4,10 +4,32 @@ Base installer logic for SuperClaude installation system fixed some issues
 
 from typing import List, Dict, Optional, Set, Tuple, Any
 from pathlib import Path
+import io
+import json
+import os
 import shutil
+import sys
+import tarfile
 import tempfile
+import threading
+import time
 from datetime import datetime
 from .component import Component
+from .plan import InstallPlan
+from .staging import StagingArea
+from .validation import ValidationEngine, ValidationResult
+from ..core.dependency_graph import DependencyGraph
+from ..utils.profiler import get_profiler
+from ..managers.content_store import LINK_MODE_COPY
+from ..managers.settings_manager import SettingsManager
+from ..utils.events import get_event_emitter
+from ..utils.journal import InstallJournal, record_operation, set_active_journal
+from ..utils.ui import line_atomic_output
+
+
+# Copy cost assumed until an install into the directory has been measured
+DEFAULT_PER_FILE_SECONDS = 0.001
+DEFAULT_BYTES_PER_SECOND = 100 * 1024 * 1024
 
 
 class Installer:
@@ -15,24 +37,35 @@ class Installer:
 
     def __init__(self,
                  install_dir: Optional[Path] = None,
-                 dry_run: bool = False):
+                 dry_run: bool = False,
+                 jobs: int = 1,
+                 staged: bool = False):
         """
         Initialize installer
         
         Args:
             install_dir: Target installation directory
             dry_run: If True, only simulate installation
+            jobs: Maximum components installed concurrently within a dependency level
+            staged: If True, install into a staging tree and publish it by atomic rename
         """
         from .. import DEFAULT_INSTALL_DIR
         self.install_dir = install_dir or DEFAULT_INSTALL_DIR
         self.dry_run = dry_run
+        self.jobs = max(1, jobs)
+        self.staged = staged
+        self._state_lock = threading.Lock()
         self.components: Dict[str, Component] = {}
+        self.dependency_graph = DependencyGraph()
         self.installed_components: Set[str] = set()
         self.updated_components: Set[str] = set()
 
         self.failed_components: Set[str] = set()
         self.skipped_components: Set[str] = set()
         self.backup_path: Optional[Path] = None
+        self.plan: Optional[InstallPlan] = None
+        self.journal = InstallJournal(self.install_dir)
+        self._resume_state: Optional[Dict[str, Any]] = None
 
     def register_component(self, component: Component) -> None:
         """
@@ -43,6 +76,7 @@ class Installer:
         """
         metadata = component.get_metadata()
         self.components[metadata['name']] = component
+        self.dependency_graph.set_dependencies(metadata['name'], component.get_dependencies())
 
     def register_components(self, components: List[Component]) -> None:
         """
@@ -67,34 +101,156 @@ class Installer:
         Raises:
             ValueError: If circular dependencies detected or unknown component
         """
-        resolved = []
-        resolving = set()
+        return self.dependency_graph.resolve(component_names)
 
-        def resolve(name: str):
-            if name in resolved:
-                return
+    def build_plan(self, component_names: List[str]) -> InstallPlan:
+        """
+        Build the install plan for the components and attach it to them
+        
+        Every later phase (size estimates, prerequisite and security checks,
+        change detection, backup, copying, validation) reads its file list
+        from this plan instead of rescanning the source tree.
+        
+        Args:
+            component_names: List of component names to install
+            
+        Returns:
+            The install plan, also kept in self.plan
+            
+        Raises:
+            ValueError: If circular dependencies detected or unknown component
+        """
+        ordered_names = self.resolve_dependencies(component_names)
 
-            if name in resolving:
-                raise ValueError(
-                    f"Circular dependency detected involving {name}")
+        with get_profiler().phase("plan"):
+            self.plan = InstallPlan.build(self.install_dir, ordered_names, self.components)
 
-            if name not in self.components:
-                raise ValueError(f"Unknown component: {name}")
+        for name in ordered_names:
+            self.components[name].plan = self.plan.components[name]
 
-            resolving.add(name)
+        get_event_emitter().emit("plan", components=list(self.plan.order),
+                                 files=self.plan.total_files, bytes=self.plan.total_size)
+        return self.plan
 
-            # Resolve dependencies first
-            for dep in self.components[name].get_dependencies():
-                resolve(dep)
+    def get_change_report(self) -> Dict[str, Any]:
+        """
+        Work out what installing the planned components would change, without writing
+        
+        Requires build_plan() to have been called.
+        
+        Returns:
+            Dict with per-component file changes (add/modify/delete), bytes to
+            write and changed metadata keys, totals, and an estimated wall time
+            from the throughput model measured by earlier installs
+        """
+        model = SettingsManager(self.install_dir).get_throughput_model()
+        per_file_seconds = model.get("per_file_seconds", DEFAULT_PER_FILE_SECONDS)
+        bytes_per_second = model.get("bytes_per_second", DEFAULT_BYTES_PER_SECOND)
 
-            resolving.remove(name)
-            resolved.append(name)
+        components = {}
+        totals = {"add": 0, "modify": 0, "delete": 0, "bytes": 0}
 
-        # Resolve each requested component
-        for name in component_names:
-            resolve(name)
+        for name in self.plan.order:
+            component = self.components[name]
+            changes = component.get_file_changes()
+            counts = {action: sum(1 for change in changes if change["action"] == action)
+                      for action in ("add", "modify", "delete")}
+            bytes_to_write = sum(change["bytes"] for change in changes if change["action"] != "delete")
+
+            components[name] = {
+                "files": changes,
+                **counts,
+                "bytes": bytes_to_write,
+                "metadata_keys": component.get_metadata_changes()
+            }
+            for action, count in counts.items():
+                totals[action] += count
+            totals["bytes"] += bytes_to_write
+
+        operations = totals["add"] + totals["modify"] + totals["delete"]
+        estimated_seconds = operations * per_file_seconds + totals["bytes"] / bytes_per_second
 
-        return resolved
+        return {
+            "install_dir": str(self.install_dir),
+            "components": components,
+            "totals": totals,
+            "estimated_seconds": round(estimated_seconds, 4),
+            "throughput_model": {
+                "per_file_seconds": per_file_seconds,
+                "bytes_per_second": bytes_per_second,
+                "measured": bool(model)
+            }
+        }
+
+    def _record_throughput(self) -> None:
+        """Fit the copy cost model (fixed cost per file plus bytes / bandwidth) to this run's copies"""
+        samples = [
+            sample
+            for component in self.components.values()
+            for sample in component.file_manager.copy_samples
+        ]
+        if len(samples) < 2:
+            return
+
+        count = len(samples)
+        mean_bytes = sum(size for size, _ in samples) / count
+        mean_seconds = sum(seconds for _, seconds in samples) / count
+        variance = sum((size - mean_bytes) ** 2 for size, _ in samples)
+        covariance = sum((size - mean_bytes) * (seconds - mean_seconds) for size, seconds in samples)
+
+        settings_manager = SettingsManager(self.install_dir)
+        previous = settings_manager.get_throughput_model()
+
+        if variance > 0 and covariance > 0:
+            slope = covariance / variance
+            per_file_seconds = max(mean_seconds - slope * mean_bytes, 0.0)
+            bytes_per_second = 1.0 / slope
+        else:
+            # Sizes too uniform to separate the two costs; attribute everything to the per-file cost
+            per_file_seconds = mean_seconds
+            bytes_per_second = previous.get("bytes_per_second", DEFAULT_BYTES_PER_SECOND)
+
+        # Smooth across runs so a single noisy install doesn't swing the estimate
+        if previous:
+            per_file_seconds = (per_file_seconds + previous["per_file_seconds"]) / 2
+            bytes_per_second = (bytes_per_second + previous["bytes_per_second"]) / 2
+
+        try:
+            settings_manager.set_throughput_model({
+                "per_file_seconds": per_file_seconds,
+                "bytes_per_second": bytes_per_second,
+                "samples": count + previous.get("samples", 0)
+            })
+        except ValueError as e:
+            print(f"Warning: Could not record copy throughput: {e}")
+
+    def _record_content_store(self, config: Dict[str, Any]) -> None:
+        """Remember the content store files were linked from, so uninstall can collect its garbage"""
+        try:
+            SettingsManager(self.install_dir).set_content_store({
+                "path": str(config["store"]),
+                "link_mode": config["link_mode"]
+            })
+        except ValueError as e:
+            print(f"Warning: Could not record content store: {e}")
+
+    def get_installation_levels(self, ordered_names: List[str]) -> List[List[str]]:
+        """
+        Group resolved components into dependency levels
+        
+        Mirrors ComponentRegistry.get_installation_order for the registered
+        components: no component in a level depends on another in the same level.
+        
+        Args:
+            ordered_names: Component names in dependency order (from resolve_dependencies)
+            
+        Returns:
+            List of levels, each keeping the dependency order of ordered_names
+            
+        Raises:
+            ValueError: If circular dependencies detected
+        """
+        return self.dependency_graph.get_levels(ordered_names)
 
     def validate_system_requirements(self) -> Tuple[bool, List[str]]:
         """
@@ -116,21 +272,53 @@ class Installer:
         except Exception as e:
             errors.append(f"Could not check disk space: {e}")
 
-        # Check write permissions
-        test_file = self.install_dir / ".write_test"
-        try:
-            self.install_dir.mkdir(parents=True, exist_ok=True)
-            test_file.touch()
-            test_file.unlink()
-        except Exception as e:
-            errors.append(f"No write permission to {self.install_dir}: {e}")
+        # Check write permissions (a dry run must not touch the disk)
+        if self.dry_run:
+            existing = self.install_dir
+            while not existing.exists() and existing != existing.parent:
+                existing = existing.parent
+            if not os.access(existing, os.W_OK):
+                errors.append(f"No write permission to {existing}")
+        else:
+            test_file = self.install_dir / ".write_test"
+            try:
+                self.install_dir.mkdir(parents=True, exist_ok=True)
+                test_file.touch()
+                test_file.unlink()
+            except Exception as e:
+                errors.append(f"No write permission to {self.install_dir}: {e}")
 
         return len(errors) == 0, errors
 
-    def create_backup(self) -> Optional[Path]:
+    def get_preimage_paths(self, component_names: List[str]) -> List[Path]:
+        """
+        Collect installed files that installing the components would overwrite or delete
+        
+        Args:
+            component_names: Component names in installation order
+            
+        Returns:
+            De-duplicated list of absolute paths, shared state files last
+        """
+        paths: List[Path] = []
+        for name in component_names:
+            paths.extend(self.components[name].get_preimage_paths())
+
+        for name in StagingArea.STATE_FILES + (StagingArea.SETTINGS_FILE,):
+            state_file = self.install_dir / name
+            if state_file.is_file():
+                paths.append(state_file)
+
+        return list(dict.fromkeys(paths))
+
+    def create_backup(self, paths: Optional[List[Path]] = None) -> Optional[Path]:
         """
         Create backup of existing installation
         
+        Args:
+            paths: If given, archive only these files (a pre-image backup)
+                   instead of the whole installation directory
+        
         Returns:
             Path to backup archive or None if no existing installation
         """
@@ -140,6 +328,9 @@ class Installer:
         if self.dry_run:
             return self.install_dir / "backup_dryrun.tar.gz"
 
+        if paths is not None:
+            return self._create_preimage_backup(paths)
+
         # Create backup directory
         backup_dir = self.install_dir / "backups"
         backup_dir.mkdir(exist_ok=True)
@@ -170,7 +361,7 @@ class Installer:
 
             # Create archive only if there are files to backup
             if any(temp_backup.iterdir()):
-                shutil.make_archive(backup_path.with_suffix(''), 'gztar',
+                shutil.make_archive(str(backup_dir / backup_name), 'gztar',
                                     temp_dir, backup_name)
             else:
                 # Create empty backup file to indicate backup was attempted
@@ -182,6 +373,55 @@ class Installer:
         self.backup_path = backup_path
         return backup_path
 
+    def _create_preimage_backup(self, paths: List[Path]) -> Optional[Path]:
+        """
+        Stream the given files straight into a backup archive
+        
+        The archive uses the layout of 'SuperClaude backup' (paths relative to
+        the install directory plus backup_metadata.json), so it can be
+        restored with 'SuperClaude backup --restore'.
+        
+        Args:
+            paths: Files in the installation directory to archive
+            
+        Returns:
+            Path to backup archive or None if there was nothing to archive
+        """
+        if not paths:
+            print("No installed files will be overwritten, skipping backup")
+            return None
+
+        backup_dir = self.install_dir / "backups"
+        backup_dir.mkdir(exist_ok=True)
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_path = backup_dir / f"superclaude_preimage_{timestamp}.tar.gz"
+
+        relative_paths = [path.relative_to(self.install_dir).as_posix() for path in paths]
+        metadata = json.dumps({
+            "backup_version": "3.0.0",
+            "backup_type": "pre-image",
+            "created": datetime.now().isoformat(),
+            "install_dir": str(self.install_dir),
+            "files": relative_paths
+        }, indent=2).encode("utf-8")
+
+        with tarfile.open(backup_path, "w:gz") as tar:
+            info = tarfile.TarInfo("backup_metadata.json")
+            info.size = len(metadata)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(metadata))
+
+            for path, arcname in zip(paths, relative_paths):
+                try:
+                    tar.add(path, arcname=arcname, recursive=False)
+                except OSError as e:
+                    # Log warning but continue backup process
+                    print(f"Warning: Could not backup {arcname}: {e}")
+
+        self.backup_path = backup_path
+        return backup_path
+
     def install_component(self, component_name: str,
                           config: Dict[str, Any]) -> bool:
         """
@@ -197,19 +437,35 @@ class Installer:
         if component_name not in self.components:
             raise ValueError(f"Unknown component: {component_name}")
 
-        component = self.components[component_name]
-
         # Skip if already installed
-        if component_name in self.installed_components:
-            return True
+        with self._state_lock:
+            if component_name in self.installed_components:
+                return True
+
+        emitter = get_event_emitter()
+        emitter.emit("component_start", component=component_name,
+                     install_dir=str(self.install_dir), dry_run=self.dry_run)
+        start_time = time.perf_counter()
+
+        success = self._install_component(component_name, config)
+
+        emitter.emit("component_end", component=component_name, success=success,
+                     duration_ms=round((time.perf_counter() - start_time) * 1000, 3))
+        return success
+
+    def _install_component(self, component_name: str,
+                           config: Dict[str, Any]) -> bool:
+        """Validate prerequisites and install a single registered component"""
+        component = self.components[component_name]
 
         # Check prerequisites
-        success, errors = component.validate_prerequisites()
+        with get_profiler().phase("validation"):
+            success, errors = component.check_prerequisites()
         if not success:
             print(f"Prerequisites failed for {component_name}:")
             for error in errors:
                 print(f"  - {error}")
-            self.failed_components.add(component_name)
+            self._mark_failed(component_name)
             return False
 
         # Perform installation
@@ -218,27 +474,39 @@ class Installer:
                 print(f"[DRY RUN] Would install {component_name}")
                 success = True
             else:
-                success = component.install(config)
+                with get_profiler().phase("install"):
+                    success = component.install(config)
 
             if success:
-                self.installed_components.add(component_name)
-                self.updated_components.add(component_name)
+                with self._state_lock:
+                    self.installed_components.add(component_name)
+                    self.updated_components.add(component_name)
+                record_operation("component_installed", component=component_name)
             else:
-                self.failed_components.add(component_name)
+                self._mark_failed(component_name)
 
             return success
 
         except Exception as e:
             print(f"Error installing {component_name}: {e}")
-            self.failed_components.add(component_name)
+            self._mark_failed(component_name)
             return False
 
+    def _mark_failed(self, component_name: str) -> None:
+        """Record a failed component (safe to call from worker threads)"""
+        with self._state_lock:
+            self.failed_components.add(component_name)
+
     def install_components(self,
                            component_names: List[str],
                            config: Optional[Dict[str, Any]] = None) -> bool:
         """
         Install multiple components in dependency order
         
+        Every file operation is recorded in the installation journal before it
+        is applied. If the run is interrupted the journal stays behind, and
+        the next run must resume (see prepare_resume) or roll it back.
+        
         Args:
             component_names: List of component names to install
             config: Installation configuration
@@ -247,54 +515,400 @@ class Installer:
             True if all successful, False if any failed
         """
         config = config or {}
+        resume = self._resume_state
 
-        # Resolve dependencies
+        if not self.dry_run and resume is None and self.journal.exists():
+            print(f"An interrupted installation was found in {self.install_dir}")
+            print("Run 'SuperClaude install --resume' to finish it or "
+                  "'SuperClaude install --rollback' to undo it")
+            return False
+
+        # Resolve dependencies and plan the run (unless already planned)
         try:
             ordered_names = self.resolve_dependencies(component_names)
+            if self.plan is None or list(self.plan.order) != ordered_names:
+                self.build_plan(component_names)
         except ValueError as e:
             print(f"Dependency resolution error: {e}")
             return False
 
+        # Once publishing has started the live tree is mid-swap; just finish publishing
+        publishing = bool(resume and resume["publishing"])
+
+        # Nothing to do when every component is already installed as it would be
+        # (switching to another link mode relinks unchanged files)
+        link_mode = config.get("link_mode", LINK_MODE_COPY)
+        relink = link_mode != LINK_MODE_COPY and \
+            SettingsManager(self.install_dir).get_content_store().get("link_mode") != link_mode
+        if not config.get("force") and not self.dry_run and not publishing and not relink:
+            with get_profiler().phase("change_detection"):
+                changed = [name for name in ordered_names if self.components[name].has_changes()]
+            if not changed:
+                print("All components are up to date, nothing to install")
+                self.skipped_components.update(ordered_names)
+                if resume:
+                    self.journal.remove()
+                return True
+
         # Validate system requirements
-        success, errors = self.validate_system_requirements()
+        with get_profiler().phase("validation"):
+            success, errors = self.validate_system_requirements()
         if not success:
             print("System requirements not met:")
             for error in errors:
                 print(f"  - {error}")
             return False
 
-        # Create backup if updating
-        if self.install_dir.exists() and not self.dry_run:
+        staging = None
+        if self.staged and not self.dry_run:
+            staging_root = resume["begin"].get("staging_root") if resume else None
+            staging = StagingArea(self.install_dir, Path(staging_root) if staging_root else None)
+
+        if resume:
+            # The interrupted run's backup holds the true pre-images; a new one
+            # would only capture the half-written tree
+            backup_path = resume["begin"].get("backup_path")
+            self.backup_path = Path(backup_path) if backup_path else None
+        # Create backup if updating: by default only the files this run will
+        # overwrite or delete, the whole directory only on request
+        elif self.install_dir.exists() and not self.dry_run and config.get("backup", True):
             print("Creating backup of existing installation...")
-            self.create_backup()
-
-        # Install each component
-        all_success = True
-        for name in ordered_names:
-            print(f"\nInstalling {name}...")
-            if not self.install_component(name, config):
-                all_success = False
-                # Continue installing other components even if one fails
+            with get_profiler().phase("backup"):
+                if config.get("full_backup"):
+                    self.create_backup()
+                else:
+                    self.create_backup(self.get_preimage_paths(ordered_names))
 
         if not self.dry_run:
-            self._run_post_install_validation()
+            self.journal.open()
+            if resume:
+                self.journal.record("resume", components=ordered_names)
+            else:
+                self.journal.record("begin", components=ordered_names, config=config,
+                                    staged=staging is not None, jobs=self.jobs,
+                                    staging_root=str(staging.root) if staging else None,
+                                    backup_path=str(self.backup_path) if self.backup_path else None)
+            set_active_journal(self.journal)
+
+        live_components = self.components
+        interrupted = True
+        try:
+            if staging is not None:
+                with get_profiler().phase("staging"):
+                    if not (resume and staging.staging_dir.is_dir()):
+                        staging.create()
+                    self.components = dict(live_components)
+                    for name in ordered_names:
+                        self.components[name] = staging.stage_component(live_components[name])
+
+            if resume:
+                completed = [name for name in ordered_names if name in resume["completed_components"]]
+                if completed:
+                    print(f"Resuming interrupted installation; already installed: {', '.join(completed)}")
+                with self._state_lock:
+                    self.installed_components.update(completed)
+                    self.updated_components.update(completed)
+
+            # Install each component
+            if publishing:
+                all_success = True
+            elif self.jobs > 1:
+                all_success = self._install_levels(ordered_names, config)
+            else:
+                all_success = True
+                for name in ordered_names:
+                    print(f"\nInstalling {name}...")
+                    if not self.install_component(name, config):
+                        all_success = False
+                        # Continue installing other components even if one fails
+
+            invalid = []
+            if not self.dry_run and not publishing:
+                with get_profiler().phase("post_install_validation"):
+                    results = self._run_post_install_validation()
+                invalid = [name for name, result in results.items() if not result.success]
+                if invalid:
+                    all_success = False
+                    with self._state_lock:
+                        self.failed_components.update(invalid)
+                        self.installed_components.difference_update(invalid)
+                        self.updated_components.difference_update(invalid)
+
+            published = True
+            if staging is not None:
+                with get_profiler().phase("publish"):
+                    if invalid:
+                        # The staged state files register every staged component,
+                        # so a staged tree is published completely or not at all
+                        print(f"Staged installation not published, {self.install_dir} is unchanged "
+                              f"(failed validation: {', '.join(invalid)})")
+                        with self._state_lock:
+                            self.failed_components.update(self.installed_components)
+                            self.installed_components.clear()
+                            self.updated_components.clear()
+                    else:
+                        if publishing:
+                            for operation in resume["operations"]:
+                                if operation["op"] == "publish" and not operation["done"]:
+                                    StagingArea.settle_publish(operation)
+                        published = self._publish_staged(staging)
+                        if not published:
+                            all_success = False
+            # The paths the interrupted attempt published stay live if resuming
+            # them failed, so keep the journal for --rollback
+            interrupted = publishing and not published
+        finally:
+            self.components = live_components
+            if not self.dry_run:
+                set_active_journal(None)
+                if interrupted:
+                    # Keep the journal (and staging tree) for --resume / --rollback
+                    self.journal.close()
+                    print(f"\nInstallation interrupted; run 'SuperClaude install --resume' to finish it "
+                          f"or 'SuperClaude install --rollback' to undo it")
+                else:
+                    if staging is not None:
+                        staging.discard()
+                    self.journal.remove()
+
+        if not self.dry_run and self.installed_components:
+            self._record_throughput()
+            if config.get("link_mode", LINK_MODE_COPY) != LINK_MODE_COPY:
+                self._record_content_store(config)
+
+        return all_success
+
+    def prepare_resume(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the journal of an interrupted run so install_components resumes it
+        
+        Components the run finished are not installed again, and files it
+        already copied are skipped by the manifest check; a staged run reuses
+        its staging tree. Run install_components with the components and
+        configuration from the returned "begin" record.
+        
+        Returns:
+            Journal state (see InstallJournal.get_state) or None if there is no interrupted run
+        """
+        self._resume_state = self.journal.get_state()
+        return self._resume_state
+
+    def rollback_interrupted(self) -> bool:
+        """
+        Undo the file operations of an interrupted run, newest first
+        
+        Staged runs only need the published paths swapped back and the live
+        settings.json restored (the live tree was untouched before publishing).
+        In-place runs delete the files they created and restore the ones they
+        overwrote from the run's pre-image backup. MCP registrations are undone
+        by the registered components.
+        
+        Returns:
+            True if everything was undone (the journal is then removed)
+        """
+        state = self.journal.get_state()
+        if state is None:
+            print(f"No interrupted installation found in {self.install_dir}")
+            return False
+
+        begin = state["begin"]
+        staged = begin.get("staged", False)
+        backup_path = Path(begin["backup_path"]) if begin.get("backup_path") else None
+
+        archive = None
+        if backup_path is not None and backup_path.is_file():
+            archive = tarfile.open(backup_path, "r:gz")
+        elif not staged:
+            print("Warning: The interrupted run has no backup; overwritten files cannot be restored")
+
+        failures = 0
+        try:
+            for operation in reversed(state["operations"]):
+                try:
+                    if not self._undo_operation(operation, staged, archive):
+                        failures += 1
+                except OSError as e:
+                    print(f"Warning: Could not undo {operation['op']} of "
+                          f"{operation.get('path') or operation.get('live')}: {e}")
+                    failures += 1
+        finally:
+            if archive is not None:
+                archive.close()
+
+        if failures:
+            print(f"{failures} operations could not be undone; the journal is kept so rollback can be retried")
+            return False
+
+        if staged and begin.get("staging_root"):
+            shutil.rmtree(begin["staging_root"], ignore_errors=True)
+        self.journal.remove()
+        return True
+
+    def _undo_operation(self, operation: Dict[str, Any], staged: bool,
+                        archive: Optional[tarfile.TarFile]) -> bool:
+        """Undo one journaled operation of an interrupted run"""
+        kind = operation["op"]
+
+        if kind == "mcp":
+            component = self.components.get(operation.get("component"))
+            if component is None or not component.rollback_operation(operation):
+                print(f"Warning: Could not undo MCP registration of {operation.get('server')}")
+                return False
+            return True
+
+        if kind == "publish":
+            StagingArea.undo_publish(operation)
+            return True
+
+        if kind == "retire":
+            StagingArea.undo_retire(operation)
+            return True
+
+        path = Path(operation["path"])
+
+        # Everything else of a staged run happened inside the staging tree,
+        # apart from merging settings.json into the live file when publishing
+        if staged and path != self.install_dir / StagingArea.SETTINGS_FILE:
+            return True
+
+        if kind == "mkdir":
+            # Remove what the run created, bottom-up, leaving directories that hold other files
+            for dirpath, _, _ in sorted(os.walk(path), key=lambda entry: len(entry[0]), reverse=True):
+                try:
+                    os.rmdir(dirpath)
+                except OSError:
+                    pass
+        elif operation.get("existed"):
+            self._restore_preimage(path, archive)
+        elif path.is_file() or path.is_symlink():
+            path.unlink()
+
+        return True
+
+    def _restore_preimage(self, path: Path, archive: Optional[tarfile.TarFile]) -> None:
+        """Put the pre-image of an overwritten or deleted file back from the backup"""
+        relative = path.relative_to(self.install_dir).as_posix()
+        if archive is None:
+            print(f"Warning: Could not restore {relative}: no backup")
+            return
+
+        try:
+            member = archive.getmember(relative)
+        except KeyError:
+            # The pre-image backup holds every file the run would change, so the
+            # file was rewritten with identical content (e.g. under --force)
+            return
+
+        source = archive.extractfile(member)
+        if source is None:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.restore")
+        with source, open(temp_path, 'wb') as target:
+            shutil.copyfileobj(source, target)
+        os.chmod(temp_path, member.mode)
+        os.utime(temp_path, (member.mtime, member.mtime))
+        os.replace(temp_path, path)
+
+    def _publish_staged(self, staging: StagingArea) -> bool:
+        """
+        Publish successfully installed components from the staging tree
+        
+        Args:
+            staging: Staging area the components were installed into
+            
+        Returns:
+            True if published, False if the live installation was left unchanged
+        """
+        installed = [self.components[name] for name in self.installed_components]
+        if not installed:
+            return True
+
+        try:
+            staging.publish(installed)
+        except OSError as e:
+            print(f"Could not publish staged installation to {self.install_dir}: {e}")
+            with self._state_lock:
+                self.failed_components.update(self.installed_components)
+                self.installed_components.clear()
+                self.updated_components.clear()
+            return False
+
+        return True
+
+    def _install_levels(self, ordered_names: List[str], config: Dict[str, Any]) -> bool:
+        """
+        Install components level by level, running each level on a thread pool
+        
+        Args:
+            ordered_names: Component names in dependency order
+            config: Installation configuration
+            
+        Returns:
+            True if all successful, False if any failed
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        try:
+            levels = self.get_installation_levels(ordered_names)
+        except ValueError as e:
+            print(f"Dependency resolution error: {e}")
+            return False
+
+        def install(name: str) -> bool:
+            try:
+                return self.install_component(name, config)
+            finally:
+                # Release this thread's unfinished output line
+                sys.stdout.flush()
+                sys.stderr.flush()
+
+        all_success = True
+        with line_atomic_output(), ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            for level in levels:
+                if len(level) == 1:
+                    print(f"\nInstalling {level[0]}...")
+                else:
+                    print(f"\nInstalling in parallel: {', '.join(level)}...")
+
+                # Continue with later levels even if a component fails, as the serial path does
+                results = list(executor.map(install, level))
+                if not all(results):
+                    all_success = False
 
         return all_success
 
-    def _run_post_install_validation(self) -> None:
-        """Run post-installation validation for all installed components"""
+    def _run_post_install_validation(self) -> Dict[str, ValidationResult]:
+        """
+        Validate all installed components against the install plan
+        
+        File checks of all components share one pool of self.jobs workers;
+        per-component results and timings are emitted as "validation" events.
+        
+        Returns:
+            Dict mapping each validated component name to its result
+        """
         print("\nRunning post-installation validation...")
 
-        all_valid = True
-        for name in self.installed_components:
-            component = self.components[name]
-            success, errors = component.validate_installation()
+        names = [name for name in self.plan.order if name in self.installed_components] \
+            if self.plan is not None else sorted(self.installed_components)
+        engine = ValidationEngine(self.jobs)
+        results = engine.validate([self.components[name] for name in names])
 
-            if success:
-                print(f"  ✓ {name}: Valid")
+        emitter = get_event_emitter()
+        all_valid = True
+        for name, result in results.items():
+            emitter.emit("validation", component=name, success=result.success,
+                         files=result.files_checked, files_hashed=result.files_hashed,
+                         errors=result.errors, duration_ms=round(result.duration * 1000, 3))
+
+            timing = f"{result.files_checked} files, {result.duration * 1000:.1f}ms"
+            if result.success:
+                print(f"  ✓ {name}: Valid ({timing})")
             else:
-                print(f"  ✗ {name}: Invalid")
-                for error in errors:
+                print(f"  ✗ {name}: Invalid ({timing})")
+                for error in result.errors:
                     print(f"    - {error}")
                 all_valid = False
 
@@ -302,6 +916,9 @@ class Installer:
             print("\nAll components validated successfully!")
         else:
             print("\nSome components failed validation. Check errors above.")
+
+        return results
+
     def update_components(self, component_names: List[str], config: Dict[str, Any]) -> bool:
         """Alias for update operation (uses install logic)"""
         return self.install_components(component_names, config)
@@ -320,12 +937,27 @@ class Installer:
             'skipped': list(self.skipped_components),
             'backup_path': str(self.backup_path) if self.backup_path else None,
             'install_dir': str(self.install_dir),
-            'dry_run': self.dry_run
+            'dry_run': self.dry_run,
+            'planned_files': self.plan.total_files if self.plan else 0,
+            'planned_bytes': self.plan.total_size if self.plan else 0
+        }
+
+    def get_files_copied(self) -> Dict[str, int]:
+        """
+        Get number of files copied per registered component
+
+        Returns:
+            Dict mapping component name to copied file count
+        """
+        return {
+            name: component.file_manager.get_operation_summary()['files_copied']
+            for name, component in self.components.items()
         }
 
     def get_update_summary(self) -> Dict[str, Any]:
         return {
             'updated': list(self.updated_components),
             'failed': list(self.failed_components),
+            'skipped': list(self.skipped_components),
             'backup_path': str(self.backup_path) if self.backup_path else None
         }
@@ -0,0 +1,155 @@
+"""
+Install plan: the file list, sizes and hashes of one installation run,
+computed once and shared by every phase
+"""
+
+import copy
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from .component import Component
+from ..managers.file_manager import FileManager
+from ..managers.settings_manager import SettingsManager
+from ..utils.source_manifest import SourceManifest, get_source_manifest
+
+
+@dataclass(frozen=True)
+class PlannedFile:
+    """One file to install"""
+
+    source: Path
+    relative_target: Path  # Relative to the installation directory
+    size: int
+    sha256: Optional[str]
+
+
+@dataclass(frozen=True)
+class ComponentPlan:
+    """Planned work for one component"""
+
+    name: str
+    version: str
+    files: Tuple[PlannedFile, ...]
+    missing_files: Tuple[str, ...]
+    directories: Tuple[Path, ...]  # Relative to the installation directory
+    metadata_mutations: Mapping[str, Any]
+    _by_target: Mapping[Path, PlannedFile] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_by_target", MappingProxyType(
+            {planned.relative_target: planned for planned in self.files}
+        ))
+
+    @property
+    def total_size(self) -> int:
+        """Bytes of all files to install"""
+        return sum(planned.size for planned in self.files)
+
+    def get_file(self, relative_target: Path) -> Optional[PlannedFile]:
+        """Find the planned file for a target path relative to the installation directory"""
+        return self._by_target.get(relative_target)
+
+
+@dataclass(frozen=True)
+class InstallPlan:
+    """Planned work for a whole installation run"""
+
+    install_dir: Path
+    order: Tuple[str, ...]
+    components: Mapping[str, ComponentPlan]
+
+    @property
+    def total_files(self) -> int:
+        """Number of files to install across all components"""
+        return sum(len(plan.files) for plan in self.components.values())
+
+    @property
+    def total_size(self) -> int:
+        """Bytes to install across all components"""
+        return sum(plan.total_size for plan in self.components.values())
+
+    @classmethod
+    def build(cls, install_dir: Path, ordered_names: List[str],
+              components: Dict[str, Component]) -> "InstallPlan":
+        """
+        Stat and hash every source file of the components once
+
+        Built packages take sizes and hashes from the source manifest shipped
+        with them and touch no source file. Otherwise hashes are taken from
+        the installed file manifest when a source's size and mtime still
+        match its entry, so repeated runs over unchanged sources read no
+        file contents.
+
+        Args:
+            install_dir: Live installation directory
+            ordered_names: Component names in installation order
+            components: Registered components by name
+
+        Returns:
+            Immutable install plan
+        """
+        manifest = SettingsManager(install_dir).load_manifest()
+        source_manifest = get_source_manifest()
+        file_manager = FileManager()
+
+        component_plans = {}
+        for name in ordered_names:
+            component = components[name]
+            component_plans[name] = cls._build_component_plan(
+                component, manifest.get(name, {}), source_manifest, file_manager
+            )
+
+        return cls(
+            install_dir=install_dir,
+            order=tuple(ordered_names),
+            components=MappingProxyType(component_plans)
+        )
+
+    @staticmethod
+    def _build_component_plan(component: Component, manifest: Dict[str, Dict[str, Any]],
+                              source_manifest: Optional[SourceManifest],
+                              file_manager: FileManager) -> ComponentPlan:
+        """Plan the files, directories and metadata changes of one component"""
+        metadata = component.get_metadata()
+        files = []
+        missing = []
+
+        for source, target in component.get_files_to_install():
+            relative_target = target.relative_to(component.install_dir)
+
+            shipped = source_manifest.get_entry(source) if source_manifest else None
+            if shipped is not None:
+                files.append(PlannedFile(source, relative_target, shipped["size"], shipped["sha256"]))
+                continue
+
+            try:
+                source_stat = source.stat()
+            except OSError:
+                missing.append(relative_target.as_posix())
+                continue
+
+            entry = manifest.get(relative_target.as_posix())
+            if entry and entry["size"] == source_stat.st_size and entry["mtime"] == source_stat.st_mtime_ns:
+                sha256 = entry["sha256"]
+            else:
+                sha256 = file_manager.get_file_hash(source)
+
+            files.append(PlannedFile(source, relative_target, source_stat.st_size, sha256))
+
+        directories = set(component.get_directories_to_create())
+        directories.update(planned.relative_target.parent for planned in files)
+        directories.discard(Path(''))
+
+        get_modifications = getattr(component, "get_metadata_modifications", None)
+        mutations = get_modifications() if get_modifications else {}
+
+        return ComponentPlan(
+            name=metadata['name'],
+            version=metadata['version'],
+            files=tuple(files),
+            missing_files=tuple(missing),
+            directories=tuple(sorted(directories)),
+            metadata_mutations=MappingProxyType(copy.deepcopy(mutations))
+        )
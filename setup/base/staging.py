@@ -0,0 +1,335 @@
+"""
+Staged installation: components install into a sibling staging tree that is
+published into the live installation directory by atomic renames
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .component import Component
+from ..managers.file_manager import FileManager
+from ..managers.settings_manager import SettingsManager
+from ..utils.journal import journaled
+
+
+class StagingArea:
+    """Sibling staging tree for one installation run"""
+
+    # Shared state files; seeded into the staging tree and published last
+    STATE_FILES = (".superclaude-metadata.json", ".superclaude-manifest.json")
+
+    # Claude's own settings file: seeded too, but the run's changes to it are merged
+    # into the live file when publishing, so edits made meanwhile are kept
+    SETTINGS_FILE = "settings.json"
+
+    def __init__(self, install_dir: Path, root: Optional[Path] = None):
+        """
+        Initialize staging area
+
+        Args:
+            install_dir: Live installation directory
+            root: Existing staging root to reuse (when resuming an interrupted run)
+        """
+        self.install_dir = install_dir
+        # Same parent (and so filesystem) as the live dir, so renames never copy data;
+        # hidden even when the live dir is not (".claude" -> ".claude.staging-<pid>")
+        self.root = root or install_dir.parent / f".{install_dir.name.lstrip('.')}.staging-{os.getpid()}"
+        self.staging_dir = self.root / install_dir.name
+        self.retired_dir = self.root / "retired"
+        self.settings_seed = self.root / f"{self.SETTINGS_FILE}.seed"
+        self.file_manager = FileManager()
+
+    def create(self) -> Path:
+        """
+        Create an empty staging tree seeded with the live state files
+
+        Returns:
+            Path of the staging installation directory
+        """
+        self.discard()
+        self.staging_dir.mkdir(parents=True)
+
+        for name in self.STATE_FILES:
+            live_file = self.install_dir / name
+            if live_file.is_file():
+                shutil.copy2(live_file, self.staging_dir / name)
+
+        live_settings = self.install_dir / self.SETTINGS_FILE
+        if live_settings.is_file():
+            shutil.copy2(live_settings, self.settings_seed)
+            shutil.copy2(live_settings, self.staging_dir / self.SETTINGS_FILE)
+
+        return self.staging_dir
+
+    def stage_component(self, component: Component) -> Component:
+        """
+        Create a copy of component that installs into the staging tree
+
+        Args:
+            component: Component targeting the live installation directory
+
+        Returns:
+            New component instance targeting the staging directory
+        """
+        staged = component.__class__(self.staging_dir)
+        staged.live_install_dir = self.install_dir
+        # Share the file manager so copy statistics survive the swap back
+        staged.file_manager = component.file_manager
+        staged.plan = component.plan
+        return staged
+
+    def publish(self, components: List[Component]) -> None:
+        """
+        Move the managed paths of components, then the state files, into the live directory
+
+        Managed directories are swapped as a whole after files that exist only
+        in the live copy have been linked into the staged copy, so nothing the
+        components don't ship is lost. Live files the components delete are
+        moved aside, so they can be put back. Changes the components made to
+        settings.json are applied to the live file rather than replacing it.
+        Anything else the components produced (e.g. empty directories,
+        settings backups) is merged in afterwards.
+
+        Args:
+            components: Successfully installed (staged) components
+
+        Raises:
+            OSError: If publishing failed; already published paths are rolled back
+        """
+        published: List[Tuple[Path, Optional[Path]]] = []
+        done: Set[Path] = set()
+
+        try:
+            for component in components:
+                for relative in component.get_managed_paths():
+                    self._publish_path(Path(relative), published)
+                    done.add(Path(relative))
+
+            for component in components:
+                for path in component.get_paths_to_delete():
+                    self._retire_path(path.relative_to(self.install_dir), published)
+
+            for name in self.STATE_FILES:
+                self._publish_path(Path(name), published)
+                done.add(Path(name))
+        except OSError:
+            self._rollback(published)
+            raise
+
+        self._publish_settings()
+        done.add(Path(self.SETTINGS_FILE))
+        self._merge_remaining(done)
+
+    def discard(self) -> None:
+        """Remove the staging tree and everything retired during publishing"""
+        if self.root.exists():
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    def _publish_path(self, relative: Path, published: List[Tuple[Path, Optional[Path]]]) -> None:
+        """Publish one staged path, recording how to undo it"""
+        staged = self.staging_dir / relative
+        live = self.install_dir / relative
+        retired = self.retired_dir / relative
+
+        if not staged.exists():
+            return
+
+        live.parent.mkdir(parents=True, exist_ok=True)
+
+        # The staged inode tells an interrupted run's rollback whether the swap happened
+        with journaled("publish", live=str(live), staged=str(staged), retired=str(retired),
+                       replaced=live.exists(), staged_ino=os.lstat(staged).st_ino):
+            if staged.is_dir() and live.is_dir():
+                self._carry_over(live, staged)
+                self.file_manager.replace_directory(staged, live, retired)
+                published.append((live, retired))
+            elif staged.is_dir():
+                os.rename(staged, live)
+                published.append((live, None))
+            else:
+                if live.is_file():
+                    # Keep the previous version reachable for rollback (an
+                    # interrupted earlier attempt may have done so already)
+                    if not retired.exists():
+                        self.file_manager.link_or_copy(live, retired)
+                    os.replace(staged, live)
+                    published.append((live, retired))
+                else:
+                    os.replace(staged, live)
+                    published.append((live, None))
+
+    def _retire_path(self, relative: Path, published: List[Tuple[Path, Optional[Path]]]) -> None:
+        """Move a live file the components delete out of the way, recording how to undo it"""
+        live = self.install_dir / relative
+        retired = self.retired_dir / relative
+
+        if not live.is_file():
+            return
+
+        retired.parent.mkdir(parents=True, exist_ok=True)
+        with journaled("retire", live=str(live), retired=str(retired)):
+            os.rename(live, retired)
+        published.append((live, retired))
+
+    def _publish_settings(self) -> None:
+        """Apply the top-level settings.json keys the run added, changed or removed to the live file"""
+        staged_file = self.staging_dir / self.SETTINGS_FILE
+        if not staged_file.is_file():
+            return
+
+        try:
+            staged = json.loads(staged_file.read_text(encoding="utf-8"))
+            seed = json.loads(self.settings_seed.read_text(encoding="utf-8")) if self.settings_seed.is_file() else {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read staged settings: {e}")
+            return
+
+        removed = [key for key in seed if key not in staged]
+        changed = {key: value for key, value in staged.items() if seed.get(key) != value}
+        if not removed and not changed:
+            return
+
+        # The live file is read only now, so the merge starts from its latest content
+        settings_manager = SettingsManager(self.install_dir)
+        try:
+            settings_manager.replace_settings_keys(changed, removed)
+        except ValueError as e:
+            print(f"Warning: Could not update {settings_manager.settings_file}: {e}")
+
+    def _carry_over(self, live_dir: Path, staged_dir: Path) -> None:
+        """Link files that exist only in the live directory into the staged one"""
+        for dirpath, _, filenames in os.walk(live_dir):
+            relative_dir = Path(dirpath).relative_to(live_dir)
+            for filename in filenames:
+                target = staged_dir / relative_dir / filename
+                if not target.exists():
+                    self.file_manager.link_or_copy(Path(dirpath) / filename, target)
+
+    def _rollback(self, published: List[Tuple[Path, Optional[Path]]]) -> None:
+        """Restore the live paths replaced so far, newest first"""
+        for live, retired in reversed(published):
+            try:
+                if live.is_dir():
+                    shutil.rmtree(live)
+                elif live.exists():
+                    live.unlink()
+                if retired is not None:
+                    os.rename(retired, live)
+            except OSError as e:
+                print(f"Warning: Could not restore {live}: {e}")
+
+    def _merge_remaining(self, done: Set[Path]) -> None:
+        """Move staged paths outside the published ones into the live directory if missing there"""
+        for dirpath, dirnames, filenames in os.walk(self.staging_dir):
+            relative_dir = Path(dirpath).relative_to(self.staging_dir)
+            dirnames[:] = [name for name in dirnames if relative_dir / name not in done]
+
+            for name in dirnames:
+                (self.install_dir / relative_dir / name).mkdir(parents=True, exist_ok=True)
+
+            for name in filenames:
+                relative = relative_dir / name
+                live = self.install_dir / relative
+                if relative not in done and not live.exists():
+                    staged = Path(dirpath) / name
+                    try:
+                        with journaled("publish", live=str(live), staged=str(staged), retired=None,
+                                       replaced=False, staged_ino=os.lstat(staged).st_ino):
+                            os.rename(staged, live)
+                    except OSError as e:
+                        print(f"Warning: Could not publish {relative}: {e}")
+
+    @staticmethod
+    def settle_publish(operation: Dict[str, Any]) -> None:
+        """
+        Finish a publish step an interrupted run left between its two renames
+
+        After a directory exchange the previous version sits at the staged
+        path; it is moved to the retired path so publishing again does not
+        swap it back in.
+
+        Args:
+            operation: Unfinished "publish" journal record
+        """
+        live = Path(operation["live"])
+        staged = Path(operation["staged"])
+
+        try:
+            swapped = os.lstat(live).st_ino == operation["staged_ino"]
+        except FileNotFoundError:
+            return
+
+        if not swapped or not staged.exists():
+            return
+
+        retired = Path(operation["retired"]) if operation.get("retired") else None
+        if retired is not None and not retired.exists():
+            retired.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(staged, retired)
+        elif staged.is_dir():
+            shutil.rmtree(staged)
+        else:
+            staged.unlink()
+
+    @staticmethod
+    def undo_publish(operation: Dict[str, Any]) -> None:
+        """
+        Undo one journaled publish step of an interrupted run
+
+        The live path is only touched if it holds the staged inode (the swap
+        happened) or went missing between the two renames of a non-atomic
+        directory swap; the previous version is taken from the retired path,
+        or from the staged path where an exchange left it.
+
+        Args:
+            operation: "publish" journal record
+
+        Raises:
+            OSError: If the previous version could not be put back
+        """
+        live = Path(operation["live"])
+        staged = Path(operation["staged"])
+        retired = Path(operation["retired"]) if operation.get("retired") else None
+
+        try:
+            swapped = os.lstat(live).st_ino == operation["staged_ino"]
+        except FileNotFoundError:
+            swapped = None
+
+        if swapped is False:
+            return
+
+        if swapped:
+            if live.is_dir() and not live.is_symlink():
+                shutil.rmtree(live)
+            else:
+                live.unlink()
+
+        if not operation.get("replaced"):
+            return
+
+        if retired is not None and retired.exists():
+            os.rename(retired, live)
+        elif staged.exists():
+            os.rename(staged, live)
+
+    @staticmethod
+    def undo_retire(operation: Dict[str, Any]) -> None:
+        """
+        Put back a live file an interrupted run moved aside when publishing
+
+        Args:
+            operation: "retire" journal record
+
+        Raises:
+            OSError: If the file could not be put back
+        """
+        live = Path(operation["live"])
+        retired = Path(operation["retired"])
+
+        if retired.exists() and not os.path.lexists(live):
+            live.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(retired, live)
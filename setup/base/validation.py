@@ -0,0 +1,144 @@
+"""
+Post-install validation: installed files are checked against the hashes of
+the install plan on a worker pool
+"""
+
+import stat
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .component import Component
+from .plan import PlannedFile
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating one component"""
+
+    component: str
+    errors: List[str] = field(default_factory=list)
+    files_checked: int = 0
+    files_hashed: int = 0
+    duration: float = 0.0  # Seconds of work spent on the component across workers
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+
+class ValidationEngine:
+    """Validates installed components, spreading file checks over a thread pool"""
+
+    def __init__(self, jobs: int = 1):
+        """
+        Initialize validation engine
+
+        Args:
+            jobs: Maximum file and registration checks run concurrently
+        """
+        self.jobs = max(1, jobs)
+
+    def validate(self, components: List[Component]) -> Dict[str, ValidationResult]:
+        """
+        Validate installed components
+
+        Every planned file is stat'ed; its content hash is taken from the
+        component's manifest entry when size and mtime still match (copies
+        record one as they are made) and only read from disk otherwise. The
+        component's own registration checks run on the same pool.
+
+        Args:
+            components: Installed components (with their plans attached)
+
+        Returns:
+            Validation results by component name, in the order given
+        """
+        results: Dict[str, ValidationResult] = {}
+        tasks: List[Tuple[str, Callable[..., Tuple[List[str], int]], tuple]] = []
+
+        for component in components:
+            name = component.get_metadata()['name']
+            manifest = component.settings_manager.get_component_manifest(name)
+            planned_files = self._get_planned_files(component)
+            results[name] = ValidationResult(name, files_checked=len(planned_files))
+
+            tasks.append((name, self._check_registration, (component,)))
+            for planned in planned_files:
+                tasks.append((name, self._check_file, (component, planned, manifest)))
+
+        def run(task):
+            name, check, args = task
+            start_time = time.perf_counter()
+            errors, hashed = check(*args)
+            return name, errors, hashed, time.perf_counter() - start_time
+
+        if self.jobs > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                outcomes = list(executor.map(run, tasks))
+        else:
+            outcomes = [run(task) for task in tasks]
+
+        # Registration errors come first for each component, then files in plan order
+        for name, errors, hashed, duration in outcomes:
+            result = results[name]
+            result.errors.extend(errors)
+            result.files_hashed += hashed
+            result.duration += duration
+
+        return results
+
+    def _get_planned_files(self, component: Component) -> List[PlannedFile]:
+        """Files the component should have installed (without hashes if it has no plan)"""
+        if component.plan is not None:
+            return list(component.plan.files)
+
+        return [
+            PlannedFile(source, target.relative_to(component.install_dir), -1, None)
+            for source, target in component.get_files_to_install()
+        ]
+
+    def _check_registration(self, component: Component) -> Tuple[List[str], int]:
+        """Run the component's own (non-file) checks"""
+        try:
+            return component.validate_registration(), 0
+        except Exception as e:
+            return [f"Could not validate registration: {e}"], 0
+
+    def _check_file(self, component: Component, planned: PlannedFile,
+                    manifest: Dict[str, Dict[str, Any]]) -> Tuple[List[str], int]:
+        """
+        Check one installed file against its planned size and hash
+
+        Returns:
+            Tuple of (errors, number of files whose content had to be hashed)
+        """
+        relative = planned.relative_target.as_posix()
+        target = component.install_dir / planned.relative_target
+
+        try:
+            target_stat = target.stat()
+        except OSError:
+            return [f"Missing file: {relative}"], 0
+
+        if not stat.S_ISREG(target_stat.st_mode):
+            return [f"Not a regular file: {relative}"], 0
+
+        if planned.sha256 is None:
+            return [], 0
+
+        if target_stat.st_size != planned.size:
+            return [f"Size mismatch: {relative} ({target_stat.st_size} bytes, expected {planned.size})"], 0
+
+        entry = manifest.get(relative)
+        if entry and entry["size"] == target_stat.st_size and entry["mtime"] == target_stat.st_mtime_ns:
+            sha256: Optional[str] = entry["sha256"]
+            hashed = 0
+        else:
+            sha256 = component.file_manager.get_file_hash(target)
+            hashed = 1
+
+        if sha256 != planned.sha256:
+            return [f"Content mismatch: {relative}"], hashed
+        return [], hashed
@@ -1,15 +1,27 @@
 """Component implementations for SuperClaude installation system"""
 
-from .core import CoreComponent
-from .commands import CommandsComponent
-from .mcp import MCPComponent
-from .hooks import HooksComponent
-from .agents import AgentsComponent
+import importlib
+
+# Component classes are imported on first access, so loading one component
+# module doesn't import all of them
+_COMPONENT_MODULES = {
+    'CoreComponent': '.core',
+    'CommandsComponent': '.commands',
+    'MCPComponent': '.mcp',
+    'HooksComponent': '.hooks',
+    'AgentsComponent': '.agents'
+}
 
 __all__ = [
     'CoreComponent',
-    'CommandsComponent', 
+    'CommandsComponent',
     'MCPComponent',
     'HooksComponent',
     'AgentsComponent'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _COMPONENT_MODULES:
+        return getattr(importlib.import_module(_COMPONENT_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,7 +4,7 @@ Agents component for SuperClaude agent installations
 
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
 
 try:
     import yaml
@@ -14,24 +14,25 @@ except ImportError:
 import re
 
 from ..base.component import Component
+from ..base.file_spec import FileSpec
 
 
 class AgentsComponent(Component):
     """SuperClaude agents component for AI assistant configurations"""
 
+    METADATA = {
+        "name": "agents",
+        "version": "1.0.0",
+        "description": "Claude Code agent collection for specialized AI behaviors",
+        "category": "extensions",
+    }
+    # Agents are organized in category subdirectories
+    FILE_SPEC = FileSpec(include=("**/*.md",), exclude=("**/README.md",))
+
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize agents component"""
         super().__init__(install_dir, Path("agents"))
 
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "agents",
-            "version": "1.0.0",
-            "description": "Claude Code agent collection for specialized AI behaviors",
-            "category": "extensions",
-        }
-
     def get_metadata_modifications(self) -> Dict[str, Any]:
         """Get metadata modifications for agents component"""
         return {
@@ -60,34 +61,24 @@ class AgentsComponent(Component):
             self.logger.error(f"Could not create agents directory: {agents_dir}")
             return False
 
-        # Install agent files
-        source_dir = self._get_source_dir()
-        installed_count = 0
+        # Install agent files, preserving the category directories; sources
+        # with invalid frontmatter are left out of the files to install
+        files_to_install = self.get_files_to_install()
+        installable = {target for _, target in files_to_install}
         failed_count = 0
 
         for filename in self.component_files:
-            source_file = source_dir / filename
-            # Preserve directory structure instead of flattening
-            target_file = agents_dir / filename
+            if agents_dir / filename not in installable:
+                failed_count += 1
+                self.logger.error(f"Invalid agent file format: {filename}")
 
-            # Create subdirectories if needed
-            target_file.parent.mkdir(parents=True, exist_ok=True)
+        # Copy the valid agents in one batch
+        failures = self._install_files(files_to_install)
+        for target_file, error in failures.items():
+            self.logger.error(f"Failed to install agent {target_file.relative_to(agents_dir).as_posix()}: {error}")
 
-            try:
-                # Validate agent frontmatter before copying
-                if self._validate_agent_file(source_file):
-                    if self.file_manager.copy_file(source_file, target_file):
-                        installed_count += 1
-                        self.logger.debug(f"Installed agent: {filename}")
-                    else:
-                        failed_count += 1
-                        self.logger.error(f"Failed to install agent: {filename}")
-                else:
-                    failed_count += 1
-                    self.logger.error(f"Invalid agent file format: {filename}")
-            except Exception as e:
-                failed_count += 1
-                self.logger.error(f"Error installing agent {filename}: {e}")
+        failed_count += len(failures)
+        installed_count = len(files_to_install) - len(failures)
 
         if failed_count > 0:
             self.logger.warning(
@@ -149,7 +140,8 @@ class AgentsComponent(Component):
                 else:
                     self.logger.warning(f"Could not remove {filename}")
 
-            # Remove agents directory if empty
+            # Remove category directories the agents left empty, then the agents directory
+            self._prune_empty_directories(agents_dir)
             try:
                 if agents_dir.exists():
                     remaining_files = list(agents_dir.glob("*"))
@@ -181,10 +173,6 @@ class AgentsComponent(Component):
             self.logger.exception(f"Unexpected error during agents uninstallation: {e}")
             return False
 
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return []  # Agents can be installed independently
-
     def update(self, config: Dict[str, Any]) -> bool:
         """Update agents component"""
         try:
@@ -249,31 +237,21 @@ class AgentsComponent(Component):
             self.logger.exception(f"Unexpected error during agents update: {e}")
             return False
 
-    def validate_installation(self) -> Tuple[bool, List[str]]:
-        """Validate agents component installation"""
+    def validate_registration(self) -> List[str]:
+        """
+        Validate agents component metadata
+
+        Agent files are checked by the validation engine: an installed file
+        whose hash matches the plan is a copy of a source whose frontmatter was
+        validated before copying, so it is not parsed again here.
+        """
         errors = []
 
         # Check if agents directory exists
         agents_dir = self.install_dir / "agents"
         if not agents_dir.exists():
             errors.append("Agents directory not found")
-            return False, errors
-
-        # Check if all agent files exist and are valid
-        valid_agents = 0
-        for filename in self.component_files:
-            # Use full path including subdirectories
-            file_path = agents_dir / filename
-            if not file_path.exists():
-                errors.append(f"Missing agent file: {filename}")
-            elif not file_path.is_file():
-                errors.append(f"Agent file is not a regular file: {filename}")
-            else:
-                # Validate agent file format
-                if self._validate_agent_file(file_path):
-                    valid_agents += 1
-                else:
-                    errors.append(f"Invalid agent file format: {filename}")
+            return errors
 
         # Check metadata registration
         if not self.settings_manager.is_component_installed("agents"):
@@ -287,11 +265,7 @@ class AgentsComponent(Component):
                     f"Version mismatch: installed {installed_version}, expected {expected_version}"
                 )
 
-        # Log summary
-        if valid_agents > 0:
-            self.logger.info(f"Found {valid_agents} valid agents installed")
-
-        return len(errors) == 0, errors
+        return errors
 
     def _get_source_dir(self) -> Path:
         """Get source directory for agent files"""
@@ -300,26 +274,9 @@ class AgentsComponent(Component):
         project_root = Path(__file__).parent.parent.parent
         return project_root / "SuperClaude" / "Agents"
 
-    def _discover_component_files(self) -> List[str]:
-        """Discover all agent files in subdirectories"""
-        source_dir = self._get_source_dir()
-        if not source_dir.exists():
-            self.logger.warning(f"Agents source directory not found: {source_dir}")
-            return []
-
-        # Find all .md files in subdirectories of the agents directory
-        agent_files = []
-        for file_path in source_dir.rglob("*.md"):  # Use rglob for recursive search
-            if file_path.is_file():
-                # Skip README.md files
-                if file_path.name.lower() == "readme.md":
-                    continue
-                # Store relative path from source_dir
-                relative_path = file_path.relative_to(source_dir)
-                agent_files.append(str(relative_path))
-
-        self.logger.debug(f"Discovered {len(agent_files)} agent files")
-        return sorted(agent_files)
+    def _is_installable(self, source: Path) -> bool:
+        """Only agents with valid frontmatter are installed"""
+        return self._validate_agent_file(source)
 
     def _validate_agent_file(self, file_path: Path) -> bool:
         """Validate agent file has proper frontmatter"""
@@ -465,7 +422,8 @@ class AgentsComponent(Component):
         agent_names = []
 
         if agents_dir.exists():
-            for file_path in agents_dir.rglob("*.md"):  # Use rglob for recursive search
+            for filename in self.component_files:
+                file_path = agents_dir / filename
                 try:
                     content = file_path.read_text(encoding="utf-8")
                     match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
@@ -504,9 +462,8 @@ class AgentsComponent(Component):
         agents_info = []
 
         if agents_dir.exists():
-            for file_path in sorted(
-                agents_dir.rglob("*.md")
-            ):  # Use rglob for recursive search
+            for filename in self.component_files:
+                file_path = agents_dir / filename
                 try:
                     content = file_path.read_text(encoding="utf-8")
                     match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
@@ -577,13 +534,7 @@ class AgentsComponent(Component):
 
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = super().get_size_estimate()
 
         # Add overhead for directory and settings
         total_size += 2048  # ~2KB overhead
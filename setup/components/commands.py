@@ -2,27 +2,32 @@
 Commands component for SuperClaude slash command definitions
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Optional, Any
 from pathlib import Path
 
 from ..base.component import Component
+from ..base.file_spec import FileSpec
 
 class CommandsComponent(Component):
     """SuperClaude slash commands component"""
     
+    METADATA = {
+        "name": "commands",
+        "version": "3.0.0",
+        "description": "SuperClaude slash command definitions",
+        "category": "commands"
+    }
+    DEPENDENCIES = ("core",)
+    # Commands may be organized in subdirectories; they keep them under commands/sc/
+    FILE_SPEC = FileSpec(
+        include=("**/*.md",),
+        exclude=("**/README.md", "**/CHANGELOG.md", "**/LICENSE.md")
+    )
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize commands component"""
         super().__init__(install_dir, Path("commands/sc"))
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "commands",
-            "version": "3.0.0",
-            "description": "SuperClaude slash command definitions",
-            "category": "commands"
-        }
-    
     def get_metadata_modifications(self) -> Dict[str, Any]:
         """Get metadata modifications for commands component"""
         return {
@@ -105,6 +110,7 @@ class CommandsComponent(Component):
             removed_count += old_removed_count
             
             # Remove sc subdirectory if empty
+            self._prune_empty_directories(commands_dir)
             try:
                 if commands_dir.exists():
                     remaining_files = list(commands_dir.iterdir())
@@ -142,10 +148,6 @@ class CommandsComponent(Component):
             self.logger.exception(f"Unexpected error during commands uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update commands component"""
         try:
@@ -203,23 +205,15 @@ class CommandsComponent(Component):
             self.logger.exception(f"Unexpected error during commands update: {e}")
             return False
     
-    def validate_installation(self) -> Tuple[bool, List[str]]:
-        """Validate commands component installation"""
+    def validate_registration(self) -> List[str]:
+        """Validate commands component metadata (command files are checked by the validation engine)"""
         errors = []
         
         # Check if sc commands directory exists
         commands_dir = self.install_dir / "commands" / "sc"
         if not commands_dir.exists():
             errors.append("SC commands directory not found")
-            return False, errors
-        
-        # Check if all command files exist
-        for filename in self.component_files:
-            file_path = commands_dir / filename
-            if not file_path.exists():
-                errors.append(f"Missing command file: {filename}")
-            elif not file_path.is_file():
-                errors.append(f"Command file is not a regular file: {filename}")
+            return errors
         
         # Check metadata registration
         if not self.settings_manager.is_component_installed("commands"):
@@ -231,7 +225,7 @@ class CommandsComponent(Component):
             if installed_version != expected_version:
                 errors.append(f"Version mismatch: installed {installed_version}, expected {expected_version}")
         
-        return len(errors) == 0, errors
+        return errors
     
     def _get_source_dir(self) -> Path:
         """Get source directory for command files"""
@@ -242,13 +236,7 @@ class CommandsComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-        
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = super().get_size_estimate()
         
         # Add overhead for directory and settings
         total_size += 5120  # ~5KB overhead
@@ -267,8 +255,22 @@ class CommandsComponent(Component):
             "dependencies": self.get_dependencies()
         }
     
+    def get_paths_to_delete(self) -> List[Path]:
+        """Return legacy commands the sc/ migration removes"""
+        old_commands_dir = self.live_install_dir / "commands"
+        return [
+            old_commands_dir / filename
+            for filename in self.component_files
+            if (old_commands_dir / filename).is_file()
+        ]
+    
     def _migrate_existing_commands(self) -> None:
         """Migrate existing commands from old location to new sc subdirectory"""
+        # A staged run must not touch the live tree; publishing it removes the
+        # legacy commands (see get_paths_to_delete)
+        if self.install_dir != self.live_install_dir:
+            return
+
         try:
             old_commands_dir = self.install_dir / "commands"
             new_commands_dir = self.install_dir / "commands" / "sc"
@@ -2,7 +2,7 @@
 Core component for SuperClaude framework files installation
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Optional, Any
 from pathlib import Path
 import shutil
 
@@ -11,19 +11,17 @@ from ..base.component import Component
 class CoreComponent(Component):
     """Core SuperClaude framework files component"""
     
+    METADATA = {
+        "name": "core",
+        "version": "3.0.0",
+        "description": "SuperClaude framework documentation and core files",
+        "category": "core"
+    }
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize core component"""
         super().__init__(install_dir)
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "core",
-            "version": "3.0.0",
-            "description": "SuperClaude framework documentation and core files",
-            "category": "core"
-        }
-    
     def get_metadata_modifications(self) -> Dict[str, Any]:
         """Get metadata modifications for SuperClaude"""
         return {
@@ -72,8 +70,7 @@ class CoreComponent(Component):
             return False
 
         # Create additional directories for other components
-        additional_dirs = ["commands", "hooks", "backups", "logs"]
-        for dirname in additional_dirs:
+        for dirname in self.get_directories_to_create():
             dir_path = self.install_dir / dirname
             if not self.file_manager.ensure_directory(dir_path):
                 self.logger.warning(f"Could not create directory: {dir_path}")
@@ -81,6 +78,10 @@ class CoreComponent(Component):
         return True
 
     
+    def get_directories_to_create(self) -> List[Path]:
+        """Core files live in the install dir itself; it also creates directories for other components"""
+        return [Path(dirname) for dirname in ("commands", "hooks", "backups", "logs")]
+
     def uninstall(self) -> bool:
         """Uninstall core component"""
         try:
@@ -118,10 +119,6 @@ class CoreComponent(Component):
             self.logger.exception(f"Unexpected error during core uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get component dependencies (core has none)"""
-        return []
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update core component"""
         try:
@@ -176,18 +173,10 @@ class CoreComponent(Component):
             self.logger.exception(f"Unexpected error during core update: {e}")
             return False
     
-    def validate_installation(self) -> Tuple[bool, List[str]]:
-        """Validate core component installation"""
+    def validate_registration(self) -> List[str]:
+        """Validate core component metadata (framework files are checked by the validation engine)"""
         errors = []
         
-        # Check if all framework files exist
-        for filename in self.component_files:
-            file_path = self.install_dir / filename
-            if not file_path.exists():
-                errors.append(f"Missing framework file: {filename}")
-            elif not file_path.is_file():
-                errors.append(f"Framework file is not a regular file: {filename}")
-        
         # Check metadata registration
         if not self.settings_manager.is_component_installed("core"):
             errors.append("Core component not registered in metadata")
@@ -211,7 +200,7 @@ class CoreComponent(Component):
         except Exception as e:
             errors.append(f"Could not validate metadata: {e}")
         
-        return len(errors) == 0, errors
+        return errors
     
     def _get_source_dir(self):
         """Get source directory for framework files"""
@@ -222,13 +211,7 @@ class CoreComponent(Component):
     
     def get_size_estimate(self) -> int:
         """Get estimated installation size"""
-        total_size = 0
-        source_dir = self._get_source_dir()
-        
-        for filename in self.component_files:
-            file_path = source_dir / filename
-            if file_path.exists():
-                total_size += file_path.stat().st_size
+        total_size = super().get_size_estimate()
         
         # Add overhead for settings.json and directories
         total_size += 10240  # ~10KB overhead
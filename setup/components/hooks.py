@@ -2,36 +2,37 @@
 Hooks component for Claude Code hooks integration (future-ready)
 """
 
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Optional, Any
 from pathlib import Path
 
 from ..base.component import Component
+from ..utils.journal import journaled
+from ..base.file_spec import FileSpec
+from ..utils.source_manifest import get_source_manifest
 
 
 class HooksComponent(Component):
     """Claude Code hooks integration component"""
     
+    METADATA = {
+        "name": "hooks",
+        "version": "3.0.0",
+        "description": "Claude Code hooks integration (future-ready)",
+        "category": "integration"
+    }
+    DEPENDENCIES = ("core",)
+    # Hook scripts (none are shipped yet; the placeholder is written by _install)
+    FILE_SPEC = FileSpec(include=("**/*.py",), exclude=("**/__init__.py", "PLACEHOLDER.py"))
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize hooks component"""
         super().__init__(install_dir, Path("hooks"))
-        
-        # Define hook files to install (when hooks are ready)
-        self.hook_files = [
-            "pre_tool_use.py",
-            "post_tool_use.py",
-            "error_handler.py",
-            "context_accumulator.py",
-            "performance_monitor.py"
-        ]
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "hooks",
-            "version": "3.0.0",
-            "description": "Claude Code hooks integration (future-ready)",
-            "category": "integration"
-        }
+    @property
+    def hook_files(self) -> List[str]:
+        """Hook scripts selected by FILE_SPEC"""
+        return self.component_files
+    
     def get_metadata_modifications(self) -> Dict[str, Any]:
         # Build hooks configuration based on available files
         hook_config = {}
@@ -101,8 +102,9 @@ pass
             
             placeholder_path = self.install_component_subdir / "PLACEHOLDER.py"
             try:
-                with open(placeholder_path, 'w') as f:
-                    f.write(placeholder_content)
+                with journaled("write", path=str(placeholder_path), existed=placeholder_path.exists()):
+                    with open(placeholder_path, 'w') as f:
+                        f.write(placeholder_content)
                 self.logger.debug("Created hooks placeholder file")
             except Exception as e:
                 self.logger.warning(f"Could not create placeholder file: {e}")
@@ -132,7 +134,7 @@ pass
         self.logger.info("Installing actual hook files...")
 
         # Validate installation
-        success, errors = self.validate_prerequisites(Path("hooks"))
+        success, errors = self.check_prerequisites()
         if not success:
             for error in errors:
                 self.logger.error(error)
@@ -146,16 +148,11 @@ pass
             return False
 
         # Copy hook files
-        success_count = 0
-        for source, target in files_to_install:
-            self.logger.debug(f"Copying {source.name} to {target}")
-            
-            if self.file_manager.copy_file(source, target):
-                success_count += 1
-                self.logger.debug(f"Successfully copied {source.name}")
-            else:
-                self.logger.error(f"Failed to copy {source.name}")
+        failures = self._install_files(files_to_install)
+        for target, error in failures.items():
+            self.logger.error(f"Failed to copy {target.name}: {error}")
 
+        success_count = len(files_to_install) - len(failures)
         if success_count != len(files_to_install):
             self.logger.error(f"Only {success_count}/{len(files_to_install)} hook files copied successfully")
             return False
@@ -164,6 +161,13 @@ pass
 
         return self._post_install()
 
+    def has_changes(self) -> bool:
+        """Check whether installing would change anything, including a missing placeholder"""
+        if super().has_changes():
+            return True
+        return not (self.install_component_subdir / "PLACEHOLDER.py").exists() and \
+            not any((self.install_component_subdir / filename).exists() for filename in self.hook_files)
+
     def _post_install(self):
         # Update metadata
         try:
@@ -207,6 +211,7 @@ pass
                 self.logger.debug("Removed hooks placeholder")
             
             # Remove hooks directory if empty
+            self._prune_empty_directories(self.install_component_subdir)
             try:
                 if self.install_component_subdir.exists():
                     remaining_files = list(self.install_component_subdir.iterdir())
@@ -238,10 +243,6 @@ pass
             self.logger.exception(f"Unexpected error during hooks uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update hooks component"""
         try:
@@ -298,14 +299,14 @@ pass
             self.logger.exception(f"Unexpected error during hooks update: {e}")
             return False
     
-    def validate_installation(self) -> Tuple[bool, List[str]]:
-        """Validate hooks component installation"""
+    def validate_registration(self) -> List[str]:
+        """Validate hooks component installation beyond the planned hook files"""
         errors = []
         
         # Check if hooks directory exists
         if not self.install_component_subdir.exists():
             errors.append("Hooks directory not found")
-            return False, errors
+            return errors
         
         # Check settings.json registration
         if not self.settings_manager.is_component_installed("hooks"):
@@ -324,7 +325,7 @@ pass
         if not has_placeholder and not has_actual_hooks:
             errors.append("No hook files or placeholder found")
         
-        return len(errors) == 0, errors
+        return errors
     
     def _get_source_dir(self) -> Path:
         """Get source directory for hook files"""
@@ -337,9 +338,15 @@ pass
         """Get estimated installation size"""
         # Estimate based on placeholder or actual files
         source_dir = self._get_source_dir()
+        manifest = get_source_manifest()
         total_size = 0
         
-        if source_dir.exists():
+        if manifest is not None:
+            for filename in self.hook_files:
+                entry = manifest.get_entry(source_dir / filename)
+                if entry is not None:
+                    total_size += entry["size"]
+        elif source_dir.exists():
             for filename in self.hook_files:
                 file_path = source_dir / filename
                 if file_path.exists():
@@ -8,12 +8,21 @@ from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 
 from ..base.component import Component
+from ..utils.journal import journaled
 from ..utils.ui import display_info, display_warning
 
 
 class MCPComponent(Component):
     """MCP servers integration component"""
     
+    METADATA = {
+        "name": "mcp",
+        "version": "3.0.0",
+        "description": "MCP server integration (Context7, Sequential, Magic, Playwright)",
+        "category": "integration"
+    }
+    DEPENDENCIES = ("core",)
+    
     def __init__(self, install_dir: Optional[Path] = None):
         """Initialize MCP component"""
         super().__init__(install_dir)
@@ -48,15 +57,6 @@ class MCPComponent(Component):
             }
         }
     
-    def get_metadata(self) -> Dict[str, str]:
-        """Get component metadata"""
-        return {
-            "name": "mcp",
-            "version": "3.0.0",
-            "description": "MCP server integration (Context7, Sequential, Magic, Playwright)",
-            "category": "integration"
-        }
-    
     def validate_prerequisites(self, installSubPath: Optional[Path] = None) -> Tuple[bool, List[str]]:
         """Check prerequisites"""
         errors = []
@@ -143,6 +143,16 @@ class MCPComponent(Component):
             }
         }
     
+    def has_changes(self) -> bool:
+        """Check whether installing would change anything, including missing required servers"""
+        if super().has_changes():
+            return True
+        return not all(
+            self._check_mcp_server_installed(server_name)
+            for server_name, server_info in self.mcp_servers.items()
+            if server_info.get("required", False)
+        )
+    
     def _check_mcp_server_installed(self, server_name: str) -> bool:
         """Check if MCP server is already installed"""
         try:
@@ -204,13 +214,14 @@ class MCPComponent(Component):
             
             self.logger.debug(f"Running: claude mcp add -s user {server_name} {command} -y {npm_package}")
             
-            result = subprocess.run(
-                ["claude", "mcp", "add", "-s", "user", "--", server_name, command, "-y", npm_package],
-                capture_output=True,
-                text=True,
-                timeout=120,  # 2 minutes timeout for installation
-                shell=(sys.platform == "win32")
-            )
+            with journaled("mcp", component="mcp", server=server_name):
+                result = subprocess.run(
+                    ["claude", "mcp", "add", "-s", "user", "--", server_name, command, "-y", npm_package],
+                    capture_output=True,
+                    text=True,
+                    timeout=120,  # 2 minutes timeout for installation
+                    shell=(sys.platform == "win32")
+                )
             
             if result.returncode == 0:
                 self.logger.success(f"Successfully installed MCP server (user scope): {server_name}")
@@ -262,6 +273,12 @@ class MCPComponent(Component):
             self.logger.error(f"Error uninstalling MCP server {server_name}: {e}")
             return False
     
+    def rollback_operation(self, operation: Dict[str, Any]) -> bool:
+        """Unregister an MCP server added by an interrupted run"""
+        if operation.get("op") != "mcp":
+            return False
+        return self._uninstall_mcp_server(operation["server"])
+    
     def _install(self, config: Dict[str, Any]) -> bool:
         """Install MCP component"""
         self.logger.info("Installing SuperClaude MCP servers...")
@@ -372,10 +389,6 @@ class MCPComponent(Component):
             self.logger.exception(f"Unexpected error during MCP uninstallation: {e}")
             return False
     
-    def get_dependencies(self) -> List[str]:
-        """Get dependencies"""
-        return ["core"]
-    
     def update(self, config: Dict[str, Any]) -> bool:
         """Update MCP component"""
         try:
@@ -435,14 +448,14 @@ class MCPComponent(Component):
             self.logger.exception(f"Unexpected error during MCP update: {e}")
             return False
     
-    def validate_installation(self) -> Tuple[bool, List[str]]:
-        """Validate MCP component installation"""
+    def validate_registration(self) -> List[str]:
+        """Validate MCP component registration and servers"""
         errors = []
         
         # Check metadata registration
         if not self.settings_manager.is_component_installed("mcp"):
             errors.append("MCP component not registered in metadata")
-            return False, errors
+            return errors
         
         # Check version matches
         installed_version = self.settings_manager.get_component_version("mcp")
@@ -473,7 +486,7 @@ class MCPComponent(Component):
         except Exception as e:
             errors.append(f"Could not verify MCP server installation: {e}")
         
-        return len(errors) == 0, errors
+        return errors
     
     def _get_source_dir(self):
         """Get source directory for framework files"""
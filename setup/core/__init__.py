@@ -2,8 +2,11 @@
 
 from .validator import Validator
 from .registry import ComponentRegistry
+from .dependency_graph import DependencyGraph, DependencyCycleError
 
 __all__ = [
     'Validator',
-    'ComponentRegistry'
+    'ComponentRegistry',
+    'DependencyGraph',
+    'DependencyCycleError'
 ]
@@ -0,0 +1,227 @@
+"""
+Component dependency graph with a reverse index
+Resolution, level grouping and cycle detection each visit every node and
+edge once
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+
+class DependencyCycleError(ValueError):
+    """Raised when components depend on each other in a cycle"""
+
+    def __init__(self, cycle: List[str]):
+        """
+        Args:
+            cycle: Component names along the cycle, first name repeated at the end
+        """
+        self.cycle = cycle
+        super().__init__(f"Circular dependency detected: {' -> '.join(cycle)}")
+
+
+class DependencyGraph:
+    """Directed graph of component -> required components, indexed both ways"""
+
+    def __init__(self):
+        self._dependencies: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._dependencies
+
+    def __len__(self) -> int:
+        return len(self._dependencies)
+
+    @property
+    def names(self) -> List[str]:
+        """Component names in insertion order"""
+        return list(self._dependencies)
+
+    def set_dependencies(self, name: str, dependencies: Iterable[str]) -> None:
+        """
+        Add a component or replace its dependencies
+
+        Dependencies don't have to be in the graph (yet); resolving a
+        component that needs a missing one fails.
+        """
+        for dependency in self._dependencies.get(name, ()):
+            self._dependents[dependency].discard(name)
+
+        self._dependencies[name] = set(dependencies)
+        for dependency in self._dependencies[name]:
+            self._dependents.setdefault(dependency, set()).add(name)
+
+    def remove(self, name: str) -> None:
+        """Remove a component (components depending on it keep the edge)"""
+        for dependency in self._dependencies.pop(name, ()):
+            self._dependents[dependency].discard(name)
+
+    def clear(self) -> None:
+        """Remove every component"""
+        self._dependencies.clear()
+        self._dependents.clear()
+
+    def get_dependencies(self, name: str) -> Set[str]:
+        """Direct dependencies of a component (empty if unknown)"""
+        return set(self._dependencies.get(name, ()))
+
+    def get_dependents(self, name: str) -> Set[str]:
+        """Components directly depending on a component"""
+        return set(self._dependents.get(name, ()))
+
+    def resolve(self, names: Iterable[str],
+                before_visit: Optional[Callable[[str], None]] = None) -> List[str]:
+        """
+        Order components and everything they need so dependencies come first
+
+        Depth-first, in the order the names are given: the result matches a
+        recursive resolution, without recursion limits or list lookups.
+
+        Args:
+            names: Components to resolve
+            before_visit: Called with each component before its dependencies
+                are read (may add or remove it, e.g. to load it lazily)
+
+        Returns:
+            Component names in installation order
+
+        Raises:
+            DependencyCycleError: If the components depend on each other in a cycle
+            ValueError: If a component is unknown
+        """
+        resolved: List[str] = []
+        done: Set[str] = set()
+        path: List[str] = []
+        on_path: Set[str] = set()
+
+        for root in names:
+            if root in done:
+                continue
+
+            stack = [(root, None)]
+            while stack:
+                name, pending = stack[-1]
+
+                if pending is None:
+                    if name in done:
+                        stack.pop()
+                        continue
+                    if name in on_path:
+                        raise DependencyCycleError(path[path.index(name):] + [name])
+
+                    if before_visit is not None:
+                        before_visit(name)
+                    if name not in self._dependencies:
+                        raise ValueError(f"Unknown component: {name}")
+
+                    pending = iter(sorted(self._dependencies[name]))
+                    stack[-1] = (name, pending)
+                    path.append(name)
+                    on_path.add(name)
+
+                dependency = next(pending, None)
+                if dependency is not None:
+                    stack.append((dependency, None))
+                    continue
+
+                stack.pop()
+                path.pop()
+                on_path.discard(name)
+                done.add(name)
+                resolved.append(name)
+
+        return resolved
+
+    def get_levels(self, ordered_names: List[str]) -> List[List[str]]:
+        """
+        Group components into levels that can be installed in parallel (Kahn's algorithm)
+
+        No component in a level depends on another component of the same or a
+        later level; dependencies outside ordered_names are ignored.
+
+        Args:
+            ordered_names: Components to group, e.g. from resolve()
+
+        Returns:
+            List of levels, each keeping the order of ordered_names
+
+        Raises:
+            DependencyCycleError: If the components depend on each other in a cycle
+        """
+        rank = {name: index for index, name in enumerate(ordered_names)}
+        in_degree = {
+            name: sum(1 for dependency in self._dependencies.get(name, ()) if dependency in rank)
+            for name in ordered_names
+        }
+
+        levels = []
+        current = [name for name in ordered_names if in_degree[name] == 0]
+        placed = 0
+        while current:
+            levels.append(current)
+            placed += len(current)
+
+            following = []
+            for name in current:
+                for dependent in self._dependents.get(name, ()):
+                    if dependent in rank:
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            following.append(dependent)
+            current = sorted(following, key=rank.__getitem__)
+
+        if placed < len(ordered_names):
+            remaining = [name for name in ordered_names if in_degree[name] > 0]
+            raise DependencyCycleError(self._find_cycle_among(set(remaining)))
+
+        return levels
+
+    def find_cycles(self) -> List[List[str]]:
+        """
+        Find dependency cycles
+
+        Every component is visited once, so a component shared by several
+        cycles may only be reported in the first of them.
+
+        Returns:
+            Cycles as name paths with the first name repeated at the end
+        """
+        cycles = []
+        state: Dict[str, int] = {}  # 1: on the current path, 2: finished
+        path: List[str] = []
+
+        for root in self._dependencies:
+            if root in state:
+                continue
+
+            stack = [(root, iter(sorted(self._dependencies[root])))]
+            state[root] = 1
+            path.append(root)
+            while stack:
+                name, pending = stack[-1]
+                dependency = next(pending, None)
+                if dependency is None:
+                    stack.pop()
+                    path.pop()
+                    state[name] = 2
+                elif dependency not in self._dependencies:
+                    continue
+                elif state.get(dependency) == 1:
+                    cycles.append(path[path.index(dependency):] + [dependency])
+                elif dependency not in state:
+                    state[dependency] = 1
+                    path.append(dependency)
+                    stack.append((dependency, iter(sorted(self._dependencies[dependency]))))
+
+        return cycles
+
+    def _find_cycle_among(self, names: Set[str]) -> List[str]:
+        """Walk dependencies inside names until one repeats (every name has one left in names)"""
+        name = min(names)
+        seen: Dict[str, int] = {}
+        path: List[str] = []
+        while name not in seen:
+            seen[name] = len(path)
+            path.append(name)
+            name = min(dependency for dependency in self._dependencies[name] if dependency in names)
+        return path[seen[name]:] + [name]
@@ -0,0 +1,202 @@
+"""
+Fleet execution: run one operation against many installation directories
+"""
+
+import argparse
+import importlib
+import io
+import multiprocessing
+import os
+import sys
+import time
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable
+
+
+def load_targets_file(targets_file: Path) -> List[Path]:
+    """
+    Read installation directories from a targets file
+
+    One directory per line; blank lines and lines starting with '#' are
+    ignored and '~' is expanded. Duplicate directories are dropped so two
+    workers never write to the same target.
+
+    Args:
+        targets_file: Path to the targets file
+
+    Returns:
+        List of target directories in file order
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    targets: List[Path] = []
+    seen = set()
+
+    with open(targets_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            entry = line.strip()
+            if not entry or entry.startswith('#'):
+                continue
+
+            target = Path(entry).expanduser()
+            key = os.path.normpath(str(target.absolute()))
+            if key not in seen:
+                seen.add(key)
+                targets.append(target)
+
+    return targets
+
+
+def run_target(operation_name: str, arguments: Dict[str, Any], target: str) -> Dict[str, Any]:
+    """
+    Run an operation against a single target in a worker process
+
+    The operation runs non-interactively (as if --yes was given) with its
+    console output captured and its log file written to <target>/logs.
+
+    Args:
+        operation_name: Operation module name (e.g. "install")
+        arguments: Parsed CLI arguments as a dict
+        target: Installation directory for this run
+
+    Returns:
+        Dict with target, exit_code, success, duration, output and events
+    """
+    from ..utils.logger import setup_logging, LogLevel
+    from ..utils.events import enable_event_output, disable_event_output, parse_events
+
+    args = argparse.Namespace(**arguments)
+    args.install_dir = Path(target)
+    args.targets_file = None
+    args.yes = True
+
+    output = io.StringIO()
+    events = io.StringIO()
+    start_time = time.time()
+    sys.stdin = io.StringIO("")
+
+    # Events are collected here and relayed by the parent with the target attached
+    if getattr(args, "output", "text") == "jsonl":
+        enable_event_output(events)
+    else:
+        disable_event_output()
+
+    with redirect_stdout(output), redirect_stderr(output):
+        if args.quiet:
+            level = LogLevel.ERROR
+        elif args.verbose:
+            level = LogLevel.DEBUG
+        else:
+            level = LogLevel.INFO
+        log_dir = args.install_dir / "logs" if not args.dry_run else None
+        setup_logging("superclaude_hub", log_dir=log_dir, console_level=level)
+
+        try:
+            module = importlib.import_module(f"setup.operations.{operation_name}")
+            exit_code = module.run(args)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except EOFError:
+            print("Interactive input is not available in fleet runs; pass the options explicitly")
+            exit_code = 1
+        except Exception as e:
+            print(f"Error in {operation_name} operation: {e}")
+            exit_code = 1
+
+    return {
+        "target": target,
+        "exit_code": exit_code,
+        "success": exit_code == 0,
+        "duration": round(time.time() - start_time, 3),
+        "output": output.getvalue(),
+        "events": parse_events(events.getvalue())
+    }
+
+
+class FleetRunner:
+    """Runs one operation against many installation directories in parallel"""
+
+    def __init__(self, operation_name: str, args: argparse.Namespace, max_workers: Optional[int] = None):
+        """
+        Initialize fleet runner
+
+        Args:
+            operation_name: Operation module name (e.g. "install")
+            args: Parsed CLI arguments shared by every target
+            max_workers: Maximum concurrent targets (defaults to CPU count)
+        """
+        self.operation_name = operation_name
+        self.args = args
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def _get_mp_context(self):
+        """
+        Prefer fork so workers inherit the parent's warm registry, configuration
+        and validator caches; other start methods rebuild them per worker.
+        """
+        if "fork" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("fork")
+        return multiprocessing.get_context()
+
+    def run(self, targets: List[Path],
+            on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Run the operation against every target
+
+        Args:
+            targets: Installation directories
+            on_result: Called with each target result as it completes
+
+        Returns:
+            Dict with per-target results (in target order) and aggregate timing
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        arguments = dict(vars(self.args))
+        workers = max(1, min(self.max_workers, len(targets)))
+        results: Dict[str, Dict[str, Any]] = {}
+        start_time = time.time()
+
+        # Flush buffered output so forked workers don't repeat it
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=self._get_mp_context()) as executor:
+            futures = {
+                executor.submit(run_target, self.operation_name, arguments, str(target)): str(target)
+                for target in targets
+            }
+
+            for future in as_completed(futures):
+                target = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {
+                        "target": target,
+                        "exit_code": 1,
+                        "success": False,
+                        "duration": 0.0,
+                        "output": f"Worker failed: {e}",
+                        "events": []
+                    }
+                results[target] = result
+                if on_result:
+                    on_result(result)
+
+        wall_time = time.time() - start_time
+        ordered = [results[str(target)] for target in targets]
+        target_time = sum(result["duration"] for result in ordered)
+
+        return {
+            "operation": self.operation_name,
+            "results": ordered,
+            "succeeded": sum(1 for result in ordered if result["success"]),
+            "failed": sum(1 for result in ordered if not result["success"]),
+            "workers": workers,
+            "wall_time": round(wall_time, 3),
+            "target_time": round(target_time, 3),
+            "speedup": round(target_time / wall_time, 2) if wall_time > 0 else 0.0
+        }
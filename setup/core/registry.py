@@ -4,40 +4,185 @@ Component registry for auto-discovery and dependency resolution
 
 import importlib
 import inspect
-from typing import Dict, List, Set, Optional, Type
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Set, Optional, Tuple, Type
 from pathlib import Path
 from ..base.component import Component
+from .dependency_graph import DependencyCycleError, DependencyGraph
+from ..utils.profiler import get_profiler
+
+
+# Bumped when the layout of the discovery cache changes
+REGISTRY_CACHE_FORMAT = 2
+
+# Entry point group through which other packages contribute components:
+# the entry point name is the component name, its value "module:Class"
+PLUGIN_ENTRY_POINT_GROUP = "superclaude.components"
+
+
+def _iter_entry_points(group: str) -> List[Any]:
+    """List the installed entry points of a group (from distribution metadata, nothing is imported)"""
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return []
+
+    try:
+        all_entry_points = entry_points()
+    except Exception:
+        return []
+    if hasattr(all_entry_points, "select"):
+        return list(all_entry_points.select(group=group))
+    return list(all_entry_points.get(group, []))
 
 
 class ComponentRegistry:
     """Auto-discovery and management of installable components"""
     
-    def __init__(self, components_dir: Path):
+    def __init__(self, components_dir: Path, cache_file: Optional[Path] = None):
         """
         Initialize component registry
         
         Args:
             components_dir: Directory containing component modules
+            cache_file: Discovery cache (defaults to CACHE_DIR/registry.json)
         """
+        from .. import CACHE_DIR
         self.components_dir = components_dir
+        self.cache_file = cache_file or CACHE_DIR / "registry.json"
+        # Classes are imported on first use; the others come from the cache on warm starts
         self.component_classes: Dict[str, Type[Component]] = {}
+        self.component_class_paths: Dict[str, str] = {}
+        self.component_metadata: Dict[str, Dict[str, str]] = {}
+        # Default-directory instances, created on first request
         self.component_instances: Dict[str, Component] = {}
-        self.dependency_graph: Dict[str, Set[str]] = {}
+        self.dependency_graph = DependencyGraph()
+        # Plugin component name -> [entry point value, distribution, distribution version]
+        self.plugin_entry_points: Dict[str, List[Optional[str]]] = {}
+        # Plugins known only from their entry point (metadata is a placeholder, dependencies unknown)
+        self._unresolved_plugins: Set[str] = set()
+        self._fingerprint: Optional[Dict[str, Any]] = None
         self._discovered = False
     
     def discover_components(self, force_reload: bool = False) -> None:
         """
-        Auto-discover all component classes in components directory
+        Auto-discover built-in component classes and plugin components
+        
+        Discovery results are read from the cache file when the component
+        modules and package version are unchanged; no module is imported
+        until its class is needed. Plugins are listed from their entry points
+        and only imported once selected, resolved or installed.
         
         Args:
-            force_reload: Force rediscovery even if already done
+            force_reload: Force rediscovery (importing every built-in module) even if already done
         """
         if self._discovered and not force_reload:
             return
-        
+
+        with get_profiler().phase("registry_discovery"):
+            self._fingerprint = self._get_fingerprint()
+            cache = None if force_reload else self._read_cache()
+
+            if cache is not None and cache.get("fingerprint") == self._fingerprint:
+                self._restore_components(cache["components"])
+            else:
+                self._discover_components()
+            self._discover_plugins(cache.get("plugins", {}) if cache is not None else {})
+
+            if cache != self._build_cache():
+                self._save_cache()
+
+    def _get_fingerprint(self) -> Dict[str, Any]:
+        """Identify the component modules by name, mtime and size, plus the package version"""
+        from .. import __version__
+
+        modules = {}
+        try:
+            with os.scandir(self.components_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".py") and not entry.name.startswith("__") and entry.is_file():
+                        entry_stat = entry.stat()
+                        modules[entry.name[:-3]] = [entry_stat.st_mtime_ns, entry_stat.st_size]
+        except OSError:
+            pass
+
+        return {
+            "format": REGISTRY_CACHE_FORMAT,
+            "version": __version__,
+            "components_dir": str(self.components_dir.absolute()),
+            "modules": modules
+        }
+
+    def _read_cache(self) -> Optional[Dict[str, Any]]:
+        """Read the cache file (None if missing or unreadable)"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or not isinstance(cache.get("components"), dict):
+            return None
+        return cache
+
+    def _restore_components(self, components: Dict[str, Any]) -> None:
+        """Restore built-in components from the cache"""
+        self._clear()
+        for name, entry in components.items():
+            self.component_class_paths[name] = entry["class"]
+            self.component_metadata[name] = dict(entry["metadata"])
+            self.dependency_graph.set_dependencies(name, entry["dependencies"])
+        self._build_dependency_graph()
+        self._discovered = True
+
+    def _build_cache(self) -> Dict[str, Any]:
+        """Discovery results in cache file layout"""
+        def describe(name):
+            return {
+                "class": self.component_class_paths[name],
+                "metadata": self.component_metadata[name],
+                "dependencies": sorted(self.dependency_graph.get_dependencies(name))
+            }
+
+        return {
+            "fingerprint": self._fingerprint,
+            "components": {
+                name: describe(name)
+                for name in self.component_class_paths
+                if name not in self.plugin_entry_points
+            },
+            "plugins": {
+                name: {"entry_point": entry_point, **describe(name)}
+                for name, entry_point in self.plugin_entry_points.items()
+                if name not in self._unresolved_plugins
+            }
+        }
+
+    def _save_cache(self) -> None:
+        """Write discovery results to the cache file (best effort)"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_file.parent, prefix=".registry-")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._build_cache(), f, indent=2)
+            os.replace(temp_path, self.cache_file)
+        except OSError:
+            pass
+
+    def _clear(self) -> None:
+        """Forget all discovered components"""
         self.component_classes.clear()
+        self.component_class_paths.clear()
+        self.component_metadata.clear()
         self.component_instances.clear()
         self.dependency_graph.clear()
+        self.plugin_entry_points.clear()
+        self._unresolved_plugins.clear()
+
+    def _discover_components(self) -> None:
+        """Import component modules and build the dependency graph"""
+        self._clear()
         
         if not self.components_dir.exists():
             return
@@ -68,6 +213,114 @@ class ComponentRegistry:
         self._build_dependency_graph()
         self._discovered = True
     
+    def _discover_plugins(self, cached_plugins: Dict[str, Any]) -> None:
+        """
+        Register plugin components from their entry points without importing them
+        
+        Metadata and dependencies come from the cache when the entry point
+        and its distribution version are unchanged; otherwise the plugin is
+        listed with placeholder metadata until it is first used.
+        
+        Args:
+            cached_plugins: "plugins" section of the cache file
+        """
+        for entry_point in _iter_entry_points(PLUGIN_ENTRY_POINT_GROUP):
+            name = entry_point.name
+            if name in self.component_metadata:
+                origin = "another plugin" if name in self.plugin_entry_points else "a built-in component"
+                print(f"Warning: Ignoring plugin component {name} ({entry_point.value}): name already used by {origin}")
+                continue
+            
+            distribution = getattr(entry_point, "dist", None)
+            identity = [
+                entry_point.value,
+                distribution.metadata["Name"] if distribution is not None else None,
+                distribution.version if distribution is not None else None
+            ]
+            self.plugin_entry_points[name] = identity
+            self.component_class_paths[name] = entry_point.value
+            
+            cached = cached_plugins.get(name)
+            if isinstance(cached, dict) and cached.get("entry_point") == identity:
+                self.component_metadata[name] = dict(cached["metadata"])
+                self.dependency_graph.set_dependencies(name, cached["dependencies"])
+            else:
+                self.component_metadata[name] = {
+                    "name": name,
+                    "version": identity[2] or "unknown",
+                    "description": f"Plugin component from {identity[1] or entry_point.value}",
+                    "category": "plugin"
+                }
+                self.dependency_graph.set_dependencies(name, ())
+                self._unresolved_plugins.add(name)
+    
+    def _resolve_plugin(self, component_name: str) -> bool:
+        """
+        Import a plugin component known only from its entry point
+        
+        Args:
+            component_name: Name of plugin component
+            
+        Returns:
+            True if the component's metadata and dependencies are known
+        """
+        if component_name not in self._unresolved_plugins:
+            return component_name in self.component_metadata
+        self._unresolved_plugins.discard(component_name)
+        
+        component_class = self._import_class(component_name)
+        if component_class is None:
+            self._forget_component(component_name)
+            return False
+        
+        info = self._read_class_info(component_class)
+        if info is None or info[0]["name"] != component_name:
+            if info is not None:
+                print(f"Warning: Plugin component {component_name} declares the name {info[0]['name']}")
+            self._forget_component(component_name)
+            return False
+        
+        metadata, dependencies, instance = info
+        self.component_classes[component_name] = component_class
+        self.component_metadata[component_name] = metadata
+        self.dependency_graph.set_dependencies(component_name, dependencies)
+        if instance is not None:
+            self.component_instances[component_name] = instance
+        
+        self._save_cache()
+        return True
+    
+    def _resolve_all_plugins(self) -> None:
+        """Import every plugin whose dependencies are still unknown"""
+        for component_name in list(self._unresolved_plugins):
+            self._resolve_plugin(component_name)
+    
+    def _forget_component(self, component_name: str) -> None:
+        """Drop a component that could not be loaded"""
+        self.component_classes.pop(component_name, None)
+        self.component_class_paths.pop(component_name, None)
+        self.component_metadata.pop(component_name, None)
+        self.component_instances.pop(component_name, None)
+        self.dependency_graph.remove(component_name)
+        self.plugin_entry_points.pop(component_name, None)
+    
+    def _import_class(self, component_name: str) -> Optional[Type[Component]]:
+        """Import the class at a component's "module:Class" path"""
+        class_path = self.component_class_paths[component_name]
+        module_name, _, attribute = class_path.partition(":")
+        try:
+            obj = importlib.import_module(module_name)
+            for part in attribute.split("."):
+                obj = getattr(obj, part)
+        except Exception as e:
+            print(f"Warning: Could not load component {component_name} from {class_path}: {e}")
+            return None
+        
+        if not (inspect.isclass(obj) and issubclass(obj, Component) and not inspect.isabstract(obj)):
+            print(f"Warning: {class_path} is not a concrete Component subclass")
+            return None
+        return obj
+    
     def _load_component_module(self, module_name: str) -> None:
         """
         Load component classes from a module
@@ -84,36 +337,68 @@ class ComponentRegistry:
             for name, obj in inspect.getmembers(module):
                 if (inspect.isclass(obj) and 
                     issubclass(obj, Component) and 
-                    obj is not Component):
-                    
-                    # Create instance to get metadata
-                    try:
-                        instance = obj()
-                        metadata = instance.get_metadata()
-                        component_name = metadata["name"]
-                        
-                        self.component_classes[component_name] = obj
-                        self.component_instances[component_name] = instance
-                        
-                    except Exception as e:
-                        print(f"Warning: Could not instantiate component {name}: {e}")
+                    obj is not Component and
+                    not inspect.isabstract(obj)):
+                    self._register_component_class(name, obj)
         
         except Exception as e:
             print(f"Warning: Could not load component module {module_name}: {e}")
     
+    def _read_class_info(self, component_class: Type[Component]) -> Optional[Tuple[Dict[str, str], List[str], Optional[Component]]]:
+        """
+        Read metadata and dependencies of a component class
+        
+        Classes declaring METADATA are read without instantiating them;
+        others are instantiated once to call get_metadata/get_dependencies.
+        
+        Returns:
+            Tuple of (metadata, dependencies, instance created or None), None on failure
+        """
+        try:
+            if component_class.METADATA:
+                return dict(component_class.METADATA), list(component_class.DEPENDENCIES), None
+            
+            instance = component_class()
+            return instance.get_metadata(), instance.get_dependencies(), instance
+        except Exception as e:
+            print(f"Warning: Could not load component {component_class.__name__}: {e}")
+            return None
+    
+    def _register_component_class(self, class_name: str, component_class: Type[Component]) -> None:
+        """
+        Record a component class with its metadata and dependencies
+        
+        Args:
+            class_name: Class name (for warnings)
+            component_class: Component subclass
+        """
+        info = self._read_class_info(component_class)
+        if info is None:
+            return
+        
+        metadata, dependencies, instance = info
+        component_name = metadata["name"]
+        self.component_classes[component_name] = component_class
+        self.component_class_paths[component_name] = f"{component_class.__module__}:{component_class.__qualname__}"
+        self.component_metadata[component_name] = metadata
+        self.dependency_graph.set_dependencies(component_name, dependencies)
+        if instance is not None:
+            self.component_instances[component_name] = instance
+    
     def _build_dependency_graph(self) -> None:
-        """Build dependency graph for all discovered components"""
-        for name, instance in self.component_instances.items():
-            try:
-                dependencies = instance.get_dependencies()
-                self.dependency_graph[name] = set(dependencies)
-            except Exception as e:
-                print(f"Warning: Could not get dependencies for {name}: {e}")
-                self.dependency_graph[name] = set()
+        """Make sure every discovered component has a dependency graph entry"""
+        for name in self.component_metadata:
+            if name not in self.dependency_graph:
+                self.dependency_graph.set_dependencies(name, ())
+    
+    def is_plugin(self, component_name: str) -> bool:
+        """Check whether a component comes from a plugin entry point"""
+        self.discover_components()
+        return component_name in self.plugin_entry_points
     
     def get_component_class(self, component_name: str) -> Optional[Type[Component]]:
         """
-        Get component class by name
+        Get component class by name, importing its module on first use
         
         Args:
             component_name: Name of component
@@ -122,7 +407,20 @@ class ComponentRegistry:
             Component class or None if not found
         """
         self.discover_components()
-        return self.component_classes.get(component_name)
+        if component_name not in self.component_classes:
+            if component_name in self._unresolved_plugins:
+                self._resolve_plugin(component_name)
+                return self.component_classes.get(component_name)
+            
+            if component_name not in self.component_class_paths:
+                return None
+            
+            component_class = self._import_class(component_name)
+            if component_class is None:
+                return None
+            self.component_classes[component_name] = component_class
+        
+        return self.component_classes[component_name]
     
     def get_component_instance(self, component_name: str, install_dir: Optional[Path] = None) -> Optional[Component]:
         """
@@ -139,15 +437,26 @@ class ComponentRegistry:
         
         if install_dir is not None:
             # Create new instance with specified install directory
-            component_class = self.component_classes.get(component_name)
+            component_class = self.get_component_class(component_name)
             if component_class:
                 try:
                     return component_class(install_dir)
                 except Exception as e:
                     print(f"Error creating component instance {component_name}: {e}")
                     return None
+            return None
+        
+        if component_name not in self.component_instances:
+            component_class = self.get_component_class(component_name)
+            if component_class is None:
+                return None
+            try:
+                self.component_instances[component_name] = component_class()
+            except Exception as e:
+                print(f"Error creating component instance {component_name}: {e}")
+                return None
         
-        return self.component_instances.get(component_name)
+        return self.component_instances[component_name]
     
     def list_components(self) -> List[str]:
         """
@@ -157,7 +466,7 @@ class ComponentRegistry:
             List of component names
         """
         self.discover_components()
-        return list(self.component_classes.keys())
+        return list(self.component_metadata.keys())
     
     def get_component_metadata(self, component_name: str) -> Optional[Dict[str, str]]:
         """
@@ -170,13 +479,8 @@ class ComponentRegistry:
             Component metadata dict or None if not found
         """
         self.discover_components()
-        instance = self.component_instances.get(component_name)
-        if instance:
-            try:
-                return instance.get_metadata()
-            except Exception:
-                return None
-        return None
+        metadata = self.component_metadata.get(component_name)
+        return dict(metadata) if metadata is not None else None
     
     def resolve_dependencies(self, component_names: List[str]) -> List[str]:
         """
@@ -193,33 +497,8 @@ class ComponentRegistry:
         """
         self.discover_components()
         
-        resolved = []
-        resolving = set()
-        
-        def resolve(name: str):
-            if name in resolved:
-                return
-                
-            if name in resolving:
-                raise ValueError(f"Circular dependency detected involving {name}")
-                
-            if name not in self.dependency_graph:
-                raise ValueError(f"Unknown component: {name}")
-                
-            resolving.add(name)
-            
-            # Resolve dependencies first
-            for dep in self.dependency_graph[name]:
-                resolve(dep)
-                
-            resolving.remove(name)
-            resolved.append(name)
-        
-        # Resolve each requested component
-        for name in component_names:
-            resolve(name)
-            
-        return resolved
+        # A plugin's dependencies are only known once it is imported
+        return self.dependency_graph.resolve(component_names, before_visit=self._resolve_plugin)
     
     def get_dependencies(self, component_name: str) -> Set[str]:
         """
@@ -232,7 +511,8 @@ class ComponentRegistry:
             Set of dependency component names
         """
         self.discover_components()
-        return self.dependency_graph.get(component_name, set())
+        self._resolve_plugin(component_name)
+        return self.dependency_graph.get_dependencies(component_name)
     
     def get_dependents(self, component_name: str) -> Set[str]:
         """
@@ -245,13 +525,8 @@ class ComponentRegistry:
             Set of component names that depend on this component
         """
         self.discover_components()
-        dependents = set()
-        
-        for name, deps in self.dependency_graph.items():
-            if component_name in deps:
-                dependents.add(name)
-                
-        return dependents
+        self._resolve_all_plugins()
+        return self.dependency_graph.get_dependents(component_name)
     
     def validate_dependency_graph(self) -> List[str]:
         """
@@ -261,21 +536,21 @@ class ComponentRegistry:
             List of validation errors (empty if valid)
         """
         self.discover_components()
+        self._resolve_all_plugins()
         errors = []
         
         # Check for missing dependencies
-        all_components = set(self.dependency_graph.keys())
-        for name, deps in self.dependency_graph.items():
-            missing_deps = deps - all_components
+        for name in self.dependency_graph.names:
+            missing_deps = {
+                dep for dep in self.dependency_graph.get_dependencies(name)
+                if dep not in self.dependency_graph
+            }
             if missing_deps:
                 errors.append(f"Component {name} has missing dependencies: {missing_deps}")
         
         # Check for circular dependencies
-        for name in all_components:
-            try:
-                self.resolve_dependencies([name])
-            except ValueError as e:
-                errors.append(str(e))
+        for cycle in self.dependency_graph.find_cycles():
+            errors.append(str(DependencyCycleError(cycle)))
         
         return errors
     
@@ -290,17 +565,10 @@ class ComponentRegistry:
             List of component names in the category
         """
         self.discover_components()
-        components = []
-        
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                if metadata.get("category") == category:
-                    components.append(name)
-            except Exception:
-                continue
-        
-        return components
+        return [
+            name for name, metadata in self.component_metadata.items()
+            if metadata.get("category") == category
+        ]
     
     def get_installation_order(self, component_names: List[str]) -> List[List[str]]:
         """
@@ -315,31 +583,8 @@ class ComponentRegistry:
         """
         self.discover_components()
         
-        # Get all components including dependencies
-        all_components = set(self.resolve_dependencies(component_names))
-        
-        # Group by dependency level
-        levels = []
-        remaining = all_components.copy()
-        
-        while remaining:
-            # Find components with no unresolved dependencies
-            current_level = []
-            for name in list(remaining):
-                deps = self.dependency_graph.get(name, set())
-                unresolved_deps = deps & remaining
-                
-                if not unresolved_deps:
-                    current_level.append(name)
-            
-            if not current_level:
-                # This shouldn't happen if dependency graph is valid
-                raise ValueError("Circular dependency detected in installation order calculation")
-            
-            levels.append(current_level)
-            remaining -= set(current_level)
-        
-        return levels
+        # Kahn's algorithm over all components including dependencies
+        return self.dependency_graph.get_levels(self.resolve_dependencies(component_names))
     
     def create_component_instances(self, component_names: List[str], install_dir: Optional[Path] = None) -> Dict[str, Component]:
         """
@@ -372,24 +617,22 @@ class ComponentRegistry:
             Dict with registry statistics and component info
         """
         self.discover_components()
+        self._resolve_all_plugins()
         
         # Group components by category
         categories = {}
-        for name, instance in self.component_instances.items():
-            try:
-                metadata = instance.get_metadata()
-                category = metadata.get("category", "unknown")
-                if category not in categories:
-                    categories[category] = []
-                categories[category].append(name)
-            except Exception:
-                if "unknown" not in categories:
-                    categories["unknown"] = []
-                categories["unknown"].append(name)
+        for name, metadata in self.component_metadata.items():
+            category = metadata.get("category", "unknown")
+            if category not in categories:
+                categories[category] = []
+            categories[category].append(name)
         
         return {
-            "total_components": len(self.component_classes),
+            "total_components": len(self.component_metadata),
             "categories": categories,
-            "dependency_graph": {name: list(deps) for name, deps in self.dependency_graph.items()},
+            "dependency_graph": {
+                name: sorted(self.dependency_graph.get_dependencies(name))
+                for name in self.dependency_graph.names
+            },
             "validation_errors": self.validate_dependency_graph()
         }
\ No newline at end of file
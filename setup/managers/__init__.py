@@ -1,9 +1,14 @@
 from .config_manager import ConfigManager
 from .settings_manager import SettingsManager
 from .file_manager import FileManager
+from .content_store import ContentStore
+from .installation_state import InstallationState, get_installation_state
 
 __all__ = [
     'ConfigManager',
     'SettingsManager',
-    'FileManager'
+    'FileManager',
+    'ContentStore',
+    'InstallationState',
+    'get_installation_state'
 ]
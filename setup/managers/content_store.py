@@ -0,0 +1,291 @@
+"""
+Content-addressed store of installed framework files
+Each distinct file content is stored once, read-only, under its sha256 and
+linked into installation directories, so install dirs (and users) on one
+host share the bytes and the page cache. A ref records every path linked
+to an object; garbage collection removes objects no live ref points to.
+"""
+
+import errno
+import hashlib
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ..utils import fast_copy
+from ..utils.hash_cache import get_hash_cache
+
+
+LINK_MODE_COPY = "copy"
+LINK_MODE_HARDLINK = "hardlink"
+LINK_MODE_SYMLINK = "symlink"
+LINK_MODES = (LINK_MODE_COPY, LINK_MODE_HARDLINK, LINK_MODE_SYMLINK)
+
+# Refs younger than this are kept by garbage collection even if their path
+# isn't linked yet: another installation may be between writing the ref and
+# creating the link
+GC_GRACE_SECONDS = 15 * 60
+
+# Hard links can't be created here; the file is copied instead
+_NO_HARDLINK_ERRNOS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP, errno.EACCES}
+
+
+class ContentStore:
+    """Directory of immutable file objects named by their sha256, with refs to the paths linking them"""
+
+    def __init__(self, root: Path):
+        """
+        Initialize content store
+
+        Args:
+            root: Store directory (created on first use); hard links need it
+                on the same file system as the installation directories
+        """
+        # Absolute, so symbolic links to objects resolve from anywhere
+        self.root = Path(os.path.abspath(root))
+        self.objects_dir = self.root / "objects"
+        self.refs_dir = self.root / "refs"
+        self._lock = threading.Lock()
+
+    def get_object_path(self, sha256: str) -> Path:
+        """Path of the object holding the content with this sha256"""
+        return self.objects_dir / sha256[:2] / sha256
+
+    def add(self, source: Path, sha256: Optional[str] = None) -> Tuple[str, Path]:
+        """
+        Store the content of a file (no-op if already stored intact)
+
+        Objects keep the permission bits (minus write) and times of the
+        source. Read-only bits don't stop root or an editor writing through
+        a link, so an existing object is re-verified against its hash before
+        it is reused and replaced if its content changed.
+
+        Args:
+            source: File to store
+            sha256: Known sha256 of source (hashed if not given)
+
+        Returns:
+            Tuple of (sha256, object path)
+
+        Raises:
+            OSError: If the object could not be written
+        """
+        sha256 = sha256 or get_hash_cache().get_hash(source)
+        object_path = self.get_object_path(sha256)
+        if self.is_intact(sha256):
+            return sha256, object_path
+
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=object_path.parent, prefix=".tmp-")
+        os.close(fd)
+        try:
+            fast_copy.copy_file(source, Path(temp_name))
+            os.chmod(temp_name, stat.S_IMODE(os.stat(temp_name).st_mode) & ~0o222)
+            # Concurrent adds of the same content replace each other with identical bytes
+            os.replace(temp_name, object_path)
+        except OSError:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+        return sha256, object_path
+
+    def link(self, source: Path, target: Path, link_mode: str, sha256: Optional[str] = None,
+             ref_path: Optional[Path] = None) -> str:
+        """
+        Store a file and put a link to its object at target
+
+        The link replaces target atomically. A hard link that the file system
+        can't create (e.g. the store is on another device) falls back to
+        copying source.
+
+        Args:
+            source: File to install
+            target: Path to link (its directory must exist)
+            link_mode: LINK_MODE_HARDLINK or LINK_MODE_SYMLINK
+            sha256: Known sha256 of source (hashed if not given)
+            ref_path: Path the link will finally live at, if target is moved
+                there later (e.g. from a staging tree); defaults to target
+
+        Returns:
+            How the file was installed: the link mode, or the copy strategy
+            of a fallback copy
+
+        Raises:
+            ValueError: If link_mode is not a link mode
+            OSError: If the file could not be stored or linked
+        """
+        if link_mode not in (LINK_MODE_HARDLINK, LINK_MODE_SYMLINK):
+            raise ValueError(f"Not a link mode: {link_mode}")
+
+        ref_path = ref_path or target
+        sha256 = sha256 or get_hash_cache().get_hash(source)
+        # The ref is written first so garbage collection never sees a link without one
+        self.add_ref(ref_path, sha256)
+        _, object_path = self.add(source, sha256)
+
+        temp_path = target.with_name(f".{target.name}.{os.getpid()}-{threading.get_ident()}.link")
+        try:
+            if link_mode == LINK_MODE_SYMLINK:
+                os.symlink(object_path, temp_path)
+                installed_as = LINK_MODE_SYMLINK
+            else:
+                try:
+                    os.link(object_path, temp_path)
+                    installed_as = LINK_MODE_HARDLINK
+                except OSError as e:
+                    if e.errno not in _NO_HARDLINK_ERRNOS:
+                        raise
+                    installed_as = fast_copy.copy_file(source, temp_path)
+                    self.release(ref_path)
+            os.replace(temp_path, target)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        return installed_as
+
+    def is_intact(self, sha256: str) -> bool:
+        """Check that the object of sha256 exists and still holds that content"""
+        try:
+            return get_hash_cache().get_hash(self.get_object_path(sha256)) == sha256
+        except OSError:
+            return False
+
+    def is_linked(self, path: Path, sha256: str) -> bool:
+        """Check whether path is a hard or symbolic link to the object of sha256"""
+        object_path = self.get_object_path(sha256)
+        try:
+            path_stat = os.lstat(path)
+            object_stat = os.stat(object_path)
+            if stat.S_ISLNK(path_stat.st_mode):
+                return Path(os.readlink(path)) == object_path
+            return os.path.samestat(path_stat, object_stat)
+        except OSError:
+            return False
+
+    def _get_ref_file(self, path: Path) -> Path:
+        """Ref file of a linked path"""
+        key = hashlib.sha256(os.fsencode(os.path.abspath(path))).hexdigest()
+        return self.refs_dir / f"{key}.json"
+
+    def add_ref(self, path: Path, sha256: str) -> None:
+        """Record that path links (or is about to link) the object of sha256"""
+        ref_file = self._get_ref_file(path)
+        ref_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=ref_file.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"path": os.path.abspath(path), "object": sha256}, f)
+            os.replace(temp_name, ref_file)
+        except OSError:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+
+    def release(self, path: Path) -> None:
+        """Drop the ref of a path that no longer links its object"""
+        try:
+            self._get_ref_file(path).unlink()
+        except FileNotFoundError:
+            pass
+
+    def _read_refs(self) -> Dict[Path, Tuple[str, str, float]]:
+        """Ref file -> (linked path, sha256, ref mtime) of every readable ref"""
+        refs = {}
+        try:
+            entries = list(os.scandir(self.refs_dir))
+        except OSError:
+            return refs
+
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    ref = json.load(f)
+                refs[Path(entry.path)] = (ref["path"], ref["object"], entry.stat().st_mtime)
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+        return refs
+
+    def get_refcounts(self) -> Dict[str, int]:
+        """
+        Count the live links of every object
+
+        Returns:
+            Dict of sha256 -> number of paths still linking the object
+        """
+        counts: Dict[str, int] = {}
+        for path, sha256, _ in self._read_refs().values():
+            if self.is_linked(Path(path), sha256):
+                counts[sha256] = counts.get(sha256, 0) + 1
+        return counts
+
+    def collect_garbage(self, grace_seconds: float = GC_GRACE_SECONDS) -> Tuple[int, int]:
+        """
+        Remove stale refs and the objects no live ref points to
+
+        A ref is stale when its path was removed or replaced (e.g. by an
+        uninstall or a copy-mode reinstall). FileManager.remove_file drops
+        the refs of the links it removes, so their objects are collected at
+        once; refs of links removed otherwise are collected once older than
+        grace_seconds. Objects whose content no longer matches their hash
+        (modified through a link) are removed even if referenced; the
+        installations linking them are repaired by their next install.
+
+        Args:
+            grace_seconds: Keep refs younger than this even if their path isn't linked
+
+        Returns:
+            Tuple of (objects removed, bytes freed)
+        """
+        with self._lock:
+            now = time.time()
+            live = set()
+            for ref_file, (path, sha256, mtime) in self._read_refs().items():
+                if self.is_linked(Path(path), sha256) or now - mtime < grace_seconds:
+                    live.add(sha256)
+                else:
+                    try:
+                        ref_file.unlink()
+                    except OSError:
+                        pass
+
+            removed = 0
+            freed = 0
+            try:
+                fanout_dirs = list(os.scandir(self.objects_dir))
+            except OSError:
+                return removed, freed
+
+            for fanout_dir in fanout_dirs:
+                if not fanout_dir.is_dir(follow_symlinks=False):
+                    continue
+                for entry in os.scandir(fanout_dir.path):
+                    if entry.name.startswith(".tmp-") or (entry.name in live and self.is_intact(entry.name)):
+                        continue
+                    try:
+                        size = entry.stat(follow_symlinks=False).st_size
+                        os.unlink(entry.path)
+                    except OSError:
+                        continue
+                    removed += 1
+                    freed += size
+                try:
+                    os.rmdir(fanout_dir.path)
+                except OSError:
+                    pass  # Still holds objects
+
+            return removed, freed
@@ -2,27 +2,91 @@
 Cross-platform file management for SuperClaude installation system
 """
 
+import os
 import shutil
 import stat
-from typing import List, Optional, Callable, Dict, Any
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import List, Optional, Callable, Dict, Any, Tuple
 from pathlib import Path
 import fnmatch
-import hashlib
+import functools
+import re
+
+from ..utils import fast_copy
+from .content_store import ContentStore
+from ..utils.events import get_event_emitter
+from ..utils.hash_cache import get_hash_cache
+from ..utils.journal import get_active_journal, journaled
+
+
+# Concurrent copies of FileManager.copy_many
+DEFAULT_COPY_WORKERS = 8
+
+
+def _first_missing(directory: Path) -> Path:
+    """Get the outermost ancestor of directory (or directory itself) that does not exist yet"""
+    missing = directory
+    while not missing.parent.exists() and missing.parent != missing:
+        missing = missing.parent
+    return missing
+
+
+def _exchange_paths(first: Path, second: Path) -> bool:
+    """
+    Atomically exchange two paths with renameat2(RENAME_EXCHANGE)
+
+    Returns:
+        True if exchanged, False if unsupported here (caller must fall back)
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        renameat2 = libc.renameat2
+    except (OSError, AttributeError):
+        return False
+
+    AT_FDCWD = -100
+    RENAME_EXCHANGE = 2
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    renameat2.restype = ctypes.c_int
+
+    result = renameat2(AT_FDCWD, os.fsencode(str(first)), AT_FDCWD, os.fsencode(str(second)), RENAME_EXCHANGE)
+    return result == 0
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_ignore_patterns(patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile fnmatch patterns into one alternation (case-insensitive where paths are)"""
+    return re.compile("|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns))
 
 
 class FileManager:
     """Cross-platform file operations manager"""
     
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, store: Optional[ContentStore] = None):
         """
         Initialize file manager
         
         Args:
             dry_run: If True, only simulate file operations
+            store: Content store that linked files come from (refs of removed links are released)
         """
         self.dry_run = dry_run
+        self.store = store
         self.copied_files: List[Path] = []
         self.created_dirs: List[Path] = []
+        # (bytes, seconds) of each copy, for the installer's throughput model
+        self.copy_samples: List[Tuple[int, float]] = []
+        # Copy strategy name -> files copied with it (see utils.fast_copy)
+        self.copy_strategies: Dict[str, int] = {}
+        self._lock = threading.Lock()
         
     def copy_file(self, source: Path, target: Path, preserve_permissions: bool = True) -> bool:
         """
@@ -47,22 +111,191 @@ class FileManager:
             return True
         
         try:
-            # Ensure target directory exists
-            target.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Copy file
-            if preserve_permissions:
-                shutil.copy2(source, target)
-            else:
-                shutil.copy(source, target)
-            
-            self.copied_files.append(target)
+            self._copy_one(source, target, preserve_permissions)
             return True
             
         except Exception as e:
             print(f"Error copying {source} to {target}: {e}")
             return False
     
+    def copy_many(self, pairs: List[Tuple[Path, Path]], preserve_permissions: bool = True,
+                  workers: int = DEFAULT_COPY_WORKERS) -> Dict[Path, str]:
+        """
+        Copy files in one call on a bounded thread pool
+        
+        The distinct target directories are created once up front, then the
+        files are copied concurrently; on latency-bound (network) home
+        directories this overlaps the round trips of the copies.
+        
+        Args:
+            pairs: (source, target) file paths
+            preserve_permissions: Whether to preserve file permissions and times
+            workers: Maximum concurrent copies (1 = serial)
+            
+        Returns:
+            Dict mapping each target that could not be copied to the error
+            (empty if all were copied)
+        """
+        return self._run_batch(
+            pairs, "copy",
+            lambda source, target: self._copy_one(source, target, preserve_permissions,
+                                                  ensure_parent=False, journal=False),
+            workers
+        )
+    
+    def link_many(self, pairs: List[Tuple[Path, Path]], link_mode: str, digests: Dict[Path, str],
+                  ref_paths: Optional[Dict[Path, Path]] = None,
+                  workers: int = DEFAULT_COPY_WORKERS) -> Dict[Path, str]:
+        """
+        Install files as links to their objects in the content store
+        
+        Like copy_many, but each source is stored once in self.store and
+        target becomes a hard or symbolic link to the stored object.
+        
+        Args:
+            pairs: (source, target) file paths
+            link_mode: "hardlink" or "symlink" (see content_store.LINK_MODES)
+            digests: target -> known sha256 of its source (hashed when missing)
+            ref_paths: target -> path the link ends up at, for targets in a staging tree
+            workers: Maximum concurrent links (1 = serial)
+            
+        Returns:
+            Dict mapping each target that could not be linked to the error
+            
+        Raises:
+            ValueError: If the file manager has no content store
+        """
+        if self.store is None:
+            raise ValueError("No content store to link files from")
+        ref_paths = ref_paths or {}
+        
+        return self._run_batch(
+            pairs, f"{link_mode} to the store",
+            lambda source, target: self._link_one(source, target, link_mode, digests.get(target),
+                                                  ref_paths.get(target), journal=False),
+            workers
+        )
+    
+    def _run_batch(self, pairs: List[Tuple[Path, Path]], action: str,
+                   operation: Callable[[Path, Path], None], workers: int) -> Dict[Path, str]:
+        """
+        Create the target directories once, then run operation on each pair on a bounded pool
+        
+        The "copy" intents of the whole batch are journaled with one sync
+        before the pool starts (operation must not journal them itself);
+        workers only append the unsynced completions.
+        """
+        if self.dry_run:
+            for source, target in pairs:
+                print(f"[DRY RUN] Would {action} {source} -> {target}")
+            return {}
+        
+        failures: Dict[Path, str] = {}
+        
+        # Each distinct target directory is checked and created once, not once per file
+        failed_dirs: Dict[Path, str] = {}
+        for directory in sorted({target.parent for _, target in pairs}):
+            if directory.exists():
+                continue
+            try:
+                with journaled("mkdir", path=str(_first_missing(directory))):
+                    directory.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                failed_dirs[directory] = str(e)
+        
+        pending = []
+        for source, target in pairs:
+            if target.parent in failed_dirs:
+                failures[target] = failed_dirs[target.parent]
+            else:
+                pending.append((source, target))
+        
+        journal = get_active_journal()
+        seqs: List[Optional[int]] = [None] * len(pending)
+        if journal is not None:
+            seqs = journal.record_many("copy", [
+                {"path": str(target), "existed": os.path.lexists(target)} for _, target in pending
+            ])
+        
+        def run(pair: Tuple[Path, Path], seq: Optional[int]) -> Optional[str]:
+            try:
+                operation(*pair)
+            except Exception as e:
+                return str(e)
+            if seq is not None:
+                journal.complete(seq)
+            return None
+        
+        workers = max(1, min(workers, len(pending)))
+        if workers == 1:
+            errors = [run(pair, seq) for pair, seq in zip(pending, seqs)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                errors = list(executor.map(run, pending, seqs))
+        
+        for (_, target), error in zip(pending, errors):
+            if error is not None:
+                failures[target] = error
+        
+        return failures
+    
+    def _copy_one(self, source: Path, target: Path, preserve_permissions: bool,
+                  ensure_parent: bool = True, journal: bool = True) -> None:
+        """
+        Copy a file with the fastest available strategy, journaled and tracked
+        
+        Batches journal their copies up front and pass journal=False.
+        
+        Raises:
+            OSError: If the file could not be copied
+        """
+        emitter = get_event_emitter()
+        start_time = time.perf_counter()
+        
+        # Ensure target directory exists
+        if ensure_parent and not target.parent.exists():
+            with journaled("mkdir", path=str(_first_missing(target.parent))):
+                target.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Copy file
+        with journaled("copy", path=str(target), existed=target.exists()) if journal else nullcontext():
+            strategy = fast_copy.copy_file(source, target, preserve_metadata=preserve_permissions)
+        
+        duration = time.perf_counter() - start_time
+        size = target.stat().st_size
+        self._record_copy(target, size, duration, strategy)
+        if emitter.enabled:
+            emitter.emit("file_copied", source=str(source), target=str(target), bytes=size,
+                         duration_ms=round(duration * 1000, 3), strategy=strategy)
+    
+    def _link_one(self, source: Path, target: Path, link_mode: str, sha256: Optional[str],
+                  ref_path: Optional[Path], journal: bool = True) -> None:
+        """
+        Link a file from the content store, journaled and tracked like a copy
+        
+        Raises:
+            OSError: If the file could not be stored or linked
+        """
+        emitter = get_event_emitter()
+        start_time = time.perf_counter()
+        
+        with journaled("copy", path=str(target), existed=os.path.lexists(target)) if journal else nullcontext():
+            strategy = self.store.link(source, target, link_mode, sha256, ref_path)
+        
+        duration = time.perf_counter() - start_time
+        size = target.stat().st_size
+        self._record_copy(target, size, duration, strategy)
+        if emitter.enabled:
+            emitter.emit("file_copied", source=str(source), target=str(target), bytes=size,
+                         duration_ms=round(duration * 1000, 3), strategy=strategy)
+    
+    def _record_copy(self, target: Path, size: int, duration: float, strategy: str) -> None:
+        """Track a copied file (copies may run on several threads)"""
+        with self._lock:
+            self.copied_files.append(target)
+            self.copy_samples.append((size, duration))
+            self.copy_strategies[strategy] = self.copy_strategies.get(strategy, 0) + 1
+    
     def copy_directory(self, source: Path, target: Path, ignore_patterns: Optional[List[str]] = None) -> bool:
         """
         Recursively copy directory with gitignore-style patterns
@@ -89,31 +322,32 @@ class FileManager:
             print(f"[DRY RUN] Would copy directory {source} -> {target}")
             return True
         
+        ignored = _compile_ignore_patterns(tuple(all_ignores))
+        source_root = os.fspath(source)
+        target_root = os.fspath(target)
+        
         try:
-            # Create ignore function
             def ignore_func(directory: str, contents: List[str]) -> List[str]:
-                ignored = []
-                for item in contents:
-                    item_path = Path(directory) / item
-                    rel_path = item_path.relative_to(source)
-                    
-                    # Check against ignore patterns
-                    for pattern in all_ignores:
-                        if fnmatch.fnmatch(item, pattern) or fnmatch.fnmatch(str(rel_path), pattern):
-                            ignored.append(item)
-                            break
+                # Called once per directory, before copytree creates its target
+                rel_dir = os.path.relpath(directory, source_root)
+                if rel_dir != os.curdir:
+                    target_dir = os.path.join(target_root, rel_dir)
+                    if not os.path.isdir(target_dir):
+                        with self._lock:
+                            self.created_dirs.append(Path(target_dir))
+                    prefix = os.path.normcase(rel_dir + os.sep)
+                else:
+                    prefix = ""
                 
-                return ignored
+                # Patterns match the name or the path relative to source, like fnmatch
+                return [
+                    item for item in contents
+                    if ignored.match(os.path.normcase(item)) or ignored.match(prefix + os.path.normcase(item))
+                ]
             
-            # Copy tree
-            shutil.copytree(source, target, ignore=ignore_func, dirs_exist_ok=True)
-            
-            # Track created directories and files
-            for item in target.rglob('*'):
-                if item.is_dir():
-                    self.created_dirs.append(item)
-                else:
-                    self.copied_files.append(item)
+            # Copied files are tracked by the copy function as they are written
+            shutil.copytree(source, target, ignore=ignore_func, dirs_exist_ok=True,
+                            copy_function=self._copy_tree_file)
             
             return True
             
@@ -121,6 +355,14 @@ class FileManager:
             print(f"Error copying directory {source} to {target}: {e}")
             return False
     
+    def _copy_tree_file(self, source: str, target: str) -> str:
+        """copytree copy function using the fast copy engine, tracked like copy_many"""
+        start_time = time.perf_counter()
+        strategy = fast_copy.copy_file(Path(source), Path(target))
+        duration = time.perf_counter() - start_time
+        self._record_copy(Path(target), os.stat(target).st_size, duration, strategy)
+        return target
+    
     def ensure_directory(self, directory: Path, mode: int = 0o755) -> bool:
         """
         Create directory and parents if they don't exist
@@ -137,7 +379,9 @@ class FileManager:
             return True
         
         try:
-            directory.mkdir(parents=True, exist_ok=True, mode=mode)
+            if not directory.exists():
+                with journaled("mkdir", path=str(_first_missing(directory))):
+                    directory.mkdir(parents=True, exist_ok=True, mode=mode)
             
             if directory not in self.created_dirs:
                 self.created_dirs.append(directory)
@@ -158,7 +402,8 @@ class FileManager:
         Returns:
             True if successful, False otherwise
         """
-        if not file_path.exists():
+        # Links into the content store are removed themselves, even if dangling
+        if not file_path.exists() and not file_path.is_symlink():
             return True  # Already gone
         
         if self.dry_run:
@@ -166,8 +411,11 @@ class FileManager:
             return True
         
         try:
-            if file_path.is_file():
-                file_path.unlink()
+            if file_path.is_file() or file_path.is_symlink():
+                with journaled("remove", path=str(file_path), existed=True):
+                    file_path.unlink()
+                if self.store is not None:
+                    self.store.release(file_path)
             else:
                 print(f"Warning: {file_path} is not a file, skipping")
                 return False
@@ -264,26 +512,22 @@ class FileManager:
         """
         Calculate file hash
         
+        Digests are cached persistently (see utils.hash_cache), so a file is
+        only read again after it changed.
+        
         Args:
             file_path: Path to file
-            algorithm: Hash algorithm (md5, sha1, sha256, etc.)
+            algorithm: Hash algorithm (md5, sha1, sha256, blake2b, etc., or
+                xxh3_128 and friends if xxhash is installed)
             
         Returns:
             Hex hash string or None if error
         """
-        if not file_path.exists() or not file_path.is_file():
+        if not file_path.is_file():
             return None
         
         try:
-            hasher = hashlib.new(algorithm)
-            
-            with open(file_path, 'rb') as f:
-                # Read in chunks for large files
-                for chunk in iter(lambda: f.read(8192), b""):
-                    hasher.update(chunk)
-            
-            return hasher.hexdigest()
-            
+            return get_hash_cache().get_hash(file_path, algorithm)
         except Exception:
             return None
     
@@ -367,7 +611,60 @@ class FileManager:
         if self.copy_file(file_path, backup_path):
             return backup_path
         return None
-    
+
+    def link_or_copy(self, source: Path, target: Path) -> None:
+        """
+        Hard-link source to target, copying when linking is not possible
+
+        A symbolic link (e.g. into the content store) is recreated as the
+        same symbolic link rather than linked or copied through.
+
+        Args:
+            source: Existing file
+            target: New path (parent directories are created)
+
+        Raises:
+            OSError: If neither linking nor copying succeeds
+        """
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if source.is_symlink():
+            os.symlink(os.readlink(source), target)
+            return
+        try:
+            os.link(source, target)
+        except OSError:
+            fast_copy.copy_file(source, target)
+
+    def replace_directory(self, source: Path, target: Path, retired: Path) -> None:
+        """
+        Put directory source in place of directory target
+
+        The two directories are exchanged atomically where the platform
+        supports it (Linux renameat2); otherwise target is renamed away and
+        source renamed in, leaving a window of microseconds without target.
+        Either way the previous target ends up at retired.
+
+        Args:
+            source: New directory (same filesystem as target)
+            target: Directory to replace
+            retired: Where the previous target is moved to (must not exist)
+
+        Raises:
+            OSError: If the directories could not be swapped; target is left intact
+        """
+        retired.parent.mkdir(parents=True, exist_ok=True)
+
+        if _exchange_paths(source, target):
+            os.rename(source, retired)
+            return
+
+        os.rename(target, retired)
+        try:
+            os.rename(source, target)
+        except OSError:
+            os.rename(retired, target)
+            raise
+
     def get_free_space(self, path: Path) -> int:
         """
         Get free disk space at path in bytes
@@ -422,6 +719,7 @@ class FileManager:
         return {
             'files_copied': len(self.copied_files),
             'directories_created': len(self.created_dirs),
+            'copy_strategies': dict(self.copy_strategies),
             'dry_run': self.dry_run,
             'copied_files': [str(f) for f in self.copied_files],
             'created_directories': [str(d) for d in self.created_dirs]
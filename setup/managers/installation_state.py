@@ -0,0 +1,125 @@
+"""
+Shared snapshot of an installation directory's state files
+Metadata, settings and manifest JSON are parsed once per run and only
+reloaded when the file's inode, mtime or size changes
+"""
+
+import copy
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+# (st_ino, st_mtime_ns, st_size) of the file a parsed document came from
+StatKey = Tuple[int, int, int]
+
+
+class InstallationState:
+    """Parsed state files of one installation directory, validated by stat on every read"""
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize installation state
+
+        Args:
+            install_dir: Installation directory the state files live in
+        """
+        self.install_dir = install_dir
+        self._documents: Dict[Path, Tuple[StatKey, Any]] = {}
+        self._lock = threading.Lock()
+        self.loads = 0  # Number of times a file was actually parsed
+
+    def read(self, path: Path) -> Optional[Any]:
+        """
+        Get the parsed content of a state file
+
+        The returned object is shared by every reader of the directory and
+        must not be modified; copy it first.
+
+        Args:
+            path: JSON file inside the installation directory
+
+        Returns:
+            Parsed JSON, or None if the file doesn't exist
+
+        Raises:
+            json.JSONDecodeError, IOError: If the file can't be parsed
+        """
+        try:
+            key = self._stat_key(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._documents.pop(path, None)
+            return None
+
+        with self._lock:
+            cached = self._documents.get(path)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.loads += 1
+
+            # The file may have changed while it was read; cache it under the
+            # stat taken first so the next read notices and parses it again
+            self._documents[path] = (key, data)
+            return data
+
+    def store(self, path: Path, data: Any) -> None:
+        """
+        Record content just written to a state file, so it isn't parsed back
+
+        Args:
+            path: JSON file that was written
+            data: Content that was written (copied)
+        """
+        try:
+            key = self._stat_key(path)
+        except FileNotFoundError:
+            self.invalidate(path)
+            return
+
+        with self._lock:
+            self._documents[path] = (key, copy.deepcopy(data))
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """
+        Forget a parsed file (or all of them) so the next read reloads it
+
+        Args:
+            path: State file to forget, None for every file
+        """
+        with self._lock:
+            if path is None:
+                self._documents.clear()
+            else:
+                self._documents.pop(path, None)
+
+    @staticmethod
+    def _stat_key(path: Path) -> StatKey:
+        """Identity of the file's current content"""
+        file_stat = os.stat(path)
+        return (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+# One state per installation directory, shared by every SettingsManager of the run
+_installation_states: Dict[str, InstallationState] = {}
+_installation_states_guard = threading.Lock()
+
+
+def get_installation_state(install_dir: Path) -> InstallationState:
+    """Get the shared state snapshot of an installation directory"""
+    key = str(Path(install_dir).absolute())
+    with _installation_states_guard:
+        if key not in _installation_states:
+            _installation_states[key] = InstallationState(Path(install_dir))
+        return _installation_states[key]
+
+
+def reset_installation_states() -> None:
+    """Drop every cached state snapshot"""
+    with _installation_states_guard:
+        _installation_states.clear()
@@ -6,11 +6,31 @@ Allows for manipulation of these json files with deep merge and backup
 
 import json
 import shutil
+import threading
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from datetime import datetime
 import copy
 
+from .installation_state import get_installation_state
+from ..utils.journal import journaled
+from ..utils.profiler import get_profiler
+
+
+# Metadata and settings updates are read-modify-write; components installed in
+# parallel share one lock per installation directory
+_install_dir_locks: Dict[str, threading.RLock] = {}
+_install_dir_locks_guard = threading.Lock()
+
+
+def _get_install_dir_lock(install_dir: Path) -> threading.RLock:
+    """Get the lock serializing settings/metadata updates for an installation directory"""
+    key = str(Path(install_dir).absolute())
+    with _install_dir_locks_guard:
+        if key not in _install_dir_locks:
+            _install_dir_locks[key] = threading.RLock()
+        return _install_dir_locks[key]
+
 
 class SettingsManager:
     """Manages settings.json file operations"""
@@ -25,7 +45,10 @@ class SettingsManager:
         self.install_dir = install_dir
         self.settings_file = install_dir / "settings.json"
         self.metadata_file = install_dir / ".superclaude-metadata.json"
+        self.manifest_file = install_dir / ".superclaude-manifest.json"
         self.backup_dir = install_dir / "backups" / "settings"
+        self._lock = _get_install_dir_lock(install_dir)
+        self.state = get_installation_state(install_dir)
         
     def load_settings(self) -> Dict[str, Any]:
         """
@@ -34,12 +57,12 @@ class SettingsManager:
         Returns:
             Settings dict (empty if file doesn't exist)
         """
-        if not self.settings_file.exists():
-            return {}
-        
+        return copy.deepcopy(self._read_settings())
+    
+    def _read_settings(self) -> Dict[str, Any]:
+        """Shared, read-only settings snapshot (empty if the file doesn't exist)"""
         try:
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self.state.read(self.settings_file) or {}
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(f"Could not load settings from {self.settings_file}: {e}")
     
@@ -51,19 +74,22 @@ class SettingsManager:
             settings: Settings dict to save
             create_backup: Whether to create backup before saving
         """
-        # Create backup if requested and file exists
-        if create_backup and self.settings_file.exists():
-            self._create_settings_backup()
+        with self._lock:
+            # Create backup if requested and file exists
+            if create_backup and self.settings_file.exists():
+                self._create_settings_backup()
         
-        # Ensure directory exists
-        self.settings_file.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure directory exists
+            self.settings_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save with pretty formatting
-        try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
-            raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
+            # Save with pretty formatting
+            try:
+                with journaled("write", path=str(self.settings_file), existed=self.settings_file.exists()):
+                    with open(self.settings_file, 'w', encoding='utf-8') as f:
+                        json.dump(settings, f, indent=2, ensure_ascii=False, sort_keys=True)
+                self.state.store(self.settings_file, settings)
+            except IOError as e:
+                raise ValueError(f"Could not save settings to {self.settings_file}: {e}")
     
     def load_metadata(self) -> Dict[str, Any]:
         """
@@ -72,12 +98,12 @@ class SettingsManager:
         Returns:
             Metadata dict (empty if file doesn't exist)
         """
-        if not self.metadata_file.exists():
-            return {}
-        
+        return copy.deepcopy(self._read_metadata())
+    
+    def _read_metadata(self) -> Dict[str, Any]:
+        """Shared, read-only metadata snapshot (empty if the file doesn't exist)"""
         try:
-            with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return self.state.read(self.metadata_file) or {}
         except (json.JSONDecodeError, IOError) as e:
             raise ValueError(f"Could not load metadata from {self.metadata_file}: {e}")
     
@@ -88,15 +114,19 @@ class SettingsManager:
         Args:
             metadata: Metadata dict to save
         """
-        # Ensure directory exists
-        self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            # Ensure directory exists
+            self.metadata_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save with pretty formatting
-        try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
-        except IOError as e:
-            raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
+            # Save with pretty formatting
+            try:
+                with get_profiler().phase("metadata_write"), \
+                        journaled("write", path=str(self.metadata_file), existed=self.metadata_file.exists()):
+                    with open(self.metadata_file, 'w', encoding='utf-8') as f:
+                        json.dump(metadata, f, indent=2, ensure_ascii=False, sort_keys=True)
+                self.state.store(self.metadata_file, metadata)
+            except IOError as e:
+                raise ValueError(f"Could not save metadata to {self.metadata_file}: {e}")
 
     def merge_metadata(self, modifications: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -119,8 +149,9 @@ class SettingsManager:
             modifications: Settings modifications to apply
             create_backup: Whether to create backup before updating
         """
-        merged = self.merge_metadata(modifications)
-        self.save_metadata(merged)
+        with self._lock:
+            merged = self.merge_metadata(modifications)
+            self.save_metadata(merged)
 
     def migrate_superclaude_data(self) -> bool:
         """
@@ -129,36 +160,37 @@ class SettingsManager:
         Returns:
             True if migration occurred, False if no data to migrate
         """
-        settings = self.load_settings()
+        with self._lock:
+            settings = self.load_settings()
         
-        # SuperClaude-specific fields to migrate
-        superclaude_fields = ["components", "framework", "superclaude", "mcp"]
-        data_to_migrate = {}
-        fields_found = False
+            # SuperClaude-specific fields to migrate
+            superclaude_fields = ["components", "framework", "superclaude", "mcp"]
+            data_to_migrate = {}
+            fields_found = False
         
-        # Extract SuperClaude data
-        for field in superclaude_fields:
-            if field in settings:
-                data_to_migrate[field] = settings[field]
-                fields_found = True
+            # Extract SuperClaude data
+            for field in superclaude_fields:
+                if field in settings:
+                    data_to_migrate[field] = settings[field]
+                    fields_found = True
         
-        if not fields_found:
-            return False
+            if not fields_found:
+                return False
         
-        # Load existing metadata (if any) and merge
-        existing_metadata = self.load_metadata()
-        merged_metadata = self._deep_merge(existing_metadata, data_to_migrate)
+            # Load existing metadata (if any) and merge
+            existing_metadata = self.load_metadata()
+            merged_metadata = self._deep_merge(existing_metadata, data_to_migrate)
         
-        # Save to metadata file
-        self.save_metadata(merged_metadata)
+            # Save to metadata file
+            self.save_metadata(merged_metadata)
         
-        # Remove SuperClaude fields from settings
-        clean_settings = {k: v for k, v in settings.items() if k not in superclaude_fields}
+            # Remove SuperClaude fields from settings
+            clean_settings = {k: v for k, v in settings.items() if k not in superclaude_fields}
         
-        # Save cleaned settings
-        self.save_settings(clean_settings, create_backup=True)
+            # Save cleaned settings
+            self.save_settings(clean_settings, create_backup=True)
         
-        return True
+            return True
     
     def merge_settings(self, modifications: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -181,8 +213,26 @@ class SettingsManager:
             modifications: Settings modifications to apply
             create_backup: Whether to create backup before updating
         """
-        merged = self.merge_settings(modifications)
-        self.save_settings(merged, create_backup)
+        with self._lock:
+            merged = self.merge_settings(modifications)
+            self.save_settings(merged, create_backup)
+    
+    def replace_settings_keys(self, changed: Dict[str, Any], removed: List[str],
+                              create_backup: bool = True) -> None:
+        """
+        Set and remove top-level settings, keeping every other key as currently on disk
+        
+        Args:
+            changed: Top-level keys to set
+            removed: Top-level keys to remove
+            create_backup: Whether to create backup before updating
+        """
+        with self._lock:
+            settings = self.load_settings()
+            for key in removed:
+                settings.pop(key, None)
+            settings.update(copy.deepcopy(changed))
+            self.save_settings(settings, create_backup)
     
     def get_setting(self, key_path: str, default: Any = None) -> Any:
         """
@@ -195,13 +245,11 @@ class SettingsManager:
         Returns:
             Setting value or default
         """
-        settings = self.load_settings()
-        
         try:
-            value = settings
+            value = self._read_settings()
             for key in key_path.split('.'):
                 value = value[key]
-            return value
+            return copy.deepcopy(value)
         except (KeyError, TypeError):
             return default
     
@@ -238,25 +286,26 @@ class SettingsManager:
         Returns:
             True if setting was removed, False if not found
         """
-        settings = self.load_settings()
-        keys = key_path.split('.')
+        with self._lock:
+            settings = self.load_settings()
+            keys = key_path.split('.')
         
-        # Navigate to parent of target key
-        current = settings
-        try:
-            for key in keys[:-1]:
-                current = current[key]
+            # Navigate to parent of target key
+            current = settings
+            try:
+                for key in keys[:-1]:
+                    current = current[key]
             
-            # Remove the target key
-            if keys[-1] in current:
-                del current[keys[-1]]
-                self.save_settings(settings, create_backup)
-                return True
-            else:
-                return False
+                # Remove the target key
+                if keys[-1] in current:
+                    del current[keys[-1]]
+                    self.save_settings(settings, create_backup)
+                    return True
+                else:
+                    return False
                 
-        except (KeyError, TypeError):
-            return False
+            except (KeyError, TypeError):
+                return False
     
     def add_component_registration(self, component_name: str, component_info: Dict[str, Any]) -> None:
         """
@@ -266,16 +315,17 @@ class SettingsManager:
             component_name: Name of component
             component_info: Component metadata dict
         """
-        metadata = self.load_metadata()
-        if "components" not in metadata:
-            metadata["components"] = {}
+        with self._lock:
+            metadata = self.load_metadata()
+            if "components" not in metadata:
+                metadata["components"] = {}
         
-        metadata["components"][component_name] = {
-            **component_info,
-            "installed_at": datetime.now().isoformat()
-        }
+            metadata["components"][component_name] = {
+                **component_info,
+                "installed_at": datetime.now().isoformat()
+            }
         
-        self.save_metadata(metadata)
+            self.save_metadata(metadata)
     
     def remove_component_registration(self, component_name: str) -> bool:
         """
@@ -287,12 +337,122 @@ class SettingsManager:
         Returns:
             True if component was removed, False if not found
         """
-        metadata = self.load_metadata()
-        if "components" in metadata and component_name in metadata["components"]:
-            del metadata["components"][component_name]
-            self.save_metadata(metadata)
-            return True
-        return False
+        with self._lock:
+            metadata = self.load_metadata()
+            if "components" in metadata and component_name in metadata["components"]:
+                del metadata["components"][component_name]
+                self.save_metadata(metadata)
+                self.set_component_manifest(component_name, {})
+                return True
+            return False
+    
+    def _load_manifest_file(self) -> Dict[str, Any]:
+        """Load .superclaude-manifest.json (empty if missing or unreadable)"""
+        return copy.deepcopy(self._read_manifest_file())
+    
+    def _read_manifest_file(self) -> Dict[str, Any]:
+        """Shared, read-only manifest snapshot (empty if missing or unreadable)"""
+        try:
+            data = self.state.read(self.manifest_file)
+            return data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, IOError):
+            # A damaged manifest only costs a full recopy
+            return {}
+    
+    def _save_manifest_file(self, data: Dict[str, Any]) -> None:
+        """Write .superclaude-manifest.json"""
+        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with journaled("write", path=str(self.manifest_file), existed=self.manifest_file.exists()):
+                with open(self.manifest_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, sort_keys=True)
+            self.state.store(self.manifest_file, data)
+        except IOError as e:
+            raise ValueError(f"Could not save manifest to {self.manifest_file}: {e}")
+    
+    def load_manifest(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Load the installed file manifest from .superclaude-manifest.json
+        
+        Returns:
+            Dict of component_name -> relative path -> {size, mtime, sha256}
+            (empty if the file doesn't exist or is unreadable)
+        """
+        return copy.deepcopy(self._read_manifest_file().get("components", {}))
+    
+    def get_component_manifest(self, component_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get manifest entries of one component
+        
+        Args:
+            component_name: Name of component
+            
+        Returns:
+            Dict of relative path -> {size, mtime, sha256}
+        """
+        return copy.deepcopy(self._read_manifest_file().get("components", {}).get(component_name, {}))
+    
+    def set_component_manifest(self, component_name: str, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Replace manifest entries of one component
+        
+        Args:
+            component_name: Name of component
+            entries: Dict of relative path -> {size, mtime, sha256}; empty removes the component
+        """
+        with self._lock:
+            data = self._load_manifest_file()
+            components = data.setdefault("components", {})
+            if entries:
+                components[component_name] = entries
+            elif component_name in components:
+                del components[component_name]
+            else:
+                return
+        
+            self._save_manifest_file(data)
+    
+    def get_throughput_model(self) -> Dict[str, Any]:
+        """
+        Get the copy throughput measured by previous installs into this directory
+        
+        Returns:
+            Dict with per_file_seconds, bytes_per_second and samples (empty if never measured)
+        """
+        return copy.deepcopy(self._read_manifest_file().get("throughput", {}))
+    
+    def set_throughput_model(self, model: Dict[str, Any]) -> None:
+        """
+        Store the copy throughput model
+        
+        Args:
+            model: Dict with per_file_seconds, bytes_per_second and samples
+        """
+        with self._lock:
+            data = self._load_manifest_file()
+            data["throughput"] = model
+            self._save_manifest_file(data)
+    
+    def get_content_store(self) -> Dict[str, Any]:
+        """
+        Get the content store installed files are linked from
+        
+        Returns:
+            Dict with path and link_mode (empty if files were only ever copied)
+        """
+        return copy.deepcopy(self._read_manifest_file().get("store", {}))
+    
+    def set_content_store(self, store: Dict[str, Any]) -> None:
+        """
+        Record the content store installed files are linked from
+        
+        Args:
+            store: Dict with path and link_mode
+        """
+        with self._lock:
+            data = self._load_manifest_file()
+            data["store"] = store
+            self._save_manifest_file(data)
     
     def get_installed_components(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -301,8 +461,7 @@ class SettingsManager:
         Returns:
             Dict of component_name -> component_info
         """
-        metadata = self.load_metadata()
-        return metadata.get("components", {})
+        return copy.deepcopy(self._read_metadata().get("components", {}))
     
     def is_component_installed(self, component_name: str) -> bool:
         """
@@ -314,8 +473,7 @@ class SettingsManager:
         Returns:
             True if component is installed, False otherwise
         """
-        components = self.get_installed_components()
-        return component_name in components
+        return component_name in self._read_metadata().get("components", {})
     
     def get_component_version(self, component_name: str) -> Optional[str]:
         """
@@ -327,8 +485,7 @@ class SettingsManager:
         Returns:
             Version string or None if not installed
         """
-        components = self.get_installed_components()
-        component_info = components.get(component_name, {})
+        component_info = self._read_metadata().get("components", {}).get(component_name, {})
         return component_info.get("version")
     
     def update_framework_version(self, version: str) -> None:
@@ -338,14 +495,15 @@ class SettingsManager:
         Args:
             version: Framework version string
         """
-        metadata = self.load_metadata()
-        if "framework" not in metadata:
-            metadata["framework"] = {}
+        with self._lock:
+            metadata = self.load_metadata()
+            if "framework" not in metadata:
+                metadata["framework"] = {}
         
-        metadata["framework"]["version"] = version
-        metadata["framework"]["updated_at"] = datetime.now().isoformat()
+            metadata["framework"]["version"] = version
+            metadata["framework"]["updated_at"] = datetime.now().isoformat()
         
-        self.save_metadata(metadata)
+            self.save_metadata(metadata)
     
     def check_installation_exists(self) -> bool:
         """
@@ -376,13 +534,11 @@ class SettingsManager:
         Returns:
             Metadata value or default
         """
-        metadata = self.load_metadata()
-        
         try:
-            value = metadata
+            value = self._read_metadata()
             for key in key_path.split('.'):
                 value = value[key]
-            return value
+            return copy.deepcopy(value)
         except (KeyError, TypeError):
             return default
     
@@ -509,6 +665,7 @@ class SettingsManager:
             
             # Restore backup
             shutil.copy2(backup_file, self.settings_file)
+            self.state.invalidate(self.settings_file)
             return True
             
         except (json.JSONDecodeError, IOError):
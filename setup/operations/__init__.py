@@ -13,10 +13,11 @@ Available operations:
 - update: Update existing SuperClaude installation
 - uninstall: Remove SuperClaude framework installation  
 - backup: Backup and restore SuperClaude installations
+- serve: Run a persistent daemon answering operation requests over a Unix socket
 """
 
 __version__ = "3.0.0"
-__all__ = ["install", "update", "uninstall", "backup"]
+__all__ = ["install", "update", "uninstall", "backup", "serve"]
 
 
 def get_operation_info():
@@ -41,10 +42,252 @@ def get_operation_info():
             "name": "backup",
             "description": "Backup and restore SuperClaude installations",
             "module": "setup.operations.backup"
+        },
+        "serve": {
+            "name": "serve",
+            "description": "Run a persistent SuperClaude daemon over a Unix socket",
+            "module": "setup.operations.serve"
         }
     }
 
 
+# Shared, lazily created runtime objects. A one-shot CLI run builds each of
+# them once; the serve daemon keeps them warm across requests.
+_shared_registry = None
+_shared_config_manager = None
+_shared_validator = None
+
+
+def get_component_registry():
+    """Get the shared ComponentRegistry with components already discovered"""
+    global _shared_registry
+    if _shared_registry is None:
+        from ..core.registry import ComponentRegistry
+        from .. import PROJECT_ROOT
+        _shared_registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
+    _shared_registry.discover_components()
+    return _shared_registry
+
+
+def get_config_manager():
+    """Get the shared ConfigManager (features/requirements cached after first load)"""
+    global _shared_config_manager
+    if _shared_config_manager is None:
+        from ..managers.config_manager import ConfigManager
+        from .. import PROJECT_ROOT
+        _shared_config_manager = ConfigManager(PROJECT_ROOT / "config")
+    return _shared_config_manager
+
+
+def get_validator():
+    """Get the shared Validator (tool checks cached after first run)"""
+    global _shared_validator
+    if _shared_validator is None:
+        from ..core.validator import Validator
+        _shared_validator = Validator()
+    return _shared_validator
+
+
+def reset_shared_state() -> None:
+    """Drop the shared registry, config, validator, state snapshots and source listings so they are rebuilt on next use"""
+    from ..managers.installation_state import reset_installation_states
+    from ..base.file_spec import reset_source_trees
+
+    global _shared_registry, _shared_config_manager, _shared_validator
+    reset_installation_states()
+    reset_source_trees()
+    _shared_registry = None
+    _shared_config_manager = None
+    _shared_validator = None
+
+
+def add_fleet_arguments(parser) -> None:
+    """Add options for running an operation against many installation directories"""
+    from pathlib import Path
+
+    parser.add_argument(
+        "--targets-file",
+        type=Path,
+        help="Run against every installation directory listed in FILE (one per line, '#' comments); "
+             "asks once before changing them unless --yes is given"
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Maximum targets processed in parallel with --targets-file (default: CPU count)"
+    )
+
+
+def run_fleet_operation(operation_name: str, args, prepare=None, confirm_first: bool = True) -> int:
+    """
+    Run an operation against every directory in args.targets_file
+
+    Registry discovery, configuration loading, the optional prepare step and
+    the confirmation happen once in this process; each target then runs
+    non-interactively in a worker process.
+
+    Args:
+        operation_name: Operation module name (e.g. "install")
+        args: Parsed CLI arguments
+        prepare: Optional callable(args) -> bool run once before fan-out
+        confirm_first: Ask once before changing the targets (skipped with --yes or --dry-run)
+
+    Returns:
+        Exit code (0 only if every target succeeded)
+    """
+    from ..core.fleet import FleetRunner, load_targets_file
+    from ..utils.logger import get_logger
+    from ..utils.events import get_event_emitter
+    from ..utils.ui import display_table, display_success, display_error, confirm, Colors
+
+    logger = get_logger()
+
+    try:
+        targets = load_targets_file(args.targets_file)
+    except OSError as e:
+        logger.error(f"Could not read targets file {args.targets_file}: {e}")
+        return 1
+
+    if not targets:
+        logger.error(f"No installation directories listed in {args.targets_file}")
+        return 1
+
+    if args.max_workers is not None and args.max_workers < 1:
+        logger.error("--max-workers must be at least 1")
+        return 1
+
+    # Shared state is built once here and inherited by the workers
+    get_component_registry()
+    config_manager = get_config_manager()
+    config_manager.load_features()
+    config_manager.load_requirements()
+    get_validator()
+
+    if prepare is not None and not prepare(args):
+        return 1
+
+    # Workers can't prompt, so the whole fleet is confirmed once here
+    if confirm_first and not args.yes and not args.dry_run and not getattr(args, "no_confirm", False):
+        if not args.quiet:
+            print(f"\n{Colors.CYAN}{Colors.BRIGHT}Targets:{Colors.RESET}")
+            for target in targets:
+                print(f"  {target}")
+            print()
+        if not confirm(f"Run {operation_name} on all {len(targets)} targets?", default=False):
+            logger.info(f"Fleet {operation_name} cancelled by user")
+            return 0
+
+    logger.info(f"Running {operation_name} on {len(targets)} targets")
+
+    emitter = get_event_emitter()
+
+    def report(result):
+        for event in result["events"]:
+            emitter.emit_raw({**event, "target": result["target"]})
+        emitter.emit("target_end", target=result["target"], exit_code=result["exit_code"],
+                     success=result["success"], duration_ms=round(result["duration"] * 1000, 3))
+
+        if result["success"]:
+            logger.success(f"{result['target']} ({result['duration']:.1f}s)")
+        else:
+            logger.error(f"{result['target']} failed (exit code {result['exit_code']})")
+
+    runner = FleetRunner(operation_name, args, args.max_workers)
+    summary = runner.run(targets, on_result=report)
+
+    emitter.emit("summary", operation=operation_name, success=summary["failed"] == 0,
+                 targets=len(targets), succeeded=summary["succeeded"], failed=summary["failed"],
+                 workers=summary["workers"], wall_time_ms=round(summary["wall_time"] * 1000, 3),
+                 target_time_ms=round(summary["target_time"] * 1000, 3))
+
+    for result in summary["results"]:
+        if args.verbose or not result["success"]:
+            print(f"\n{Colors.CYAN}--- {result['target']} ---{Colors.RESET}")
+            print(result["output"].rstrip())
+
+    if not args.quiet:
+        rows = [
+            [result["target"], "ok" if result["success"] else f"failed ({result['exit_code']})",
+             f"{result['duration']:.2f}s"]
+            for result in summary["results"]
+        ]
+        display_table(["Target", "Result", "Time"], rows, title=f"Fleet {operation_name} results")
+        print(f"{Colors.BLUE}Wall time:{Colors.RESET} {summary['wall_time']:.2f}s "
+              f"({summary['workers']} workers, {summary['target_time']:.2f}s total target time, "
+              f"{summary['speedup']:.1f}x)")
+
+    if summary["failed"]:
+        display_error(f"{summary['failed']} of {len(targets)} targets failed")
+        return 1
+
+    if not args.quiet:
+        display_success(f"{operation_name.capitalize()} completed on all {len(targets)} targets")
+    return 0
+
+
+def report_planned_changes(installer, component_names, quiet: bool = False) -> dict:
+    """
+    Show what installing the components would change (for --dry-run)
+
+    The report is emitted as a "dry_run_plan" event for --output jsonl and
+    printed as text unless quiet.
+
+    Args:
+        installer: Installer with the components registered
+        component_names: Components to install
+        quiet: Skip the human-readable report
+
+    Returns:
+        The change report from Installer.get_change_report()
+    """
+    from ..utils.events import get_event_emitter
+
+    if installer.plan is None:
+        installer.build_plan(component_names)
+
+    report = installer.get_change_report()
+    get_event_emitter().emit("dry_run_plan", **report)
+
+    if not quiet:
+        display_change_report(report)
+    return report
+
+
+def display_change_report(report: dict) -> None:
+    """Print a change report from Installer.get_change_report()"""
+    from ..utils.ui import Colors, format_size
+
+    symbols = {"add": f"{Colors.GREEN}+", "modify": f"{Colors.YELLOW}~", "delete": f"{Colors.RED}-"}
+
+    print(f"\n{Colors.CYAN}{Colors.BRIGHT}Planned changes{Colors.RESET} ({report['install_dir']})")
+    print("=" * 50)
+
+    for name, changes in report["components"].items():
+        if not changes["files"] and not changes["metadata_keys"]:
+            print(f"{Colors.BLUE}{name}:{Colors.RESET} up to date")
+            continue
+
+        print(f"{Colors.BLUE}{name}:{Colors.RESET} {changes['add']} to add, {changes['modify']} to modify, "
+              f"{changes['delete']} to delete ({format_size(changes['bytes'])} to write)")
+        for change in changes["files"]:
+            print(f"  {symbols[change['action']]} {change['path']}{Colors.RESET} ({format_size(change['bytes'])})")
+        if changes["metadata_keys"]:
+            print(f"  metadata: {', '.join(changes['metadata_keys'])}")
+
+    totals = report["totals"]
+    model = report["throughput_model"]
+    source = "measured" if model["measured"] else "default"
+    print(f"\n{Colors.BLUE}Total:{Colors.RESET} {totals['add']} to add, {totals['modify']} to modify, "
+          f"{totals['delete']} to delete, {format_size(totals['bytes'])} to write")
+    seconds = report["estimated_seconds"]
+    estimate = f"{seconds:.1f}s" if seconds >= 1 else f"{seconds * 1000:.1f}ms"
+    print(f"{Colors.BLUE}Estimated time:{Colors.RESET} {estimate} "
+          f"({source} throughput: {model['per_file_seconds'] * 1000:.2f} ms/file, "
+          f"{format_size(int(model['bytes_per_second']))}/s)")
+    print()
+
+
 class OperationBase:
     """Base class for all operations providing common functionality"""
     
@@ -13,13 +13,15 @@ from typing import List, Optional, Dict, Any, Tuple
 import argparse
 
 from ..managers.settings_manager import SettingsManager
+from ..managers.installation_state import get_installation_state
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ..utils.logger import get_logger
+from ..utils.events import get_event_emitter
 from .. import DEFAULT_INSTALL_DIR
-from . import OperationBase
+from . import OperationBase, add_fleet_arguments, run_fleet_operation
 
 
 class BackupOperation(OperationBase):
@@ -125,6 +127,9 @@ Examples:
         help="Remove backups older than N days"
     )
     
+    # Fleet options
+    add_fleet_arguments(parser)
+    
     return parser
 
 
@@ -332,6 +337,9 @@ def create_backup(args: argparse.Namespace) -> bool:
         logger.info(f"Backup file: {backup_file}")
         logger.info(f"Files archived: {files_added}")
         logger.info(f"Backup size: {format_size(file_size)}")
+        get_event_emitter().emit("summary", operation="backup", success=True,
+                                 duration_ms=round(duration * 1000, 3), backup_path=str(backup_file),
+                                 files_archived=files_added, bytes=file_size)
         
         return True
         
@@ -398,6 +406,9 @@ def restore_backup(backup_path: Path, args: argparse.Namespace) -> bool:
                 except Exception as e:
                     logger.warning(f"Could not restore {member.name}: {e}")
         
+        # Restored state files keep their archived mtimes; don't trust cached parses
+        get_installation_state(args.install_dir).invalidate()
+        
         duration = time.time() - start_time
         
         logger.success(f"Restore completed successfully in {duration:.1f} seconds")
@@ -488,6 +499,10 @@ def run(args: argparse.Namespace) -> int:
     operation = BackupOperation()
     operation.setup_operation_logging(args)
     logger = get_logger()
+    if args.targets_file:
+        # Listing and inspecting backups change nothing, so only those skip the confirmation
+        return run_fleet_operation("backup", args, confirm_first=bool(args.restore or args.cleanup))
+    
     # ✅ Inserted validation code
     expected_home = Path.home().resolve()
     actual_dir = args.install_dir.resolve()
@@ -12,14 +12,21 @@ import argparse
 from ..base.installer import Installer
 from ..core.registry import ComponentRegistry
 from ..managers.config_manager import ConfigManager
+from ..managers.content_store import LINK_MODES, LINK_MODE_COPY
 from ..core.validator import Validator
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ..utils.logger import get_logger
-from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
-from . import OperationBase
+from ..utils.events import get_event_emitter
+from ..utils.profiler import get_profiler
+from ..utils.journal import InstallJournal
+from .. import DEFAULT_INSTALL_DIR, DEFAULT_STORE_DIR, PROJECT_ROOT
+from . import (
+    OperationBase, add_fleet_arguments, run_fleet_operation, get_component_registry,
+    get_config_manager, get_validator, report_planned_changes
+)
 
 
 class InstallOperation(OperationBase):
@@ -44,6 +51,8 @@ Examples:
   SuperClaude install --profile developer      # Developer profile  
   SuperClaude install --components core mcp    # Specific components
   SuperClaude install --verbose --force        # Verbose with force mode
+  SuperClaude install --quick --targets-file hosts.txt  # Install into many directories
+  SuperClaude install --resume                 # Finish an interrupted installation
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         parents=parents
@@ -82,6 +91,12 @@ Examples:
         help="Skip backup creation"
     )
     
+    parser.add_argument(
+        "--full-backup",
+        action="store_true",
+        help="Archive the whole installation directory before writing, not just the files being replaced"
+    )
+    
     parser.add_argument(
         "--list-components",
         action="store_true",
@@ -94,6 +109,52 @@ Examples:
         help="Run system diagnostics and show installation help"
     )
     
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=4,
+        help="Components of the same dependency level installed in parallel (default: 4, 1 = serial)"
+    )
+    
+    parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="Write components directly into the install directory instead of staging and swapping them in"
+    )
+    
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        default=LINK_MODE_COPY,
+        help="Copy files, or store them once in a shared content store and hard- or "
+             "symlink them into the install directory (default: copy). Linked files share "
+             "the stored copy: editing one in place (e.g. as root) changes it for every "
+             "install linking it until the next install repairs it"
+    )
+    
+    parser.add_argument(
+        "--store",
+        type=Path,
+        default=DEFAULT_STORE_DIR,
+        help=f"Content store for --link-mode hardlink/symlink (default: {DEFAULT_STORE_DIR})"
+    )
+    
+    recovery_group = parser.add_mutually_exclusive_group()
+    recovery_group.add_argument(
+        "--resume",
+        action="store_true",
+        help="Finish an interrupted installation from its journal, skipping the work already done"
+    )
+    
+    recovery_group.add_argument(
+        "--rollback",
+        action="store_true",
+        help="Undo the partial changes of an interrupted installation"
+    )
+    
+    # Fleet options
+    add_fleet_arguments(parser)
+    
     return parser
 
 
@@ -105,7 +166,7 @@ def validate_system_requirements(validator: Validator, component_names: List[str
     
     try:
         # Load requirements configuration
-        config_manager = ConfigManager(PROJECT_ROOT / "config")
+        config_manager = get_config_manager()
         requirements = config_manager.get_requirements_for_components(component_names)
         
         # Validate requirements
@@ -236,46 +297,36 @@ def interactive_component_selection(registry: ComponentRegistry, config_manager:
         return None
 
 
-def display_installation_plan(components: List[str], registry: ComponentRegistry, install_dir: Path) -> None:
+def display_installation_plan(installer: Installer, registry: ComponentRegistry) -> None:
     """Display installation plan"""
-    logger = get_logger()
+    plan = installer.plan
     
     print(f"\n{Colors.CYAN}{Colors.BRIGHT}Installation Plan{Colors.RESET}")
     print("=" * 50)
     
-    # Resolve dependencies
-    try:
-        ordered_components = registry.resolve_dependencies(components)
-        
-        print(f"{Colors.BLUE}Installation Directory:{Colors.RESET} {install_dir}")
-        print(f"{Colors.BLUE}Components to install:{Colors.RESET}")
-        
-        total_size = 0
-        for i, component_name in enumerate(ordered_components, 1):
-            metadata = registry.get_component_metadata(component_name)
-            if metadata:
-                description = metadata.get("description", "No description")
-                print(f"  {i}. {component_name} - {description}")
-                
-                # Get size estimate if component supports it
-                try:
-                    instance = registry.get_component_instance(component_name, install_dir)
-                    if instance and hasattr(instance, 'get_size_estimate'):
-                        size = instance.get_size_estimate()
-                        total_size += size
-                except Exception:
-                    pass
-            else:
-                print(f"  {i}. {component_name} - Unknown component")
-        
-        if total_size > 0:
-            print(f"\n{Colors.BLUE}Estimated size:{Colors.RESET} {format_size(total_size)}")
-        
-        print()
+    print(f"{Colors.BLUE}Installation Directory:{Colors.RESET} {plan.install_dir}")
+    print(f"{Colors.BLUE}Components to install:{Colors.RESET}")
+    
+    total_size = 0
+    for i, component_name in enumerate(plan.order, 1):
+        metadata = registry.get_component_metadata(component_name)
+        if metadata:
+            description = metadata.get("description", "No description")
+            print(f"  {i}. {component_name} - {description}")
+        else:
+            print(f"  {i}. {component_name} - Unknown component")
         
-    except Exception as e:
-        logger.error(f"Could not resolve dependencies: {e}")
-        raise
+        # Size estimates come from the plan (plus per-component overhead)
+        try:
+            total_size += installer.components[component_name].get_size_estimate()
+        except Exception:
+            pass
+    
+    print(f"{Colors.BLUE}Files to install:{Colors.RESET} {plan.total_files}")
+    if total_size > 0:
+        print(f"\n{Colors.BLUE}Estimated size:{Colors.RESET} {format_size(total_size)}")
+    
+    print()
 
 
 def run_system_diagnostics(validator: Validator) -> None:
@@ -331,33 +382,45 @@ def run_system_diagnostics(validator: Validator) -> None:
         print("  3. Run 'SuperClaude install --diagnose' again to verify")
 
 
-def perform_installation(components: List[str], args: argparse.Namespace) -> bool:
+def create_installer(components: List[str], args: argparse.Namespace) -> Optional[Installer]:
+    """Create the installer with its components registered and the install plan built"""
+    logger = get_logger()
+    
+    # Create installer
+    installer = Installer(args.install_dir, dry_run=args.dry_run, jobs=args.jobs,
+                          staged=not args.in_place)
+    if args.resume:
+        installer.prepare_resume()
+    
+    # Create component instances
+    component_instances = get_component_registry().create_component_instances(components, args.install_dir)
+    
+    if not component_instances:
+        logger.error("No valid component instances created")
+        return None
+    
+    # Register components with installer
+    installer.register_components(list(component_instances.values()))
+    
+    try:
+        installer.build_plan(components)
+    except ValueError as e:
+        logger.error(f"Could not resolve dependencies: {e}")
+        return None
+    
+    return installer
+
+
+def perform_installation(installer: Installer, args: argparse.Namespace) -> bool:
     """Perform the actual installation"""
     logger = get_logger()
     start_time = time.time()
     
     try:
-        # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
-        
-        # Create component registry
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
-        
-        # Create component instances
-        component_instances = registry.create_component_instances(components, args.install_dir)
-        
-        if not component_instances:
-            logger.error("No valid component instances created")
-            return False
-        
-        # Register components with installer
-        installer.register_components(list(component_instances.values()))
-        
-        # Resolve dependencies
-        ordered_components = registry.resolve_dependencies(components)
+        ordered_components = list(installer.plan.order)
         
         # Setup progress tracking
+        emitter = get_event_emitter()
         progress = ProgressBar(
             total=len(ordered_components),
             prefix="Installing: ",
@@ -370,23 +433,34 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
         config = {
             "force": args.force,
             "backup": not args.no_backup,
-            "dry_run": args.dry_run
+            "full_backup": args.full_backup,
+            "dry_run": args.dry_run,
+            "link_mode": args.link_mode,
+            "store": str(args.store.expanduser().resolve())
         }
         
-        success = installer.install_components(ordered_components, config)
+        if args.dry_run:
+            report_planned_changes(installer, ordered_components, quiet=args.quiet)
         
-        # Update progress
-        for i, component_name in enumerate(ordered_components):
-            if component_name in installer.installed_components:
-                progress.update(i + 1, f"Installed {component_name}")
-            else:
-                progress.update(i + 1, f"Failed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
+        success = installer.install_components(ordered_components, config)
         
-        progress.finish("Installation complete")
+        # Update progress (structured output reports components as events instead)
+        if not emitter.enabled:
+            for i, component_name in enumerate(ordered_components):
+                if component_name in installer.installed_components:
+                    progress.update(i + 1, f"Installed {component_name}")
+                elif component_name in installer.skipped_components:
+                    progress.update(i + 1, f"Up to date {component_name}")
+                else:
+                    progress.update(i + 1, f"Failed {component_name}")
+                time.sleep(0.1)  # Brief pause for visual effect
+            
+            progress.finish("Installation complete")
         
         # Show results
         duration = time.time() - start_time
+        emitter.emit("summary", operation="install", success=success, duration_ms=round(duration * 1000, 3),
+                     files_copied=installer.get_files_copied(), **installer.get_installation_summary())
         
         if success:
             logger.success(f"Installation completed successfully in {duration:.1f} seconds")
@@ -396,6 +470,9 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
             if summary['installed']:
                 logger.info(f"Installed components: {', '.join(summary['installed'])}")
             
+            if summary['skipped']:
+                logger.info(f"Already up to date: {', '.join(summary['skipped'])}")
+            
             if summary['backup_path']:
                 logger.info(f"Backup created: {summary['backup_path']}")
                 
@@ -413,11 +490,107 @@ def perform_installation(components: List[str], args: argparse.Namespace) -> boo
         return False
 
 
+def apply_resume_arguments(args: argparse.Namespace) -> bool:
+    """Take components and options of the interrupted installation from its journal"""
+    logger = get_logger()
+    
+    state = InstallJournal(args.install_dir).get_state()
+    if state is None:
+        logger.error(f"No interrupted installation to resume in {args.install_dir}")
+        return False
+    
+    begin = state["begin"]
+    config = begin.get("config", {})
+    args.components = begin["components"]
+    args.in_place = not begin.get("staged", False)
+    args.jobs = begin.get("jobs", args.jobs)
+    args.force = args.force or config.get("force", False)
+    args.no_backup = not config.get("backup", True)
+    args.full_backup = config.get("full_backup", False)
+    args.link_mode = config.get("link_mode", LINK_MODE_COPY)
+    args.store = Path(config.get("store", DEFAULT_STORE_DIR))
+    
+    logger.info(f"Resuming interrupted installation of {', '.join(args.components)}")
+    return True
+
+
+def rollback_installation(args: argparse.Namespace) -> int:
+    """Undo the partial changes of an interrupted installation"""
+    logger = get_logger()
+    
+    installer = Installer(args.install_dir)
+    state = installer.journal.get_state()
+    if state is None:
+        logger.error(f"No interrupted installation to roll back in {args.install_dir}")
+        return 1
+    
+    # Components undo the operations they did outside the file system (MCP servers)
+    components = state["begin"]["components"]
+    component_instances = get_component_registry().create_component_instances(components, args.install_dir)
+    installer.register_components(list(component_instances.values()))
+    
+    if args.dry_run:
+        logger.info(f"Would undo {len(state['operations'])} operations of the interrupted installation "
+                    f"of {', '.join(components)}")
+        return 0
+    
+    if not args.yes and not confirm(f"Undo the interrupted installation of {', '.join(components)}?", default=True):
+        logger.info("Rollback cancelled by user")
+        return 0
+    
+    if installer.rollback_interrupted():
+        display_success("Interrupted installation rolled back")
+        return 0
+    
+    display_error("Rollback incomplete. Check warnings above.")
+    return 1
+
+
+def prepare_fleet_install(args: argparse.Namespace) -> bool:
+    """Select components, resolve their order and check requirements once for all fleet targets"""
+    logger = get_logger()
+
+    config_errors = get_config_manager().validate_config_files()
+    if config_errors:
+        logger.error("Configuration validation failed:")
+        for error in config_errors:
+            logger.error(f"  - {error}")
+        return False
+
+    components = get_components_to_install(args, get_component_registry(), get_config_manager())
+    if not components:
+        logger.error("No components selected for installation")
+        return False
+
+    try:
+        ordered_components = get_component_registry().resolve_dependencies(components)
+    except ValueError as e:
+        logger.error(f"Could not resolve dependencies: {e}")
+        return False
+
+    with get_profiler().phase("validation"):
+        requirements_met = validate_system_requirements(get_validator(), components)
+    if not requirements_met and not args.force:
+        logger.error("System requirements not met. Use --force to override.")
+        return False
+
+    # Workers get the resolved order and skip profile loading and interactive
+    # selection; each still plans its own target, whose files differ
+    args.components = ordered_components
+    return True
+
+
 def run(args: argparse.Namespace) -> int:
     """Execute installation operation with parsed arguments"""
     operation = InstallOperation()
     operation.setup_operation_logging(args)
     logger = get_logger()
+    if args.targets_file and (args.resume or args.rollback):
+        logger.error("--resume and --rollback work on a single installation directory, not with --targets-file")
+        return 1
+    if args.targets_file and not (args.list_components or args.diagnose):
+        return run_fleet_operation("install", args, prepare=prepare_fleet_install)
+    
     # ✅ Inserted validation code
     expected_home = Path.home().resolve()
     actual_dir = args.install_dir.resolve()
@@ -443,10 +616,16 @@ def run(args: argparse.Namespace) -> int:
                 "Installing SuperClaude framework components"
             )
         
+        # Recover from an interrupted installation
+        if args.rollback:
+            return rollback_installation(args)
+        
+        if args.resume and not apply_resume_arguments(args):
+            return 1
+        
         # Handle special modes
         if args.list_components:
-            registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-            registry.discover_components()
+            registry = get_component_registry()
             
             components = registry.list_components()
             if components:
@@ -465,18 +644,17 @@ def run(args: argparse.Namespace) -> int:
         
         # Handle diagnostic mode
         if args.diagnose:
-            validator = Validator()
+            validator = get_validator()
             run_system_diagnostics(validator)
             return 0
         
         # Create component registry and load configuration
         logger.info("Initializing installation system...")
         
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
+        registry = get_component_registry()
         
-        config_manager = ConfigManager(PROJECT_ROOT / "config")
-        validator = Validator()
+        config_manager = get_config_manager()
+        validator = get_validator()
         
         # Validate configuration
         config_errors = config_manager.validate_config_files()
@@ -493,7 +671,9 @@ def run(args: argparse.Namespace) -> int:
             return 1
         
         # Validate system requirements
-        if not validate_system_requirements(validator, components):
+        with get_profiler().phase("validation"):
+            requirements_met = validate_system_requirements(validator, components)
+        if not requirements_met:
             if not args.force:
                 logger.error("System requirements not met. Use --force to override.")
                 return 1
@@ -501,16 +681,21 @@ def run(args: argparse.Namespace) -> int:
                 logger.warning("System requirements not met, but continuing due to --force flag")
         
         # Check for existing installation
-        if args.install_dir.exists() and not args.force:
+        if args.install_dir.exists() and not args.force and not args.resume:
             if not args.dry_run:
                 logger.warning(f"Installation directory already exists: {args.install_dir}")
                 if not args.yes and not confirm("Continue and update existing installation?", default=False):
                     logger.info("Installation cancelled by user")
                     return 0
         
+        # Plan the run once; every phase below works from this plan
+        installer = create_installer(components, args)
+        if installer is None:
+            return 1
+        
         # Display installation plan
         if not args.quiet:
-            display_installation_plan(components, registry, args.install_dir)
+            display_installation_plan(installer, registry)
             
             if not args.dry_run:
                 if not args.yes and not confirm("Proceed with installation?", default=True):
@@ -518,7 +703,7 @@ def run(args: argparse.Namespace) -> int:
                     return 0
         
         # Perform installation
-        success = perform_installation(components, args)
+        success = perform_installation(installer, args)
         
         if success:
             if not args.quiet:
@@ -0,0 +1,396 @@
+"""
+SuperClaude Serve Operation Module
+Persistent daemon that keeps the component registry, configuration and
+validator caches warm and answers operation requests over a Unix socket
+
+A daemon serves the user that started it: requests run with its
+permissions and its home directory, so other users are refused.
+"""
+
+import io
+import os
+import socket
+import struct
+import sys
+import time
+from contextlib import redirect_stdout, redirect_stderr
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+import argparse
+
+from ..managers.settings_manager import SettingsManager
+from ..utils.daemon import (
+    DAEMON_OPERATIONS, SOCKET_ENV_VAR, daemon_supported, get_default_socket_path,
+    read_message, write_message, send_request
+)
+from ..utils.ui import display_header, display_success, display_error, Colors
+from ..utils.logger import get_logger
+from ..utils.events import disable_event_output
+from . import (
+    OperationBase, get_component_registry, get_config_manager, get_validator,
+    reset_shared_state
+)
+
+
+class ServeOperation(OperationBase):
+    """Serve operation implementation"""
+
+    def __init__(self):
+        super().__init__("serve")
+
+
+def register_parser(subparsers, global_parser=None) -> argparse.ArgumentParser:
+    """Register serve CLI arguments"""
+    parents = [global_parser] if global_parser else []
+
+    parser = subparsers.add_parser(
+        "serve",
+        help="Run a persistent SuperClaude daemon over a Unix socket",
+        description="Keep SuperClaude warm in a long-running process and execute "
+                    "install, update and backup requests sent over a Unix socket",
+        epilog=f"""
+Examples:
+  SuperClaude serve                          # Start daemon on the default socket
+  SuperClaude serve --socket /run/sc.sock    # Start daemon on a custom socket
+  SuperClaude serve --status                 # Query a running daemon
+  SuperClaude serve --stop                   # Stop a running daemon
+
+Set {SOCKET_ENV_VAR}=<socket> to make 'SuperClaude {"/".join(DAEMON_OPERATIONS)}'
+run inside the daemon. The daemon can't prompt, so only invocations
+with --yes are forwarded; the others run locally.
+
+A daemon serves only the user that started it: the socket is owner-only
+and connections from other users are refused. Each user runs their own
+daemon for their own install directory.
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=parents
+    )
+
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="Unix socket path (default: $SUPERCLAUDE_SOCKET or <install-dir>/.superclaude.sock)"
+    )
+
+    control_group = parser.add_mutually_exclusive_group()
+
+    control_group.add_argument(
+        "--status",
+        action="store_true",
+        help="Show status of a running daemon and exit"
+    )
+
+    control_group.add_argument(
+        "--stop",
+        action="store_true",
+        help="Stop a running daemon and exit"
+    )
+
+    control_group.add_argument(
+        "--reload",
+        action="store_true",
+        help="Make a running daemon drop and rebuild its cached state"
+    )
+
+    return parser
+
+
+class SuperClaudeDaemon:
+    """Single-threaded daemon serving one request at a time for the user that started it"""
+
+    def __init__(self, socket_path: Path):
+        """
+        Initialize daemon
+
+        Args:
+            socket_path: Path of the Unix socket to listen on
+        """
+        self.socket_path = socket_path
+        self.logger = get_logger()
+        self.started = time.time()
+        self.requests_served = 0
+        self._running = False
+
+    def warm_up(self) -> None:
+        """Import and populate everything a request would otherwise rebuild"""
+        registry = get_component_registry()
+        config_manager = get_config_manager()
+        config_manager.load_features()
+        config_manager.load_requirements()
+        get_validator()
+
+        # Importing the operation modules up front is part of the warm state
+        for name in DAEMON_OPERATIONS:
+            __import__(f"setup.operations.{name}", fromlist=[name])
+
+        self.logger.info(f"Daemon state ready ({len(registry.list_components())} components)")
+
+    def serve_forever(self) -> None:
+        """Bind the socket and process requests until a shutdown request arrives"""
+        self._prepare_socket_path()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # The socket is created owner-only, so no other user can connect before the chmod
+            old_umask = os.umask(0o077)
+            try:
+                server.bind(str(self.socket_path))
+            finally:
+                os.umask(old_umask)
+            os.chmod(self.socket_path, 0o600)
+            server.listen(16)
+            self._running = True
+            self.logger.success(f"SuperClaude daemon listening on {self.socket_path}")
+
+            while self._running:
+                conn, _ = server.accept()
+                with conn:
+                    if self._is_own_user(conn):
+                        self._handle_connection(conn)
+        finally:
+            server.close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+    def _prepare_socket_path(self) -> None:
+        """Refuse to start over a live daemon and remove a stale socket file"""
+        if not self.socket_path.exists():
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            return
+
+        try:
+            send_request(self.socket_path, {"command": "ping"}, timeout=2)
+        except (OSError, ValueError):
+            self.logger.debug(f"Removing stale socket: {self.socket_path}")
+            self.socket_path.unlink()
+            return
+
+        raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+
+    def _is_own_user(self, conn: socket.socket) -> bool:
+        """
+        Check that the peer runs as the daemon's user
+
+        Requests would run with the daemon's permissions, so the owner-only
+        socket mode is backed by a peer credential check where the platform
+        has one (SO_PEERCRED on Linux).
+        """
+        if not hasattr(socket, "SO_PEERCRED"):
+            return True
+
+        credentials = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _, uid, _ = struct.unpack("3i", credentials)
+        if uid == os.getuid():
+            return True
+
+        self.logger.warning(f"Refused daemon connection from uid {uid}")
+        try:
+            read_message(conn)
+            write_message(conn, {"ok": False, "error": "This daemon only serves the user that started it"})
+        except (OSError, ValueError):
+            pass
+        return False
+
+    def _handle_connection(self, conn: socket.socket) -> None:
+        """Read one request from a connection and answer it"""
+        try:
+            request = read_message(conn)
+            if request is None:
+                return
+            response = self.handle_request(request)
+        except Exception as e:
+            self.logger.exception(f"Error handling daemon request: {e}")
+            response = {"ok": False, "error": str(e)}
+
+        try:
+            write_message(conn, response)
+        except OSError as e:
+            self.logger.warning(f"Could not send daemon response: {e}")
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a decoded request
+
+        Args:
+            request: Message with a "command" key (ping, status, run, reload, shutdown)
+
+        Returns:
+            Response message
+        """
+        command = request.get("command")
+        self.requests_served += 1
+
+        if command == "ping":
+            return {"ok": True}
+
+        if command == "status":
+            return {"ok": True, **self.get_status(request.get("install_dir"))}
+
+        if command == "run":
+            argv = request.get("argv") or []
+            return self._run_cli(argv, request.get("cwd"))
+
+        if command == "reload":
+            reset_shared_state()
+            self.warm_up()
+            return {"ok": True}
+
+        if command == "shutdown":
+            self._running = False
+            return {"ok": True}
+
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+    def get_status(self, install_dir: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get daemon status and, optionally, installation state of a directory
+
+        Args:
+            install_dir: Installation directory to report on
+
+        Returns:
+            Dict with daemon statistics and installed components
+        """
+        status = {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "requests_served": self.requests_served,
+            "components_available": get_component_registry().list_components()
+        }
+
+        if install_dir:
+            settings_manager = SettingsManager(Path(install_dir))
+            try:
+                status["installed_components"] = settings_manager.get_installed_components()
+            except ValueError as e:
+                status["installed_components"] = {}
+                status["error"] = str(e)
+
+        return status
+
+    def _run_cli(self, argv: List[str], cwd: Optional[str]) -> Dict[str, Any]:
+        """Run a CLI invocation in-process and capture everything it prints"""
+        from SuperClaude.__main__ import dispatch_operation
+
+        output = io.StringIO()
+        errors = io.StringIO()
+        original_cwd = os.getcwd()
+        original_stdin = sys.stdin
+        start_time = time.time()
+
+        try:
+            if cwd:
+                os.chdir(cwd)
+            # Requests are non-interactive: any prompt sees end-of-file
+            sys.stdin = io.StringIO("")
+            with redirect_stdout(output), redirect_stderr(errors):
+                try:
+                    exit_code = dispatch_operation(argv, allowed_operations=DAEMON_OPERATIONS)
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else 1
+                except EOFError:
+                    print("Interactive input is not available in daemon requests; "
+                          "pass the options explicitly")
+                    exit_code = 1
+        finally:
+            sys.stdin = original_stdin
+            os.chdir(original_cwd)
+            # --output jsonl points the event stream at this request's buffer
+            disable_event_output()
+            # Operations re-create the global logger; point it back at the daemon's console
+            self.logger = get_logger()
+
+        return {
+            "ok": exit_code == 0,
+            "exit_code": exit_code,
+            "output": output.getvalue(),
+            "errors": errors.getvalue(),
+            "duration": round(time.time() - start_time, 3)
+        }
+
+
+def get_socket_path(args: argparse.Namespace) -> Path:
+    """Get the daemon socket path from arguments, environment or default"""
+    if args.socket:
+        return args.socket
+    if os.environ.get(SOCKET_ENV_VAR):
+        return Path(os.environ[SOCKET_ENV_VAR])
+    return get_default_socket_path()
+
+
+def display_daemon_status(status: Dict[str, Any]) -> None:
+    """Display status returned by a running daemon"""
+    print(f"\n{Colors.CYAN}{Colors.BRIGHT}SuperClaude Daemon{Colors.RESET}")
+    print("=" * 50)
+    print(f"{Colors.BLUE}PID:{Colors.RESET} {status.get('pid')}")
+    print(f"{Colors.BLUE}Socket:{Colors.RESET} {status.get('socket')}")
+    print(f"{Colors.BLUE}Uptime:{Colors.RESET} {status.get('uptime_seconds')}s")
+    print(f"{Colors.BLUE}Requests served:{Colors.RESET} {status.get('requests_served')}")
+    print(f"{Colors.BLUE}Components available:{Colors.RESET} {', '.join(status.get('components_available', []))}")
+
+    installed = status.get("installed_components")
+    if installed is not None:
+        print(f"{Colors.BLUE}Installed components:{Colors.RESET}")
+        for component, info in installed.items():
+            print(f"  {component}: v{info.get('version', 'unknown')}")
+    print()
+
+
+def run(args: argparse.Namespace) -> int:
+    """Execute serve operation with parsed arguments"""
+    operation = ServeOperation()
+    operation.setup_operation_logging(args)
+    logger = get_logger()
+
+    if not daemon_supported():
+        logger.error("Unix domain sockets are not supported on this platform")
+        return 1
+
+    socket_path = get_socket_path(args)
+
+    # Control requests to an already running daemon
+    if args.status or args.stop or args.reload:
+        if args.status:
+            request = {"command": "status", "install_dir": str(args.install_dir)}
+        elif args.stop:
+            request = {"command": "shutdown"}
+        else:
+            request = {"command": "reload"}
+
+        try:
+            response = send_request(socket_path, request, timeout=30)
+        except (OSError, ValueError) as e:
+            display_error(f"No daemon reachable at {socket_path}: {e}")
+            return 1
+
+        if not response.get("ok"):
+            display_error(f"Daemon error: {response.get('error', 'unknown error')}")
+            return 1
+
+        if args.status:
+            display_daemon_status(response)
+        elif not args.quiet:
+            display_success("Daemon stopped" if args.stop else "Daemon state reloaded")
+        return 0
+
+    try:
+        if not args.quiet:
+            display_header(
+                "SuperClaude Daemon v3.0",
+                "Serving operation requests over a Unix socket"
+            )
+
+        daemon = SuperClaudeDaemon(socket_path)
+        daemon.warm_up()
+        daemon.serve_forever()
+        return 0
+
+    except KeyboardInterrupt:
+        print(f"\n{Colors.YELLOW}Daemon stopped by user{Colors.RESET}")
+        return 130
+    except Exception as e:
+        return operation.handle_operation_error("serve", e)
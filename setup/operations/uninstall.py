@@ -9,16 +9,17 @@ from pathlib import Path
 from typing import List, Optional, Dict, Any
 import argparse
 
-from ..core.registry import ComponentRegistry
 from ..managers.settings_manager import SettingsManager
 from ..managers.file_manager import FileManager
+from ..managers.content_store import ContentStore
 from ..utils.ui import (
     display_header, display_info, display_success, display_error, 
-    display_warning, Menu, confirm, ProgressBar, Colors
+    display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ..utils.logger import get_logger
+from ..utils.events import get_event_emitter
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
-from . import OperationBase
+from . import OperationBase, add_fleet_arguments, run_fleet_operation, get_component_registry
 
 
 class UninstallOperation(OperationBase):
@@ -42,6 +43,7 @@ Examples:
   SuperClaude uninstall --components core  # Remove specific components
   SuperClaude uninstall --complete --force # Complete removal (forced)
   SuperClaude uninstall --keep-backups     # Keep backup files
+  SuperClaude uninstall --list             # List installed components
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         parents=parents
@@ -61,6 +63,12 @@ Examples:
         help="Complete uninstall (remove all files and directories)"
     )
     
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="List installed components and exit"
+    )
+    
     # Data preservation options
     parser.add_argument(
         "--keep-backups",
@@ -87,6 +95,9 @@ Examples:
         help="Skip confirmation prompts (use with caution)"
     )
     
+    # Fleet options
+    add_fleet_arguments(parser)
+    
     return parser
 
 def get_installed_components(install_dir: Path) -> Dict[str, Dict[str, Any]]:
@@ -98,6 +109,22 @@ def get_installed_components(install_dir: Path) -> Dict[str, Dict[str, Any]]:
         return {}
 
 
+def display_installed_components(install_dir: Path) -> None:
+    """Print installed components with their versions and descriptions"""
+    installed_components = get_installed_components(install_dir)
+    if not installed_components:
+        print(f"No SuperClaude components installed in {install_dir}")
+        return
+    
+    registry = get_component_registry()
+    print(f"\n{Colors.CYAN}Installed Components:{Colors.RESET}")
+    for component_name, component_info in installed_components.items():
+        version = component_info.get("version", "unknown") if isinstance(component_info, dict) else component_info
+        metadata = registry.get_component_metadata(component_name) or {}
+        desc = metadata.get("description", "Unknown component")
+        print(f"  {component_name} v{version} - {desc}")
+
+
 def get_installation_info(install_dir: Path) -> Dict[str, Any]:
     """Get detailed installation information"""
     info = {
@@ -286,12 +313,14 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
     
     try:
         # Create component registry
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
+        registry = get_component_registry()
         
         # Create component instances
         component_instances = registry.create_component_instances(components, args.install_dir)
         
+        # Read before a complete uninstall removes the manifest
+        content_store = SettingsManager(args.install_dir).get_content_store()
+        
         # Setup progress tracking
         progress = ProgressBar(
             total=len(components),
@@ -305,8 +334,14 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
         uninstalled_components = []
         failed_components = []
         
+        emitter = get_event_emitter()
+        
         for i, component_name in enumerate(components):
-            progress.update(i, f"Uninstalling {component_name}")
+            if not emitter.enabled:
+                progress.update(i, f"Uninstalling {component_name}")
+            emitter.emit("component_start", component=component_name, action="uninstall",
+                         install_dir=str(args.install_dir), dry_run=args.dry_run)
+            component_start = time.perf_counter()
             
             try:
                 if component_name in component_instances:
@@ -324,15 +359,26 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
                 logger.error(f"Error uninstalling {component_name}: {e}")
                 failed_components.append(component_name)
             
-            progress.update(i + 1, f"Processed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
+            emitter.emit("component_end", component=component_name, action="uninstall",
+                         success=component_name in uninstalled_components,
+                         duration_ms=round((time.perf_counter() - component_start) * 1000, 3))
+            if not emitter.enabled:
+                progress.update(i + 1, f"Processed {component_name}")
+                time.sleep(0.1)  # Brief pause for visual effect
         
-        progress.finish("Uninstall complete")
+        if not emitter.enabled:
+            progress.finish("Uninstall complete")
         
         # Handle complete uninstall cleanup
         if args.complete:
             cleanup_installation_directory(args.install_dir, args)
         
+        # Drop the store objects no installation links any more
+        if content_store and not args.dry_run:
+            removed, freed = ContentStore(Path(content_store["path"])).collect_garbage()
+            if removed:
+                logger.info(f"Removed {removed} unused files ({format_size(freed)}) from the content store")
+        
         # Show results
         duration = time.time() - start_time
         
@@ -345,6 +391,10 @@ def perform_uninstall(components: List[str], args: argparse.Namespace, info: Dic
         if uninstalled_components:
             logger.info(f"Uninstalled components: {', '.join(uninstalled_components)}")
         
+        emitter.emit("summary", operation="uninstall", success=not failed_components,
+                     duration_ms=round(duration * 1000, 3), uninstalled=uninstalled_components,
+                     failed=failed_components, install_dir=str(args.install_dir), dry_run=args.dry_run)
+        
         return len(failed_components) == 0
         
     except Exception as e:
@@ -400,6 +450,9 @@ def run(args: argparse.Namespace) -> int:
     operation = UninstallOperation()
     operation.setup_operation_logging(args)
     logger = get_logger()
+    if args.targets_file:
+        return run_fleet_operation("uninstall", args)
+    
     # ✅ Inserted validation code
     expected_home = Path.home().resolve()
     actual_dir = args.install_dir.resolve()
@@ -425,6 +478,11 @@ def run(args: argparse.Namespace) -> int:
                 "Removing SuperClaude framework components"
             )
         
+        # List installed components (from metadata only, nothing is scanned)
+        if args.list:
+            display_installed_components(args.install_dir)
+            return 0
+        
         # Get installation information
         info = get_installation_info(args.install_dir)
         
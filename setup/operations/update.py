@@ -18,8 +18,12 @@ from ..utils.ui import (
     display_warning, Menu, confirm, ProgressBar, Colors, format_size
 )
 from ..utils.logger import get_logger
+from ..utils.events import get_event_emitter
 from .. import DEFAULT_INSTALL_DIR, PROJECT_ROOT
-from . import OperationBase
+from . import (
+    OperationBase, add_fleet_arguments, run_fleet_operation, get_component_registry,
+    report_planned_changes
+)
 
 
 class UpdateOperation(OperationBase):
@@ -75,6 +79,12 @@ Examples:
         help="Skip backup creation"
     )
     
+    parser.add_argument(
+        "--full-backup",
+        action="store_true",
+        help="Archive the whole installation directory before writing, not just the files being replaced"
+    )
+    
     # Update options
     parser.add_argument(
         "--reinstall",
@@ -82,6 +92,22 @@ Examples:
         help="Reinstall components even if versions match"
     )
     
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=4,
+        help="Components of the same dependency level installed in parallel (default: 4, 1 = serial)"
+    )
+    
+    parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="Write components directly into the install directory instead of staging and swapping them in"
+    )
+    
+    # Fleet options
+    add_fleet_arguments(parser)
+    
     return parser
 
 def check_installation_exists(install_dir: Path) -> bool:
@@ -242,11 +268,11 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
     
     try:
         # Create installer
-        installer = Installer(args.install_dir, dry_run=args.dry_run)
+        installer = Installer(args.install_dir, dry_run=args.dry_run, jobs=args.jobs,
+                              staged=not args.in_place)
         
         # Create component registry
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
+        registry = get_component_registry()
         
         # Create component instances
         component_instances = registry.create_component_instances(components, args.install_dir)
@@ -259,6 +285,7 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
         installer.register_components(list(component_instances.values()))
         
         # Setup progress tracking
+        emitter = get_event_emitter()
         progress = ProgressBar(
             total=len(components),
             prefix="Updating: ",
@@ -274,24 +301,39 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
         config = {
             "force": args.force,
             "backup": backup,
+            "full_backup": args.full_backup,
             "dry_run": args.dry_run,
             "update_mode": True
         }
         
-        success = installer.update_components(components, config)
+        # Updates keep linking from the content store the installation uses
+        content_store = SettingsManager(args.install_dir).get_content_store()
+        if content_store:
+            config["link_mode"] = content_store["link_mode"]
+            config["store"] = content_store["path"]
         
-        # Update progress
-        for i, component_name in enumerate(components):
-            if component_name in installer.updated_components:
-                progress.update(i + 1, f"Updated {component_name}")
-            else:
-                progress.update(i + 1, f"Failed {component_name}")
-            time.sleep(0.1)  # Brief pause for visual effect
+        if args.dry_run:
+            report_planned_changes(installer, components, quiet=args.quiet)
         
-        progress.finish("Update complete")
+        success = installer.update_components(components, config)
+        
+        # Update progress (structured output reports components as events instead)
+        if not emitter.enabled:
+            for i, component_name in enumerate(components):
+                if component_name in installer.updated_components:
+                    progress.update(i + 1, f"Updated {component_name}")
+                elif component_name in installer.skipped_components:
+                    progress.update(i + 1, f"Up to date {component_name}")
+                else:
+                    progress.update(i + 1, f"Failed {component_name}")
+                time.sleep(0.1)  # Brief pause for visual effect
+            
+            progress.finish("Update complete")
         
         # Show results
         duration = time.time() - start_time
+        emitter.emit("summary", operation="update", success=success, duration_ms=round(duration * 1000, 3),
+                     files_copied=installer.get_files_copied(), **installer.get_update_summary())
         
         if success:
             logger.success(f"Update completed successfully in {duration:.1f} seconds")
@@ -301,6 +343,9 @@ def perform_update(components: List[str], args: argparse.Namespace) -> bool:
             if summary.get('updated'):
                 logger.info(f"Updated components: {', '.join(summary['updated'])}")
             
+            if summary.get('skipped'):
+                logger.info(f"Already up to date: {', '.join(summary['skipped'])}")
+            
             if summary.get('backup_path'):
                 logger.info(f"Backup created: {summary['backup_path']}")
                 
@@ -323,6 +368,9 @@ def run(args: argparse.Namespace) -> int:
     operation = UpdateOperation()
     operation.setup_operation_logging(args)
     logger = get_logger()
+    if args.targets_file:
+        return run_fleet_operation("update", args)
+    
     # ✅ Inserted validation code
     expected_home = Path.home().resolve()
     actual_dir = args.install_dir.resolve()
@@ -357,8 +405,7 @@ def run(args: argparse.Namespace) -> int:
         # Create component registry
         logger.info("Checking for available updates...")
         
-        registry = ComponentRegistry(PROJECT_ROOT / "setup" / "components")
-        registry.discover_components()
+        registry = get_component_registry()
         
         # Get installed components
         installed_components = get_installed_components(args.install_dir)
@@ -0,0 +1,100 @@
+"""
+Client side of the SuperClaude serve daemon protocol
+Requests and responses are single JSON objects, one per line, over a Unix domain socket
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# Environment variable that makes the CLI forward supported operations to a daemon
+SOCKET_ENV_VAR = "SUPERCLAUDE_SOCKET"
+
+# Operations the daemon executes on behalf of the CLI
+DAEMON_OPERATIONS = ("install", "update", "backup")
+
+
+def get_default_socket_path() -> Path:
+    """Get the default daemon socket path (inside the default install directory)"""
+    from .. import DEFAULT_INSTALL_DIR
+    return DEFAULT_INSTALL_DIR / ".superclaude.sock"
+
+
+def daemon_supported() -> bool:
+    """Check whether Unix domain sockets are available on this platform"""
+    return hasattr(socket, "AF_UNIX")
+
+
+def read_message(conn: socket.socket) -> Optional[Dict[str, Any]]:
+    """
+    Read one newline-terminated JSON message from a socket
+
+    Returns:
+        Decoded message or None if the peer closed the connection first
+    """
+    buffer = bytearray()
+    while not buffer.endswith(b"\n"):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+
+    if not buffer.strip():
+        return None
+    return json.loads(buffer.decode("utf-8"))
+
+
+def write_message(conn: socket.socket, message: Dict[str, Any]) -> None:
+    """Write one JSON message followed by a newline"""
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def send_request(socket_path: Path, request: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Send a request to the daemon and wait for its response
+
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        request: Request message (must contain a "command" key)
+        timeout: Socket timeout in seconds (None waits indefinitely)
+
+    Returns:
+        Response message
+
+    Raises:
+        OSError: If the daemon cannot be reached
+        ValueError: If the daemon closes the connection without answering
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(timeout)
+        conn.connect(str(socket_path))
+        write_message(conn, request)
+        response = read_message(conn)
+
+    if response is None:
+        raise ValueError(f"No response from daemon at {socket_path}")
+    return response
+
+
+def forward_to_daemon(socket_path: Path, argv: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    Run a CLI invocation inside the daemon
+
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        argv: Command line arguments (without the program name)
+
+    Returns:
+        Response with "exit_code", "output" (stdout) and "errors" (stderr),
+        or None if the daemon is unavailable
+    """
+    if not daemon_supported() or not socket_path.exists():
+        return None
+
+    request = {"command": "run", "argv": argv, "cwd": os.getcwd()}
+    try:
+        return send_request(socket_path, request)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,109 @@
+"""
+Structured event output for SuperClaude installation system
+Emits one JSON object per line (JSON-lines) for orchestration tooling
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional, TextIO
+
+
+class EventEmitter:
+    """Writes machine-readable events to a stream"""
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        """
+        Initialize event emitter
+
+        Args:
+            stream: Stream to write events to; None disables event output
+        """
+        self.stream = stream
+        self.enabled = stream is not None
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """
+        Emit one event
+
+        Args:
+            event: Event type (e.g. "phase_start", "file_copied")
+            **fields: Event payload; non-JSON values are converted with str()
+        """
+        if not self.enabled:
+            return
+
+        record: Dict[str, Any] = {"event": event, "ts": round(time.time(), 6)}
+        record.update(fields)
+        line = json.dumps(record, default=str)
+
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def emit_raw(self, record: Dict[str, Any]) -> None:
+        """Emit an already built event record (e.g. relayed from a worker)"""
+        if not self.enabled:
+            return
+
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+# Global event emitter (disabled until enable_event_output is called)
+_global_emitter: Optional[EventEmitter] = None
+
+
+def get_event_emitter() -> EventEmitter:
+    """Get the global event emitter (a disabled no-op emitter by default)"""
+    global _global_emitter
+
+    if _global_emitter is None:
+        _global_emitter = EventEmitter()
+
+    return _global_emitter
+
+
+def enable_event_output(stream: TextIO) -> EventEmitter:
+    """Create and install a global emitter writing to stream"""
+    global _global_emitter
+    _global_emitter = EventEmitter(stream)
+    return _global_emitter
+
+
+def disable_event_output() -> None:
+    """Turn event output off again"""
+    global _global_emitter
+    _global_emitter = EventEmitter()
+
+
+def parse_events(text: str) -> List[Dict[str, Any]]:
+    """
+    Parse JSON-lines event output, skipping lines that are not events
+
+    Args:
+        text: Captured event output
+
+    Returns:
+        List of event records
+    """
+    events = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line.startswith("{"):
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict) and "event" in record:
+            events.append(record)
+    return events
+
+
+def emit_event(event: str, **fields: Any) -> None:
+    """Emit an event using the global emitter"""
+    get_event_emitter().emit(event, **fields)
@@ -0,0 +1,186 @@
+"""
+Kernel-accelerated file copies
+Files are cloned (reflink) where the file system shares extents, copied
+inside the kernel with copy_file_range or sendfile otherwise, and only read
+and written through Python buffers when none of those work. Metadata is
+applied on the open target in one pass.
+"""
+
+import errno
+import os
+import shutil
+import stat
+import sys
+import threading
+from pathlib import Path
+from typing import Set, Tuple
+
+
+STRATEGY_REFLINK = "reflink"
+STRATEGY_COPY_FILE_RANGE = "copy_file_range"
+STRATEGY_SENDFILE = "sendfile"
+STRATEGY_BUFFERED = "buffered"
+
+# ioctl cloning the extents of one file into another (btrfs, XFS, bcachefs, ...)
+_FICLONE = 0x40049409
+
+# Largest chunk the kernel copies per call
+_CHUNK_SIZE = 1 << 30
+
+_BUFFER_SIZE = 1 << 20
+
+# Errors meaning "this file system or kernel can't do that", not "the copy failed"
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.ENOTTY, errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP), errno.EBADF, errno.ETXTBSY
+}
+
+# (strategy, source device, target device) combinations known not to work
+_unsupported: Set[Tuple[str, int, int]] = set()
+_unsupported_lock = threading.Lock()
+
+
+def _reflink(source_fd: int, target_fd: int, size: int) -> None:
+    """Share the source extents with the target"""
+    import fcntl
+    fcntl.ioctl(target_fd, _FICLONE, source_fd)
+
+
+def _copy_file_range(source_fd: int, target_fd: int, size: int) -> None:
+    """Copy inside the kernel, letting the file system offload or share extents"""
+    offset = 0
+    while offset < size:
+        copied = os.copy_file_range(source_fd, target_fd, min(size - offset, _CHUNK_SIZE), offset, offset)
+        if copied == 0:
+            _raise_short_copy(offset, size)
+        offset += copied
+
+
+def _sendfile(source_fd: int, target_fd: int, size: int) -> None:
+    """Copy through the page cache without passing the data to user space"""
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(target_fd, source_fd, offset, min(size - offset, _CHUNK_SIZE))
+        if sent == 0:
+            _raise_short_copy(offset, size)
+        offset += sent
+
+
+def _raise_short_copy(copied: int, size: int) -> None:
+    """
+    Treat an early end of a kernel copy as unsupported
+
+    Some file systems (FUSE, NFS, procfs-like) report end of file before
+    st_size; the copy then falls through to the next strategy.
+    """
+    raise OSError(errno.EINVAL, f"Kernel copy stopped after {copied} of {size} bytes")
+
+
+def _buffered(source_fd: int, target_fd: int, size: int) -> None:
+    """Copy through Python buffers (works everywhere)"""
+    with open(source_fd, 'rb', closefd=False) as source, open(target_fd, 'wb', closefd=False) as target:
+        shutil.copyfileobj(source, target, _BUFFER_SIZE)
+
+
+def _get_strategies():
+    """Copy strategies available on this platform, fastest first"""
+    strategies = []
+    if sys.platform.startswith("linux"):
+        strategies.append((STRATEGY_REFLINK, _reflink))
+        if hasattr(os, "copy_file_range"):
+            strategies.append((STRATEGY_COPY_FILE_RANGE, _copy_file_range))
+        if hasattr(os, "sendfile"):
+            strategies.append((STRATEGY_SENDFILE, _sendfile))
+    strategies.append((STRATEGY_BUFFERED, _buffered))
+    return strategies
+
+
+_STRATEGIES = _get_strategies()
+
+
+def copy_file(source: Path, target: Path, preserve_metadata: bool = True) -> str:
+    """
+    Copy a file with the fastest strategy the file systems support
+
+    Strategies that fail as unsupported fall through to the next one and are
+    skipped for later copies between the same devices. A target that is a
+    symbolic link or has other hard links is replaced, not written through.
+    Like shutil.copy2, preserve_metadata keeps the permission bits and
+    access/modification times (not extended attributes); without it only
+    the permission bits are copied, like shutil.copy.
+
+    Args:
+        source: Existing file
+        target: Target file (created or truncated; its directory must exist)
+        preserve_metadata: Whether to keep the source times
+
+    Returns:
+        Name of the strategy that copied the file (STRATEGY_*)
+
+    Raises:
+        shutil.SameFileError: If target is source (or a hard link to it)
+        OSError: If the file could not be copied
+    """
+    flags = getattr(os, "O_BINARY", 0)
+    source_fd = os.open(source, os.O_RDONLY | flags)
+    try:
+        source_stat = os.fstat(source_fd)
+        try:
+            target_stat = os.lstat(target)
+        except FileNotFoundError:
+            target_stat = None
+        if target_stat is not None:
+            if os.path.samestat(source_stat, target_stat):
+                raise shutil.SameFileError(f"{source} and {target} are the same file")
+            # Writing through a link would change the file it shares (e.g. a store object)
+            if stat.S_ISLNK(target_stat.st_mode) or target_stat.st_nlink > 1:
+                os.unlink(target)
+
+        target_fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | flags, 0o600)
+        try:
+            target_dev = os.fstat(target_fd).st_dev
+            strategy = None
+            for name, copy in _STRATEGIES:
+                key = (name, source_stat.st_dev, target_dev)
+                if key in _unsupported:
+                    continue
+                # Only a read to end of file copies files that report no size (e.g. procfs)
+                if source_stat.st_size == 0 and name != STRATEGY_BUFFERED:
+                    continue
+                try:
+                    copy(source_fd, target_fd, source_stat.st_size)
+                except OSError as e:
+                    if name == STRATEGY_BUFFERED or e.errno not in _UNSUPPORTED_ERRNOS:
+                        raise
+                    with _unsupported_lock:
+                        _unsupported.add(key)
+                    # Start over from an empty target
+                    os.ftruncate(target_fd, 0)
+                    os.lseek(target_fd, 0, os.SEEK_SET)
+                    continue
+                strategy = name
+                break
+
+            _copy_metadata(source_stat, target, target_fd, preserve_metadata)
+        finally:
+            os.close(target_fd)
+    finally:
+        os.close(source_fd)
+
+    return strategy
+
+
+def _copy_metadata(source_stat: os.stat_result, target: Path, target_fd: int, preserve_times: bool) -> None:
+    """Apply the source permission bits (and times) to the open target"""
+    mode = source_stat.st_mode & 0o7777
+    if os.chmod in os.supports_fd:
+        os.chmod(target_fd, mode)
+    else:
+        os.chmod(target, mode)
+
+    if preserve_times:
+        times = (source_stat.st_atime_ns, source_stat.st_mtime_ns)
+        if os.utime in os.supports_fd:
+            os.utime(target_fd, ns=times)
+        else:
+            os.utime(target, ns=times)
@@ -0,0 +1,226 @@
+"""
+Persistent cache of file hashes
+A file's digest is stored under its (device, inode) and reused while its
+size, mtime_ns and ctime_ns are unchanged, so integrity checks, update
+detection and planning only read files that changed since they were last
+hashed. The ctime catches in-place rewrites that keep size and mtime (copies
+preserve the source mtime).
+"""
+
+import hashlib
+import mmap
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+HASH_CACHE_FILE = "hashes.sqlite3"
+
+# Files at least this large are hashed through a memory map instead of reads
+MMAP_THRESHOLD = 1024 * 1024
+
+# Oldest entries beyond this many are dropped when the cache is opened
+MAX_ENTRIES = 200_000
+
+
+def _new_hasher(algorithm: str):
+    """Hash object for a hashlib algorithm or an xxhash one (xxh32, xxh64, xxh3_64, xxh3_128)"""
+    if algorithm.startswith("xxh"):
+        if xxhash is None:
+            raise ValueError(f"Hash algorithm {algorithm} needs the xxhash package")
+        constructor = getattr(xxhash, algorithm, None)
+        if constructor is None:
+            raise ValueError(f"Unknown hash algorithm: {algorithm}")
+        return constructor()
+    return hashlib.new(algorithm)
+
+
+def _hash_fd(fd: int, size: int, algorithm: str) -> str:
+    """Hash an open file: one read for small files, a memory map for large ones"""
+    hasher = _new_hasher(algorithm)
+    if size >= MMAP_THRESHOLD:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+            hasher.update(mapped)
+    else:
+        with open(fd, 'rb', closefd=False) as f:
+            hasher.update(f.read())
+    return hasher.hexdigest()
+
+
+def hash_file(path: Path, algorithm: str = "sha256") -> str:
+    """
+    Hash a file without the cache
+
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If the algorithm is unknown
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        return _hash_fd(fd, os.fstat(fd).st_size, algorithm)
+    finally:
+        os.close(fd)
+
+
+class HashCache:
+    """File digests in an SQLite database, validated by stat on every lookup"""
+
+    def __init__(self, path: Optional[Path]):
+        """
+        Initialize hash cache
+
+        Args:
+            path: Database file (created if missing); None keeps the cache in memory
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._pid = None
+        self._lock_pid = None
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        # Connections inherited over fork are never used (SQLite forbids it) nor closed
+        self._inherited_connections: List[sqlite3.Connection] = []
+
+    def _process_lock(self) -> threading.Lock:
+        """
+        Lock of the current process
+
+        A lock inherited over fork may be held by a thread that only exists
+        in the parent, so each process makes its own.
+        """
+        if self._lock_pid != os.getpid():
+            self._lock = threading.Lock()
+            self._lock_pid = os.getpid()
+        return self._lock
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Connection of the current process, opened on first use (caller holds the lock)"""
+        if self._pid != os.getpid():
+            if self._connection is not None:
+                self._inherited_connections.append(self._connection)
+            self._connection = self._connect(self.path)
+            self._pid = os.getpid()
+        return self._connection
+
+    def _connect(self, path: Optional[Path]) -> sqlite3.Connection:
+        """Open the database, falling back to memory if the file can't be used"""
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Autocommit: no transaction stays open between calls
+                connection = sqlite3.connect(str(path), timeout=5, isolation_level=None,
+                                             check_same_thread=False)
+                # A lost write only costs a rehash
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=OFF")
+                self._create_schema(connection)
+                return connection
+            except (OSError, sqlite3.Error):
+                self.path = None
+
+        connection = sqlite3.connect(":memory:", isolation_level=None, check_same_thread=False)
+        self._create_schema(connection)
+        return connection
+
+    @staticmethod
+    def _create_schema(connection: sqlite3.Connection) -> None:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                " dev INTEGER, ino INTEGER, algorithm TEXT,"
+                " size INTEGER, mtime_ns INTEGER, ctime_ns INTEGER, digest TEXT,"
+                " PRIMARY KEY (dev, ino, algorithm))"
+            )
+            count = connection.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+            if count > MAX_ENTRIES:
+                connection.execute(
+                    "DELETE FROM hashes WHERE rowid IN (SELECT rowid FROM hashes ORDER BY rowid LIMIT ?)",
+                    (count - MAX_ENTRIES,)
+                )
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
+
+    def get_hash(self, path: Path, algorithm: str = "sha256") -> str:
+        """
+        Get the digest of a file, hashing it only if it changed since it was cached
+
+        Args:
+            path: File to hash
+            algorithm: hashlib algorithm name, or an xxhash one if installed
+
+        Returns:
+            Hex digest
+
+        Raises:
+            OSError: If the file can't be read
+            ValueError: If the algorithm is unknown
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            before = os.fstat(fd)
+            key = (before.st_dev, before.st_ino, algorithm)
+
+            with self._process_lock():
+                try:
+                    row = self._get_connection().execute(
+                        "SELECT size, mtime_ns, ctime_ns, digest FROM hashes "
+                        "WHERE dev = ? AND ino = ? AND algorithm = ?", key
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+            stamp = (before.st_size, before.st_mtime_ns, before.st_ctime_ns)
+            if row is not None and tuple(row[:3]) == stamp:
+                self.hits += 1
+                return row[3]
+
+            digest = _hash_fd(fd, before.st_size, algorithm)
+            self.misses += 1
+
+            # Don't remember a digest of a file that changed while it was read
+            after = os.fstat(fd)
+            if (after.st_size, after.st_mtime_ns, after.st_ctime_ns) == stamp:
+                self._store(key, stamp, digest)
+            return digest
+        finally:
+            os.close(fd)
+
+    def _store(self, key: Tuple[int, int, str], stamp: Tuple[int, int, int], digest: str) -> None:
+        """Write one digest in its own short transaction, so other processes are never held up"""
+        with self._process_lock():
+            try:
+                self._get_connection().execute(
+                    "INSERT OR REPLACE INTO hashes (dev, ino, algorithm, size, mtime_ns, ctime_ns, digest) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)", (*key, *stamp, digest)
+                )
+            except sqlite3.Error:
+                # Another process holds the database; the digest is simply not cached
+                pass
+
+
+_hash_cache: Optional[HashCache] = None
+_hash_cache_lock = threading.Lock()
+
+
+def get_hash_cache() -> HashCache:
+    """
+    Get the hash cache shared by the process (in the user cache directory)
+
+    Each process, including forked workers, opens its own connection.
+    """
+    global _hash_cache
+    with _hash_cache_lock:
+        if _hash_cache is None:
+            from .. import CACHE_DIR
+            _hash_cache = HashCache(CACHE_DIR / HASH_CACHE_FILE)
+        return _hash_cache
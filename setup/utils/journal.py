@@ -0,0 +1,232 @@
+"""
+Write-ahead journal for SuperClaude installation runs
+Every file operation is appended to the journal before it is applied, so an
+interrupted run can be resumed or rolled back instead of reinstalled
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+JOURNAL_FILE = ".superclaude-journal.jsonl"
+
+
+class InstallJournal:
+    """Append-only JSON-lines journal of one installation run"""
+
+    def __init__(self, install_dir: Path):
+        """
+        Initialize journal
+
+        Args:
+            install_dir: Live installation directory (the journal lives inside it)
+        """
+        self.install_dir = install_dir
+        self.path = install_dir / JOURNAL_FILE
+        self._stream = None
+        self._seq = 0
+        self._synced_seq = 0
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def exists(self) -> bool:
+        """Check whether an unfinished run left its journal behind"""
+        return self.path.is_file()
+
+    def open(self) -> None:
+        """Open the journal for appending, continuing the sequence of existing entries"""
+        entries = self.load()
+        self._seq = max((entry.get("seq", 0) for entry in entries), default=0)
+        self._synced_seq = self._seq
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = open(self.path, 'a', encoding='utf-8')
+
+    def record(self, op: str, **fields: Any) -> int:
+        """
+        Append an intent record and sync it to disk before returning
+
+        Args:
+            op: Operation type (e.g. "copy", "mkdir", "write", "mcp", "publish")
+            **fields: Everything needed to replay or undo the operation
+
+        Returns:
+            Sequence number of the record, passed to complete()
+        """
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._append({"seq": seq, "op": op, **fields})
+        self._sync(seq)
+        return seq
+
+    def record_many(self, op: str, records: List[Dict[str, Any]]) -> List[int]:
+        """
+        Append the intent records of a batch with a single sync
+
+        Args:
+            op: Operation type of every record
+            records: Fields of each record
+
+        Returns:
+            Sequence numbers of the records, in order
+        """
+        if not records:
+            return []
+
+        seqs = []
+        with self._lock:
+            for fields in records:
+                self._seq += 1
+                seqs.append(self._seq)
+                self._append({"seq": self._seq, "op": op, **fields})
+        self._sync(seqs[-1])
+        return seqs
+
+    def complete(self, seq: int) -> None:
+        """
+        Mark a recorded operation as applied
+
+        Completions are flushed but not synced: losing one after a crash only
+        means the (idempotent) operation is replayed or undone again.
+        """
+        with self._lock:
+            self._append({"op": "done", "ref": seq})
+
+    @contextmanager
+    def operation(self, op: str, **fields: Any) -> Iterator[int]:
+        """Record an operation, run the block, and mark it applied if the block succeeded"""
+        seq = self.record(op, **fields)
+        yield seq
+        self.complete(seq)
+
+    def close(self) -> None:
+        """Close the journal, keeping it on disk"""
+        with self._lock:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+
+    def remove(self) -> None:
+        """Close and delete the journal once the run finished (successfully or not)"""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Read all journal entries
+
+        A torn last line (the process died mid-write) is ignored.
+
+        Returns:
+            List of entries in write order (empty if there is no journal)
+        """
+        if not self.path.is_file():
+            return []
+
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and "op" in entry:
+                    entries.append(entry)
+        return entries
+
+    def get_state(self) -> Optional[Dict[str, Any]]:
+        """
+        Summarize the unfinished run recorded in the journal
+
+        Returns:
+            Dict with the "begin" record of the run, its "operations" in order
+            (each with a "done" flag), the "completed_components" and whether
+            "publishing" had started; None if there is no journal
+        """
+        entries = self.load()
+        begin = next((entry for entry in entries if entry["op"] == "begin"), None)
+        if begin is None:
+            return None
+
+        completed = {entry["ref"] for entry in entries if entry["op"] == "done"}
+        operations = [
+            {**entry, "done": entry["seq"] in completed}
+            for entry in entries
+            if entry["op"] not in ("begin", "resume", "done", "component_installed")
+        ]
+
+        return {
+            "begin": begin,
+            "operations": operations,
+            "completed_components": [
+                entry["component"] for entry in entries if entry["op"] == "component_installed"
+            ],
+            "publishing": any(operation["op"] in ("publish", "retire") for operation in operations)
+        }
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """Write and flush one entry (caller holds the lock)"""
+        if self._stream is None:
+            raise ValueError(f"Journal {self.path} is not open")
+
+        self._stream.write(json.dumps(entry, default=str) + "\n")
+        self._stream.flush()
+
+    def _sync(self, seq: int) -> None:
+        """
+        Sync the journal to disk up to record seq (group commit)
+
+        The fsync runs outside the write lock, so other threads keep appending
+        meanwhile; one fsync covers every record flushed before it, and threads
+        whose record it covered return without syncing again.
+        """
+        with self._sync_lock:
+            if self._synced_seq >= seq:
+                return
+            with self._lock:
+                if self._stream is None:
+                    raise ValueError(f"Journal {self.path} is not open")
+                synced_seq = self._seq
+                fileno = self._stream.fileno()
+            os.fsync(fileno)
+            self._synced_seq = synced_seq
+
+
+# Journal of the installation run in progress (None outside install_components)
+_active_journal: Optional[InstallJournal] = None
+
+
+def get_active_journal() -> Optional[InstallJournal]:
+    """Get the journal of the installation run in progress, if any"""
+    return _active_journal
+
+
+def set_active_journal(journal: Optional[InstallJournal]) -> None:
+    """Make journal receive the file operations of the current run (None stops journaling)"""
+    global _active_journal
+    _active_journal = journal
+
+
+@contextmanager
+def journaled(op: str, **fields: Any) -> Iterator[None]:
+    """Record an operation in the active journal around the block (no-op without one)"""
+    journal = _active_journal
+    if journal is None:
+        yield
+        return
+
+    with journal.operation(op, **fields):
+        yield
+
+
+def record_operation(op: str, **fields: Any) -> None:
+    """Append a record to the active journal (no-op without one)"""
+    if _active_journal is not None:
+        _active_journal.record(op, **fields)
@@ -10,6 +10,7 @@ from typing import Optional, Dict, Any
 from enum import Enum
 
 from .ui import Colors
+from .events import emit_event
 
 
 class LogLevel(Enum):
@@ -157,16 +158,19 @@ class Logger:
         """Log warning message"""
         self.logger.warning(message, **kwargs)
         self.log_counts['warning'] += 1
+        emit_event("warning", message=message)
     
     def error(self, message: str, **kwargs) -> None:
         """Log error message"""
         self.logger.error(message, **kwargs)
         self.log_counts['error'] += 1
+        emit_event("error", level="error", message=message)
     
     def critical(self, message: str, **kwargs) -> None:
         """Log critical message"""
         self.logger.critical(message, **kwargs)
         self.log_counts['critical'] += 1
+        emit_event("error", level="critical", message=message)
     
     def success(self, message: str, **kwargs) -> None:
         """Log success message (info level with special formatting)"""
@@ -205,6 +209,7 @@ class Logger:
         """Log exception with traceback"""
         self.logger.error(message, exc_info=exc_info, **kwargs)
         self.log_counts['error'] += 1
+        emit_event("error", level="exception", message=message)
     
     def log_system_info(self, info: Dict[str, Any]) -> None:
         """Log system information"""
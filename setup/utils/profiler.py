@@ -0,0 +1,301 @@
+"""
+Profiling support for SuperClaude installation system
+Records import times, per-phase wall/CPU timings and a collapsed-stack cProfile dump
+"""
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+from .events import get_event_emitter
+
+
+class _TimedLoader:
+    """Loader proxy that times module execution for the import timer"""
+
+    def __init__(self, loader, fullname: str, timer: "_ImportTimer"):
+        self._loader = loader
+        self._fullname = fullname
+        self._timer = timer
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module) -> None:
+        self._timer.enter(self._fullname)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.exit(self._fullname)
+
+    def __getattr__(self, name: str):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer:
+    """Meta path finder recording inclusive and self time of every module import"""
+
+    def __init__(self):
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self._stack: List[List[float]] = []  # [start, child_time] per active import
+        self._lock = threading.RLock()
+        self._finding = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        # Guard against re-entering ourselves while delegating to the real finders
+        if getattr(self._finding, "active", False):
+            return None
+
+        self._finding.active = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, fullname, self)
+                    return spec
+            return None
+        finally:
+            self._finding.active = False
+
+    def enter(self, fullname: str) -> None:
+        with self._lock:
+            self._stack.append([time.perf_counter(), 0.0])
+
+    def exit(self, fullname: str) -> None:
+        with self._lock:
+            start, child_time = self._stack.pop()
+            elapsed = time.perf_counter() - start
+            if self._stack:
+                self._stack[-1][1] += elapsed
+            self.timings[fullname] = {
+                "cumulative_ms": round(elapsed * 1000, 3),
+                "self_ms": round((elapsed - child_time) * 1000, 3)
+            }
+
+    def install(self) -> None:
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+
+class Profiler:
+    """Collects timing information for a single CLI invocation"""
+
+    # Limits for rebuilding collapsed stacks from the cProfile call graph
+    MIN_STACK_SECONDS = 1e-5
+    MAX_STACK_DEPTH = 96
+
+    def __init__(self, enabled: bool = False):
+        """
+        Initialize profiler
+
+        Args:
+            enabled: If False, all recording calls are no-ops
+        """
+        self.enabled = enabled
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.started_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self._import_timer = _ImportTimer()
+        self._cprofile = None  # cProfile.Profile, imported only when enabled
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self._wall_total = 0.0
+        self._cpu_total = 0.0
+
+    def start(self) -> None:
+        """Start import timing and cProfile collection"""
+        if not self.enabled:
+            return
+
+        self.started_at = datetime.now()
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._import_timer.install()
+
+        import cProfile
+        self._cprofile = cProfile.Profile()
+        self._cprofile.enable()
+
+    def stop(self) -> None:
+        """Stop collection; safe to call more than once"""
+        if not self.enabled or self._cprofile is None:
+            return
+
+        self._cprofile.disable()
+        self._import_timer.uninstall()
+        self._wall_total = time.perf_counter() - self._wall_start
+        self._cpu_total = time.process_time() - self._cpu_start
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a named phase; repeated phases accumulate
+
+        Phase boundaries are also reported as phase_start/phase_end events
+        when structured event output is enabled.
+
+        Args:
+            name: Phase name (e.g. "registry_discovery")
+        """
+        emitter = get_event_emitter()
+        if not self.enabled and not emitter.enabled:
+            yield
+            return
+
+        emitter.emit("phase_start", phase=name)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            emitter.emit("phase_end", phase=name, success=success,
+                         duration_ms=round(wall * 1000, 3))
+            if self.enabled:
+                with self._lock:
+                    entry = self.phases.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0, "calls": 0})
+                    entry["wall_ms"] = round(entry["wall_ms"] + wall * 1000, 3)
+                    entry["cpu_ms"] = round(entry["cpu_ms"] + cpu * 1000, 3)
+                    entry["calls"] += 1
+
+    def get_collapsed_stacks(self) -> List[str]:
+        """
+        Convert the cProfile data into collapsed-stack lines ("a;b;c <microseconds>")
+
+        cProfile only records caller/callee edges, so full stacks are rebuilt
+        top-down from the root functions and time is attributed proportionally
+        along each edge.
+        """
+        if self._cprofile is None:
+            return []
+
+        import pstats
+        stats = pstats.Stats(self._cprofile).stats
+        callees: Dict[Tuple, Dict[Tuple, float]] = {}
+        for func, (_, _, _, _, callers) in stats.items():
+            for caller, edge in callers.items():
+                callees.setdefault(caller, {})[func] = edge[3]
+
+        roots = [func for func, (_, _, _, _, callers) in stats.items() if not callers]
+        collapsed: Dict[str, float] = {}
+
+        def label(func: Tuple) -> str:
+            filename, line, name = func
+            if filename == "~":
+                return name
+            return f"{name} ({Path(filename).name}:{line})"
+
+        def walk(func: Tuple, budget: float, path: List[str], seen: set) -> None:
+            _, _, self_time, cumulative, _ = stats[func]
+            # Prune negligible branches so large call graphs stay bounded
+            if cumulative <= 0 or budget < self.MIN_STACK_SECONDS or len(path) >= self.MAX_STACK_DEPTH:
+                return
+            share = min(1.0, budget / cumulative)
+            path.append(label(func))
+            key = ";".join(path)
+            collapsed[key] = collapsed.get(key, 0.0) + self_time * share
+
+            seen.add(func)
+            for callee, edge_time in callees.get(func, {}).items():
+                if callee not in seen and callee in stats:
+                    walk(callee, edge_time * share, path, seen)
+            seen.discard(func)
+            path.pop()
+
+        for root in roots:
+            walk(root, stats[root][3], [], set())
+
+        lines = []
+        for stack, seconds in sorted(collapsed.items()):
+            micros = int(seconds * 1_000_000)
+            if micros > 0:
+                lines.append(f"{stack} {micros}")
+        return lines
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Get profiling report
+
+        Returns:
+            Dict with totals, per-phase timings, import times and collapsed stacks
+        """
+        imports = dict(sorted(
+            self._import_timer.timings.items(),
+            key=lambda item: item[1]["cumulative_ms"],
+            reverse=True
+        ))
+
+        return {
+            "started": self.started_at.isoformat() if self.started_at else None,
+            "argv": sys.argv[1:],
+            "total": {
+                "wall_ms": round(self._wall_total * 1000, 3),
+                "cpu_ms": round(self._cpu_total * 1000, 3)
+            },
+            "phases": self.phases,
+            "imports": imports,
+            "collapsed_stacks": self.get_collapsed_stacks()
+        }
+
+    def write_report(self, log_dir: Path) -> Optional[Path]:
+        """
+        Write the report to <log_dir>/profile_<timestamp>.json
+
+        Args:
+            log_dir: Directory to write the report to
+
+        Returns:
+            Path to the report file or None if profiling is disabled or writing failed
+        """
+        if not self.enabled:
+            return None
+
+        self.stop()
+        timestamp = (self.started_at or datetime.now()).strftime("%Y%m%d_%H%M%S")
+        report_file = log_dir / f"profile_{timestamp}.json"
+
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            with open(report_file, 'w', encoding='utf-8') as f:
+                json.dump(self.get_report(), f, indent=2)
+            return report_file
+        except Exception as e:
+            print(f"Warning: Could not write profile report to {report_file}: {e}")
+            return None
+
+
+# Global profiler instance (disabled until enable_profiling is called)
+_global_profiler: Optional[Profiler] = None
+
+
+def get_profiler() -> Profiler:
+    """Get the global profiler instance (a disabled no-op profiler by default)"""
+    global _global_profiler
+
+    if _global_profiler is None:
+        _global_profiler = Profiler(enabled=False)
+
+    return _global_profiler
+
+
+def enable_profiling() -> Profiler:
+    """Create, start and install an enabled global profiler"""
+    global _global_profiler
+    _global_profiler = Profiler(enabled=True)
+    _global_profiler.start()
+    return _global_profiler
@@ -0,0 +1,139 @@
+"""
+Source manifest shipped with built packages
+Lists every framework source file with its size, sha256 and owning
+component, so installed packages never scan or hash their own tree. Dev and
+editable checkouts have no manifest and fall back to scanning.
+
+This module only uses the standard library: the build hook loads it by path.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+SOURCE_MANIFEST_FILE = "source-manifest.json"
+
+# Source directories inside the SuperClaude package and the component owning each
+SOURCE_DIRECTORIES = {
+    "Core": "core",
+    "Commands": "commands",
+    "Agents": "agents",
+    "Hooks": "hooks",
+}
+
+_IGNORED_DIRECTORIES = {"__pycache__"}
+_IGNORED_SUFFIXES = {".pyc", ".pyo"}
+
+
+def build_source_manifest(package_dir: Path, version: str) -> Dict[str, Any]:
+    """
+    Describe every file of the framework source directories
+
+    Args:
+        package_dir: The SuperClaude package directory (containing Core/, Commands/, ...)
+        version: Framework version the manifest is built for
+
+    Returns:
+        Dict with "version" and "files": path relative to package_dir ->
+        {component, size, sha256}
+    """
+    files = {}
+    for directory, component in SOURCE_DIRECTORIES.items():
+        source_dir = package_dir / directory
+        if not source_dir.is_dir():
+            continue
+
+        for path in sorted(source_dir.rglob("*")):
+            relative = path.relative_to(package_dir)
+            if (not path.is_file() or path.suffix in _IGNORED_SUFFIXES
+                    or _IGNORED_DIRECTORIES.intersection(relative.parts)):
+                continue
+
+            sha256 = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(65536), b''):
+                    sha256.update(chunk)
+
+            files[relative.as_posix()] = {
+                "component": component,
+                "size": path.stat().st_size,
+                "sha256": sha256.hexdigest()
+            }
+
+    return {"version": version, "files": files}
+
+
+def write_source_manifest(package_dir: Path, version: str, path: Path) -> Dict[str, Any]:
+    """
+    Build the source manifest and write it to path
+
+    Returns:
+        The manifest written
+    """
+    manifest = build_source_manifest(package_dir, version)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+class SourceManifest:
+    """Source files of an installed package, as recorded at build time"""
+
+    def __init__(self, package_dir: Path, data: Dict[str, Any]):
+        """
+        Initialize source manifest
+
+        Args:
+            package_dir: The SuperClaude package directory the manifest describes
+            data: Parsed manifest (see build_source_manifest)
+        """
+        self.package_dir = package_dir
+        self.version: Optional[str] = data.get("version")
+        self.files: Dict[str, Dict[str, Any]] = data.get("files", {})
+
+    def get_entry(self, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Get the recorded size, sha256 and component of a source file
+
+        Args:
+            path: Absolute source path
+
+        Returns:
+            Manifest entry, or None if the file is not part of the package
+        """
+        try:
+            relative = Path(path).relative_to(self.package_dir).as_posix()
+        except ValueError:
+            return None
+        return self.files.get(relative)
+
+
+_source_manifest: Optional[SourceManifest] = None
+_source_manifest_loaded = False
+_source_manifest_lock = threading.Lock()
+
+
+def get_source_manifest() -> Optional[SourceManifest]:
+    """
+    Get the manifest shipped with the installed package
+
+    Returns:
+        The source manifest, or None in dev and editable checkouts (which
+        have none) or if it can't be read; callers then scan the sources
+    """
+    global _source_manifest, _source_manifest_loaded
+    with _source_manifest_lock:
+        if not _source_manifest_loaded:
+            from .. import PROJECT_ROOT
+
+            package_dir = PROJECT_ROOT / "SuperClaude"
+            try:
+                with open(package_dir / SOURCE_MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                    _source_manifest = SourceManifest(package_dir, json.load(f))
+            except (OSError, ValueError):
+                _source_manifest = None
+            _source_manifest_loaded = True
+        return _source_manifest
@@ -6,7 +6,9 @@ Cross-platform console UI with colors and progress indication
 import sys
 import time
 import shutil
-from typing import List, Optional, Any, Dict, Union
+import threading
+from contextlib import contextmanager
+from typing import List, Optional, Any, Dict, Iterator, Union
 from enum import Enum
 
 # Try to import colorama for cross-platform color support
@@ -401,6 +403,61 @@ class StatusSpinner:
             print(final_message)
 
 
+class LineAtomicWriter:
+    """
+    Stream wrapper that writes whole lines only
+    
+    print() writes the text and the line end separately, so threads printing
+    to one stream can splice their lines together. Each thread's text is held
+    until it ends a line, then written in one call under a lock.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._pending = threading.local()
+    
+    def write(self, text: str) -> int:
+        pending = getattr(self._pending, "text", "") + text
+        lines, newline, rest = pending.rpartition("\n")
+        self._pending.text = rest
+        if newline:
+            with self._lock:
+                self.stream.write(lines + newline)
+        return len(text)
+    
+    def flush(self) -> None:
+        """Write the calling thread's unfinished line and flush the stream"""
+        pending = getattr(self._pending, "text", "")
+        self._pending.text = ""
+        with self._lock:
+            if pending:
+                self.stream.write(pending)
+            self.stream.flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+@contextmanager
+def line_atomic_output() -> Iterator[None]:
+    """
+    Keep lines printed by concurrent threads intact
+    
+    sys.stdout and sys.stderr write whole lines while the context is active.
+    Threads should flush both before they finish, so a last line without a
+    line end is not held back.
+    """
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = LineAtomicWriter(stdout), LineAtomicWriter(stderr)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        sys.stdout, sys.stderr = stdout, stderr
+
+
 def format_size(size_bytes: int) -> str:
     """Format file size in human-readable format"""
     for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
@@ -0,0 +1,48 @@
+"""
+Shared test fixtures
+Tests never touch the user's home, cache or installation directories
+"""
+
+from pathlib import Path
+
+import pytest
+
+from setup.utils import hash_cache
+from setup.utils.security import SecurityValidator
+
+
+@pytest.fixture(autouse=True)
+def isolated_hash_cache(tmp_path, monkeypatch):
+    """Give each test its own hash cache instead of the one in the user cache directory"""
+    cache = hash_cache.HashCache(tmp_path / "cache" / hash_cache.HASH_CACHE_FILE)
+    monkeypatch.setattr(hash_cache, "_hash_cache", cache)
+    yield cache
+
+
+@pytest.fixture
+def install_dir(tmp_path, monkeypatch):
+    """
+    ~/.claude of a throwaway home directory
+
+    pytest's temporary directories live under /tmp (or /var), which the
+    security checks refuse as system directories; that refusal is lifted
+    for paths inside the test's own directory only.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    validate_target = SecurityValidator.validate_installation_target.__func__
+    validate_files = SecurityValidator.validate_component_files.__func__
+
+    def validate_installation_target(cls, target_dir):
+        if Path(target_dir).is_relative_to(tmp_path):
+            return True, []
+        return validate_target(cls, target_dir)
+
+    def validate_component_files(cls, file_list, base_source_dir, base_target_dir):
+        if Path(base_target_dir).is_relative_to(tmp_path):
+            return True, []
+        return validate_files(cls, file_list, base_source_dir, base_target_dir)
+
+    monkeypatch.setattr(SecurityValidator, "validate_installation_target", classmethod(validate_installation_target))
+    monkeypatch.setattr(SecurityValidator, "validate_component_files", classmethod(validate_component_files))
+    return tmp_path / ".claude"
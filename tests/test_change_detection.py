@@ -0,0 +1,81 @@
+"""
+Incremental installs
+Re-running an install copies nothing; only installed files that were
+modified or deleted since are copied again
+"""
+
+import os
+
+import pytest
+
+from setup.base.installer import Installer
+from setup.components.commands import CommandsComponent
+from setup.components.core import CoreComponent
+
+
+COMPONENTS = ["core", "commands"]
+
+
+def _install(install_dir):
+    installer = Installer(install_dir)
+    installer.register_components([CoreComponent(install_dir), CommandsComponent(install_dir)])
+    assert installer.install_components(COMPONENTS, {})
+    return installer
+
+
+@pytest.fixture
+def installed(install_dir):
+    _install(install_dir)
+    return install_dir
+
+
+def test_rerun_is_up_to_date(installed, capsys):
+    backups = sorted((installed / "backups").rglob("*"))
+    capsys.readouterr()
+
+    installer = _install(installed)
+
+    assert "All components are up to date, nothing to install" in capsys.readouterr().out
+    assert installer.skipped_components == set(COMPONENTS)
+    assert sum(installer.get_files_copied().values()) == 0
+    assert sorted((installed / "backups").rglob("*")) == backups
+    assert not CoreComponent(installed).has_changes()
+    assert not CommandsComponent(installed).has_changes()
+
+
+@pytest.mark.parametrize("change", ["modify", "delete"])
+def test_changed_target_is_reinstalled(installed, change):
+    rules = installed / "RULES.md"
+    source = CoreComponent(installed)._get_source_dir() / "RULES.md"
+    if change == "modify":
+        rules.write_text("edited")
+    else:
+        rules.unlink()
+
+    assert CoreComponent(installed).has_changes()
+    assert not CommandsComponent(installed).has_changes()
+
+    installer = _install(installed)
+
+    assert rules.read_bytes() == source.read_bytes()
+    assert installer.get_files_copied() == {"core": 1, "commands": 0}
+
+
+def test_file_unchanged_checks_the_installed_copy(installed):
+    component = CoreComponent(installed)
+    manifest = component.settings_manager.get_component_manifest("core")
+    source, target = next((source, target) for source, target in component.get_files_to_install()
+                          if target.name == "RULES.md")
+
+    assert component._is_file_unchanged(source, target, manifest)
+
+    # Same size, different content and mtime
+    content = target.read_bytes()
+    target.write_bytes(content[::-1])
+    assert not component._is_file_unchanged(source, target, manifest)
+
+    # Installed before the manifest existed: adopted only if the content matches
+    assert not component._is_file_unchanged(source, target, {})
+    target.write_bytes(content)
+    os.utime(target, ns=(0, 0))
+    assert not component._is_file_unchanged(source, target, manifest)
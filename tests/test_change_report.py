@@ -0,0 +1,70 @@
+"""
+Dry-run change report
+The report lists exactly the files and metadata keys an install would
+change, and leaves the installation untouched
+"""
+
+import pytest
+
+from setup.base.installer import Installer, DEFAULT_BYTES_PER_SECOND, DEFAULT_PER_FILE_SECONDS
+from setup.components.commands import CommandsComponent
+from setup.components.core import CoreComponent
+
+
+COMPONENTS = ["core", "commands"]
+
+
+def _installer(install_dir, dry_run):
+    installer = Installer(install_dir, dry_run=dry_run)
+    installer.register_components([CoreComponent(install_dir), CommandsComponent(install_dir)])
+    installer.build_plan(COMPONENTS)
+    return installer
+
+
+def _tree(install_dir):
+    return {
+        path.relative_to(install_dir).as_posix(): path.read_bytes()
+        for path in install_dir.rglob("*") if path.is_file()
+    }
+
+
+def test_fresh_install_adds_every_planned_file(install_dir):
+    installer = _installer(install_dir, dry_run=True)
+
+    report = installer.get_change_report()
+
+    for name in COMPONENTS:
+        component = report["components"][name]
+        planned = installer.plan.components[name]
+        assert component["add"] == len(planned.files)
+        assert component["modify"] == component["delete"] == 0
+        assert component["bytes"] == sum(planned_file.size for planned_file in planned.files)
+        assert f"components.{name}.version" in component["metadata_keys"]
+
+    totals = report["totals"]
+    assert totals["add"] == installer.plan.total_files
+    assert report["estimated_seconds"] == pytest.approx(
+        totals["add"] * DEFAULT_PER_FILE_SECONDS + totals["bytes"] / DEFAULT_BYTES_PER_SECOND, abs=1e-4)
+
+
+def test_update_reports_exact_changes_without_writing(install_dir):
+    installer = _installer(install_dir, dry_run=False)
+    assert installer.install_components(COMPONENTS, {})
+    (install_dir / "RULES.md").write_text("edited rules")
+    (install_dir / "commands" / "sc" / "build.md").unlink()
+    (install_dir / "commands" / "analyze.md").write_text("legacy command")
+    before = _tree(install_dir)
+
+    report = _installer(install_dir, dry_run=True).get_change_report()
+
+    core, commands = report["components"]["core"], report["components"]["commands"]
+    assert [(change["action"], change["path"]) for change in core["files"]] == [("modify", "RULES.md")]
+    assert sorted((change["action"], change["path"]) for change in commands["files"]) == [
+        ("add", "commands/sc/build.md"), ("delete", "commands/analyze.md")
+    ]
+    assert core["metadata_keys"] == commands["metadata_keys"] == []
+    assert report["totals"] == {
+        "add": 1, "modify": 1, "delete": 1,
+        "bytes": core["bytes"] + commands["bytes"]
+    }
+    assert _tree(install_dir) == before
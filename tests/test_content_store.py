@@ -0,0 +1,74 @@
+"""
+Content store objects shared by linked installations
+An object changed through a link must not be reused or kept
+"""
+
+import hashlib
+import os
+import stat
+
+import pytest
+
+from setup.managers.content_store import (
+    ContentStore, LINK_MODE_HARDLINK, LINK_MODE_SYMLINK
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ContentStore(tmp_path / "store")
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "source" / "RULES.md"
+    path.parent.mkdir()
+    path.write_text("# Rules\n")
+    return path
+
+
+def _digest(path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _write_through(path):
+    """Edit a linked file in place, as root or an editor that ignores the read-only bits would"""
+    os.chmod(path, stat.S_IMODE(os.stat(path).st_mode) | stat.S_IWUSR)
+    with open(path, "a") as f:
+        f.write("local edit\n")
+
+
+def _install(store, source, directory, link_mode):
+    target = directory / "RULES.md"
+    target.parent.mkdir(parents=True, exist_ok=True)
+    store.link(source, target, link_mode)
+    return target
+
+
+@pytest.mark.parametrize("link_mode", [LINK_MODE_HARDLINK, LINK_MODE_SYMLINK])
+def test_modified_object_is_replaced_before_reuse(store, source, tmp_path, link_mode):
+    first = _install(store, source, tmp_path / "a", link_mode)
+    sha256 = _digest(source)
+    _write_through(first)
+    assert not store.is_intact(sha256)
+
+    # The next install links the original content again, not the edited object
+    second = _install(store, source, tmp_path / "b", link_mode)
+
+    assert store.is_intact(sha256)
+    assert second.read_text() == source.read_text()
+    assert store.is_linked(second, sha256)
+
+
+def test_garbage_collection_removes_modified_objects(store, source, tmp_path):
+    target = _install(store, source, tmp_path / "a", LINK_MODE_HARDLINK)
+    sha256 = _digest(source)
+
+    assert store.collect_garbage() == (0, 0)
+    assert store.is_intact(sha256)
+
+    _write_through(target)
+    removed, _ = store.collect_garbage()
+
+    assert removed == 1
+    assert not store.get_object_path(sha256).exists()
@@ -0,0 +1,99 @@
+"""
+FileManager.copy_directory ignore patterns and tracking
+The compiled ignore expression must match exactly what fnmatch matched
+"""
+
+import fnmatch
+import os
+from pathlib import Path
+
+import pytest
+
+from setup.managers.file_manager import FileManager, _compile_ignore_patterns
+
+
+DEFAULT_IGNORES = ['.git', '.gitignore', '__pycache__', '*.pyc', '.DS_Store']
+
+PATTERNS = [
+    "*.log", "build", "docs/*.tmp", "agents/*/draft-*.md", "*/cache", "[!a-m]*.bak",
+    "notes?.txt", "deep/*", "*.[oa]", "exact/path/file.md",
+]
+
+TREE = [
+    "README.md", "run.log", "build/out.md", "src/build/out.md", "docs/a.tmp", "docs/sub/b.tmp",
+    "agents/core/draft-1.md", "agents/core/final.md", "agents/core/deep/draft-2.md",
+    "x/cache/file.md", "x/y/cache/file.md", "zeta.bak", "alpha.bak", "notes1.txt", "notes10.txt",
+    "deep/one.md", "deep/two/three.md", "lib.o", "lib.a", "lib.so", "exact/path/file.md",
+    "exact/path/other.md", ".git/config", "pkg/__pycache__/m.pyc", "pkg/m.pyc", "pkg/m.py",
+    "pkg/.DS_Store", "weird [1].md",
+]
+
+
+def fnmatch_ignored(name: str, relative: str, patterns) -> bool:
+    """The matching copy_directory did before patterns were compiled"""
+    return any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative, pattern) for pattern in patterns)
+
+
+def expected_copy(source: Path, patterns):
+    """Files copytree keeps with the fnmatch ignore callback"""
+    kept = set()
+    for directory, dirs, files in os.walk(source):
+        relative_dir = Path(directory).relative_to(source)
+        for name in list(dirs):
+            if fnmatch_ignored(name, str(relative_dir / name), patterns):
+                dirs.remove(name)
+        for name in files:
+            if not fnmatch_ignored(name, str(relative_dir / name), patterns):
+                kept.add((relative_dir / name).as_posix())
+    return kept
+
+
+@pytest.fixture
+def source(tmp_path):
+    root = tmp_path / "source"
+    for relative in TREE:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative)
+    return root
+
+
+@pytest.mark.parametrize("relative", TREE + [
+    "docs", "agents/core", "x/cache", "deep", "build", "a/b/c.pyc", "notes.txt", "Zeta.bak",
+])
+def test_compiled_patterns_match_fnmatch(relative):
+    patterns = PATTERNS + DEFAULT_IGNORES
+    compiled = _compile_ignore_patterns(tuple(patterns))
+    name = relative.rsplit("/", 1)[-1]
+    relative = os.path.normcase(str(Path(relative)))
+
+    matched = bool(compiled.match(os.path.normcase(name)) or compiled.match(relative))
+    assert matched == fnmatch_ignored(name, relative, patterns)
+
+
+def test_copy_matches_fnmatch_and_tracks_while_copying(source, tmp_path):
+    target = tmp_path / "target"
+    file_manager = FileManager()
+
+    assert file_manager.copy_directory(source, target, PATTERNS)
+
+    copied = {path.relative_to(target).as_posix() for path in target.rglob("*") if path.is_file()}
+    assert copied == expected_copy(source, PATTERNS + DEFAULT_IGNORES)
+
+    assert sorted(file_manager.copied_files) == sorted(target / relative for relative in copied)
+    assert len(file_manager.copy_samples) == len(copied)
+    directories = {path for path in target.rglob("*") if path.is_dir()}
+    assert set(file_manager.created_dirs) == directories
+
+
+def test_existing_target_content_is_not_tracked(source, tmp_path):
+    target = tmp_path / "target"
+    (target / "docs").mkdir(parents=True)
+    (target / "user.md").write_text("kept")
+    file_manager = FileManager()
+
+    assert file_manager.copy_directory(source, target, PATTERNS)
+
+    assert target / "user.md" not in file_manager.copied_files
+    assert target / "docs" not in file_manager.created_dirs
+    assert target / "src" in file_manager.created_dirs
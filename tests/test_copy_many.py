@@ -0,0 +1,94 @@
+"""
+Batch copies
+copy_many creates each target directory once, copies on a bounded pool and
+journals the whole batch with a single sync
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from setup.managers.file_manager import FileManager
+from setup.utils.journal import InstallJournal, set_active_journal
+
+
+DIRECTORIES = ["a", "a/b", "c/d/e", "f"]
+
+
+@pytest.fixture
+def pairs(tmp_path):
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    pairs = []
+    for index in range(40):
+        source = source_dir / f"file{index}.md"
+        source.write_text(f"content {index}\n" * (index + 1))
+        pairs.append((source, tmp_path / "target" / DIRECTORIES[index % len(DIRECTORIES)] / source.name))
+    (tmp_path / "target").mkdir()
+    return pairs
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_each_directory_is_created_once(pairs, monkeypatch, workers):
+    created = []
+    real_mkdir = Path.mkdir
+
+    def mkdir(path, *args, **kwargs):
+        if kwargs.get("parents"):
+            created.append(path)
+        real_mkdir(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "mkdir", mkdir)
+    file_manager = FileManager()
+
+    assert file_manager.copy_many(pairs, workers=workers) == {}
+
+    # mkdir(parents=True) also calls itself for the missing ancestors
+    directories = {target.parent for _, target in pairs}
+    assert sorted(path for path in created if path in directories) == sorted(directories)
+    for source, target in pairs:
+        assert target.read_bytes() == source.read_bytes()
+    assert sorted(file_manager.copied_files) == sorted(target for _, target in pairs)
+
+
+def test_batch_is_journaled_with_one_sync(pairs, tmp_path, monkeypatch):
+    journal = InstallJournal(tmp_path / "journal")
+    journal.open()
+    syncs = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (syncs.append(fd), real_fsync(fd)))
+    set_active_journal(journal)
+    try:
+        assert FileManager().copy_many(pairs, workers=4) == {}
+    finally:
+        set_active_journal(None)
+        journal.close()
+
+    entries = journal.load()
+    copies = [entry for entry in entries if entry["op"] == "copy"]
+    mkdirs = [entry for entry in entries if entry["op"] == "mkdir"]
+    completed = {entry["ref"] for entry in entries if entry["op"] == "done"}
+
+    assert sorted(entry["path"] for entry in copies) == sorted(str(target) for _, target in pairs)
+    assert all(entry["seq"] in completed for entry in copies)
+    # One sync per created directory tree, one for the batch of copy intents
+    assert len(syncs) == len(mkdirs) + 1
+
+
+def test_failed_copies_are_reported_per_file(pairs):
+    missing_source, failed_target = pairs[5]
+    missing_source.unlink()
+
+    failures = FileManager().copy_many(pairs, workers=4)
+
+    assert list(failures) == [failed_target]
+    assert not failed_target.exists()
+    assert all(target.is_file() for _, target in pairs if target != failed_target)
+
+
+def test_dry_run_writes_nothing(pairs, capsys):
+    assert FileManager(dry_run=True).copy_many(pairs) == {}
+
+    assert not any(target.exists() for _, target in pairs)
+    assert capsys.readouterr().out.count("[DRY RUN] Would copy") == len(pairs)
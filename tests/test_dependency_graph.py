@@ -0,0 +1,128 @@
+"""
+Dependency graph resolution, levels and cycle detection
+Includes a scaling benchmark over thousands of synthetic components
+"""
+
+import os
+import random
+import time
+
+import pytest
+
+from setup.core.dependency_graph import DependencyCycleError, DependencyGraph
+
+
+# Timing ratios depend on the machine and its load, so they only run on request
+TIMING_TESTS = os.environ.get("SUPERCLAUDE_TIMING_TESTS") == "1"
+
+
+def build_synthetic_graph(count: int, max_dependencies: int = 3, seed: int = 0) -> DependencyGraph:
+    """Graph of count components, each depending on up to max_dependencies earlier ones"""
+    rng = random.Random(seed)
+    graph = DependencyGraph()
+    for index in range(count):
+        dependencies = {f"c{rng.randrange(index)}" for _ in range(rng.randint(0, max_dependencies))} if index else set()
+        graph.set_dependencies(f"c{index}", dependencies)
+    return graph
+
+
+def _best_time(func, runs: int = 3) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_resolve_puts_dependencies_first():
+    graph = build_synthetic_graph(500)
+    order = graph.resolve(reversed(graph.names))
+
+    assert sorted(order) == sorted(graph.names)
+    position = {name: index for index, name in enumerate(order)}
+    for name in graph.names:
+        for dependency in graph.get_dependencies(name):
+            assert position[dependency] < position[name]
+
+
+def test_resolve_pulls_in_transitive_dependencies():
+    graph = DependencyGraph()
+    graph.set_dependencies("core", [])
+    graph.set_dependencies("commands", ["core"])
+    graph.set_dependencies("agents", ["commands"])
+    graph.set_dependencies("mcp", ["core"])
+
+    assert graph.resolve(["agents"]) == ["core", "commands", "agents"]
+    assert graph.get_dependents("core") == {"commands", "mcp"}
+
+
+def test_levels_only_depend_on_earlier_levels():
+    graph = build_synthetic_graph(500)
+    levels = graph.get_levels(graph.resolve(graph.names))
+
+    level_of = {name: index for index, level in enumerate(levels) for name in level}
+    assert len(level_of) == len(graph)
+    for name in graph.names:
+        for dependency in graph.get_dependencies(name):
+            assert level_of[dependency] < level_of[name]
+
+
+def test_unknown_dependency_is_rejected():
+    graph = DependencyGraph()
+    graph.set_dependencies("commands", ["core"])
+
+    with pytest.raises(ValueError, match="Unknown component: core"):
+        graph.resolve(["commands"])
+
+
+def _assert_is_cycle(graph: DependencyGraph, cycle):
+    assert len(cycle) > 1 and cycle[0] == cycle[-1]
+    for name, dependency in zip(cycle, cycle[1:]):
+        assert dependency in graph.get_dependencies(name)
+
+
+def test_cycle_is_reported_by_every_entry_point():
+    graph = build_synthetic_graph(200)
+    # Make c10 depend on c199, which (transitively) depends on c10 in a chain
+    graph.set_dependencies("c150", graph.get_dependencies("c150") | {"c10"})
+    graph.set_dependencies("c199", graph.get_dependencies("c199") | {"c150"})
+    graph.set_dependencies("c10", graph.get_dependencies("c10") | {"c199"})
+
+    with pytest.raises(DependencyCycleError) as excinfo:
+        graph.resolve(graph.names)
+    _assert_is_cycle(graph, excinfo.value.cycle)
+    assert "Circular dependency detected" in str(excinfo.value)
+
+    with pytest.raises(DependencyCycleError) as excinfo:
+        graph.get_levels(graph.names)
+    _assert_is_cycle(graph, excinfo.value.cycle)
+
+    cycles = graph.find_cycles()
+    assert cycles
+    for cycle in cycles:
+        _assert_is_cycle(graph, cycle)
+    assert any({"c10", "c150", "c199"} <= set(cycle) for cycle in cycles)
+
+
+def test_acyclic_graph_has_no_cycles():
+    assert build_synthetic_graph(1000).find_cycles() == []
+
+
+@pytest.mark.skipif(not TIMING_TESTS, reason="set SUPERCLAUDE_TIMING_TESTS=1 to check scaling by wall-clock time")
+@pytest.mark.parametrize("operation", ["resolve", "levels", "find_cycles"])
+def test_scales_linearly(operation):
+    small = build_synthetic_graph(2000)
+    large = build_synthetic_graph(8000)
+
+    def run(graph):
+        if operation == "resolve":
+            return lambda: graph.resolve(graph.names)
+        if operation == "levels":
+            order = graph.resolve(graph.names)
+            return lambda: graph.get_levels(order)
+        return graph.find_cycles
+
+    ratio = _best_time(run(large)) / _best_time(run(small))
+    # 4x the components: linear work is about 4x, quadratic work would be about 16x
+    assert ratio < 8, f"{operation}: 4x components took {ratio:.1f}x as long"
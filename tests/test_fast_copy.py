@@ -0,0 +1,80 @@
+"""
+Copy strategies of the fast copy engine
+A kernel copy that ends early must never pass for a complete copy
+"""
+
+import os
+
+import pytest
+
+from setup.utils import fast_copy
+
+
+@pytest.fixture(autouse=True)
+def reset_unsupported():
+    fast_copy._unsupported.clear()
+    yield
+    fast_copy._unsupported.clear()
+
+
+def _write_source(tmp_path, size: int):
+    source = tmp_path / "source.bin"
+    source.write_bytes(os.urandom(size))
+    return source
+
+
+def test_copy_keeps_content_and_mode(tmp_path):
+    source = _write_source(tmp_path, 3 * 1024 * 1024 + 17)
+    source.chmod(0o640)
+    target = tmp_path / "target.bin"
+
+    strategy = fast_copy.copy_file(source, target)
+
+    assert strategy in (fast_copy.STRATEGY_REFLINK, fast_copy.STRATEGY_COPY_FILE_RANGE,
+                        fast_copy.STRATEGY_SENDFILE, fast_copy.STRATEGY_BUFFERED)
+    assert target.read_bytes() == source.read_bytes()
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert target.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+
+@pytest.mark.parametrize("kernel_copy", ["copy_file_range", "sendfile"])
+def test_short_kernel_copy_falls_back(tmp_path, monkeypatch, kernel_copy):
+    if not hasattr(os, kernel_copy):
+        pytest.skip(f"os.{kernel_copy} is not available")
+
+    calls = []
+
+    def stops_early(*args):
+        # Copy the first 4 KiB, then report end of file before st_size (as some FUSE/NFS mounts do)
+        calls.append(args)
+        if len(calls) > 1:
+            return 0
+        if kernel_copy == "sendfile":
+            out_fd, in_fd, offset, _ = args
+            return os.pwrite(out_fd, os.pread(in_fd, 4096, offset), offset)
+        in_fd, out_fd, _, source_offset, target_offset = args
+        return os.pwrite(out_fd, os.pread(in_fd, 4096, source_offset), target_offset)
+
+    monkeypatch.setattr(os, kernel_copy, stops_early)
+    # Skip the strategies ahead of the one under test
+    strategies = [(name, copy) for name, copy in fast_copy._STRATEGIES
+                  if name in (kernel_copy, fast_copy.STRATEGY_BUFFERED)]
+    monkeypatch.setattr(fast_copy, "_STRATEGIES", strategies)
+
+    source = _write_source(tmp_path, 64 * 1024)
+    target = tmp_path / "target.bin"
+
+    assert fast_copy.copy_file(source, target) == fast_copy.STRATEGY_BUFFERED
+    assert target.read_bytes() == source.read_bytes()
+    assert calls
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/version"), reason="needs procfs")
+def test_sizeless_source_is_read_to_end(tmp_path):
+    # procfs files report a size of 0 but have content
+    source = "/proc/version"
+    target = tmp_path / "version"
+
+    assert fast_copy.copy_file(source, target) == fast_copy.STRATEGY_BUFFERED
+    with open(source, "rb") as f:
+        assert target.read_bytes() == f.read()
@@ -0,0 +1,69 @@
+"""
+Declarative file specs
+Globs select component files from one shared walk of the source tree
+"""
+
+import os
+
+import pytest
+
+from setup import PROJECT_ROOT
+from setup.base.file_spec import FileSpec, list_source_files, reset_source_trees
+
+
+@pytest.mark.parametrize("pattern, path, expected", [
+    ("*.md", "RULES.md", True),
+    ("*.md", "sub/RULES.md", False),
+    ("**/*.md", "RULES.md", True),
+    ("**/*.md", "a/b/RULES.md", True),
+    ("**/*.md", "RULES.py", False),
+    ("agents/*.md", "agents/x.md", True),
+    ("agents/*.md", "agents/sub/x.md", False),
+    ("?.md", "a.md", True),
+    ("?.md", "ab.md", False),
+    ("[ab].md", "b.md", True),
+    ("[!ab].md", "b.md", False),
+    ("[!ab].md", "c.md", True),
+    ("*.md", "RULES.MD", True),
+    ("notes.md", "notes+md", False),
+])
+def test_glob_matching(pattern, path, expected):
+    assert FileSpec(include=(pattern,)).matches(path) is expected
+
+
+def test_exclude_wins_over_include():
+    spec = FileSpec(include=("**/*.md",), exclude=("**/README.md",))
+
+    assert spec.select(["b.md", "README.md", "sub/README.md", "sub/a.md", "c.py"]) == ["b.md", "sub/a.md"]
+    assert FileSpec(include=()).select(["a.md"]) == []
+
+
+def test_source_tree_is_walked_once(tmp_path):
+    (tmp_path / "sub" / "__pycache__").mkdir(parents=True)
+    (tmp_path / "a.md").write_text("a")
+    (tmp_path / "sub" / "b.md").write_text("b")
+    (tmp_path / "sub" / "__pycache__" / "b.cpython-311.pyc").write_text("")
+    reset_source_trees()
+
+    assert list_source_files(tmp_path) == ["a.md", "sub/b.md"]
+
+    # Later listings come from the first walk until the trees are reset
+    (tmp_path / "c.md").write_text("c")
+    assert list_source_files(tmp_path) == ["a.md", "sub/b.md"]
+    reset_source_trees()
+    assert list_source_files(tmp_path) == ["a.md", "c.md", "sub/b.md"]
+
+    assert list_source_files(tmp_path / "missing") is None
+
+
+def test_package_directories_match_a_fresh_walk():
+    reset_source_trees()
+    directory = PROJECT_ROOT / "SuperClaude" / "Commands"
+    walked = sorted(
+        os.path.relpath(os.path.join(dirpath, name), directory).replace(os.sep, "/")
+        for dirpath, dirnames, filenames in os.walk(directory)
+        if "__pycache__" not in dirpath.split(os.sep)
+        for name in filenames
+    )
+
+    assert list_source_files(directory) == walked
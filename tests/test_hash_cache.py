@@ -0,0 +1,95 @@
+"""
+Persistent hash cache
+Digests must be correct, invalidated by any change and shared between
+processes without one blocking the others
+"""
+
+import hashlib
+import multiprocessing
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from setup.utils.hash_cache import HashCache, HASH_CACHE_FILE, MMAP_THRESHOLD
+
+
+def _digest(path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _count_rows(path) -> int:
+    with sqlite3.connect(str(path)) as connection:
+        return connection.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+
+
+@pytest.mark.parametrize("size", [0, 5000, MMAP_THRESHOLD + 1])
+def test_digest_matches_hashlib(tmp_path, size):
+    path = tmp_path / "file.bin"
+    path.write_bytes(os.urandom(size))
+    cache = HashCache(tmp_path / HASH_CACHE_FILE)
+
+    assert cache.get_hash(path) == _digest(path)
+    assert cache.get_hash(path) == _digest(path)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_rewrite_keeping_size_and_mtime_is_detected(tmp_path):
+    path = tmp_path / "RULES.md"
+    path.write_text("first")
+    cache = HashCache(tmp_path / HASH_CACHE_FILE)
+    cache.get_hash(path)
+
+    times = os.stat(path).st_mtime_ns
+    path.write_text("other")
+    os.utime(path, ns=(times, times))
+
+    assert cache.get_hash(path) == _digest(path)
+    assert cache.misses == 2
+
+
+def test_digests_are_committed_without_flushing(tmp_path):
+    path = tmp_path / "file.md"
+    path.write_text("content")
+    database = tmp_path / HASH_CACHE_FILE
+
+    HashCache(database).get_hash(path)
+
+    assert _count_rows(database) == 1
+    assert HashCache(database).get_hash(path) == _digest(path)
+
+
+_worker_cache = None
+
+
+def _hash_in_worker(paths):
+    start = time.perf_counter()
+    for path in paths:
+        _worker_cache.get_hash(path)
+    return time.perf_counter() - start
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="needs fork")
+def test_forked_workers_share_the_database(tmp_path):
+    global _worker_cache
+    database = tmp_path / HASH_CACHE_FILE
+    files = []
+    for index in range(4 * 25):
+        path = tmp_path / f"file{index}.md"
+        path.write_text(f"content {index}")
+        files.append(path)
+
+    # Opened (and written) before the workers fork, like a fleet parent
+    _worker_cache = HashCache(database)
+    _worker_cache.get_hash(files[0])
+
+    batches = [files[index::4] for index in range(4)]
+    with ProcessPoolExecutor(max_workers=4, mp_context=multiprocessing.get_context("fork")) as executor:
+        durations = list(executor.map(_hash_in_worker, batches))
+
+    # No worker waits out another's write lock (the busy timeout is 5 s)
+    assert max(durations) < 2
+    # Pool workers exit without atexit handlers; their digests are already committed
+    assert _count_rows(database) == len(files)
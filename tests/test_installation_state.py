@@ -0,0 +1,64 @@
+"""
+Installation state snapshot
+State files are parsed once per directory and reloaded only when they
+change on disk
+"""
+
+import json
+import os
+
+from setup.managers.installation_state import InstallationState, get_installation_state
+from setup.managers.settings_manager import SettingsManager
+
+
+def test_repeated_reads_parse_once(tmp_path):
+    path = tmp_path / ".superclaude-metadata.json"
+    path.write_text(json.dumps({"framework": {"version": "3.0.0"}}))
+    state = InstallationState(tmp_path)
+
+    for _ in range(5):
+        assert state.read(path) == {"framework": {"version": "3.0.0"}}
+
+    assert state.loads == 1
+
+
+def test_changes_on_disk_are_reloaded(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"theme": "dark"}))
+    state = InstallationState(tmp_path)
+    state.read(path)
+
+    # Rewritten in place with another size
+    path.write_text(json.dumps({"theme": "light"}))
+    assert state.read(path) == {"theme": "light"}
+
+    # Replaced by rename, keeping size and mtime
+    replacement = tmp_path / "settings.json.new"
+    replacement.write_text(json.dumps({"theme": "solar"}))
+    times = os.stat(path).st_mtime_ns
+    os.utime(replacement, ns=(times, times))
+    os.replace(replacement, path)
+    assert state.read(path) == {"theme": "solar"}
+
+    path.unlink()
+    assert state.read(path) is None
+    assert state.loads == 3
+
+
+def test_settings_managers_share_the_snapshot(tmp_path):
+    writer = SettingsManager(tmp_path)
+    reader = SettingsManager(tmp_path)
+    state = get_installation_state(tmp_path)
+    assert reader.state is writer.state is state
+
+    writer.update_metadata({"components": {"core": {"version": "3.0.0"}}})
+    loads = state.loads
+
+    # Written content is stored, not parsed back
+    assert reader.get_component_version("core") == "3.0.0"
+    assert state.loads == loads
+
+    # Callers get copies; the shared document stays intact
+    metadata = reader.load_metadata()
+    metadata["components"]["core"]["version"] = "changed"
+    assert writer.get_component_version("core") == "3.0.0"
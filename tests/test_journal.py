@@ -0,0 +1,147 @@
+"""
+Installation journal
+A run interrupted after any journaled operation must be resumable to the
+finished installation and roll back to the tree it started from
+"""
+
+import pytest
+
+from setup.base.installer import Installer
+from setup.components.commands import CommandsComponent
+from setup.components.core import CoreComponent
+from setup.managers import file_manager
+from setup.utils import fast_copy
+from setup.utils.journal import InstallJournal
+
+
+class Crash(BaseException):
+    """Stands in for the process dying; not caught by the installer's error handling"""
+
+
+COMPONENTS = ["core", "commands"]
+
+
+def _installer(install_dir, staged):
+    installer = Installer(install_dir, staged=staged)
+    installer.register_components([CoreComponent(install_dir), CommandsComponent(install_dir)])
+    return installer
+
+
+def _install(install_dir, staged, resume=False):
+    installer = _installer(install_dir, staged)
+    if resume:
+        state = installer.prepare_resume()
+        return installer.install_components(state["begin"]["components"], state["begin"]["config"])
+    return installer.install_components(COMPONENTS, {})
+
+
+def _snapshot(install_dir):
+    """Content of every file the components or the user own (state files, backups and logs left out)"""
+    return {
+        path.relative_to(install_dir).as_posix(): path.read_bytes()
+        for path in install_dir.rglob("*")
+        if path.is_file() and not path.name.startswith(".superclaude-")
+        and not {"backups", "logs"} & set(path.relative_to(install_dir).parts)
+    }
+
+
+@pytest.fixture
+def installed(install_dir):
+    """Finished installation plus its snapshot, then changed by the user"""
+    assert _install(install_dir, staged=False)
+    finished = _snapshot(install_dir)
+
+    (install_dir / "RULES.md").write_text("edited rules")
+    (install_dir / "PRINCIPLES.md").unlink()
+    (install_dir / "commands" / "sc" / "analyze.md").write_text("edited command")
+    (install_dir / "commands" / "sc" / "build.md").unlink()
+    (install_dir / "commands" / "sc" / "mine.md").write_text("user command")
+    finished["commands/sc/mine.md"] = b"user command"
+
+    return install_dir, finished, _snapshot(install_dir)
+
+
+def _crash_after_copies(count):
+    def crash(monkeypatch):
+        real_copy = fast_copy.copy_file
+        calls = []
+
+        def copy_file(source, target, *args, **kwargs):
+            strategy = real_copy(source, target, *args, **kwargs)
+            calls.append(target)
+            if len(calls) == count:
+                raise Crash()
+            return strategy
+
+        monkeypatch.setattr(fast_copy, "copy_file", copy_file)
+
+    return crash
+
+
+def _crash_after_directory_swap(monkeypatch):
+    real_exchange = file_manager._exchange_paths
+
+    def exchange_paths(first, second):
+        if not real_exchange(first, second):
+            pytest.skip("atomic directory exchange not supported here")
+        raise Crash()
+
+    monkeypatch.setattr(file_manager, "_exchange_paths", exchange_paths)
+
+
+def _interrupt(monkeypatch, install_dir, staged, crash):
+    with monkeypatch.context() as patch:
+        crash(patch)
+        with pytest.raises(Crash):
+            _install(install_dir, staged)
+    assert InstallJournal(install_dir).exists()
+
+
+@pytest.mark.parametrize("staged", [False, True])
+def test_copy_interrupted_run_resumes(installed, monkeypatch, staged):
+    install_dir, finished, _ = installed
+    _interrupt(monkeypatch, install_dir, staged, _crash_after_copies(2))
+
+    assert _install(install_dir, staged, resume=True)
+
+    assert _snapshot(install_dir) == finished
+    assert not InstallJournal(install_dir).exists()
+
+
+@pytest.mark.parametrize("staged", [False, True])
+def test_copy_interrupted_run_rolls_back(installed, monkeypatch, staged):
+    install_dir, _, before = installed
+    _interrupt(monkeypatch, install_dir, staged, _crash_after_copies(2))
+
+    assert _installer(install_dir, staged).rollback_interrupted()
+
+    assert _snapshot(install_dir) == before
+    assert not InstallJournal(install_dir).exists()
+
+
+def test_publish_interrupted_after_swap_resumes(installed, monkeypatch):
+    install_dir, finished, _ = installed
+    _interrupt(monkeypatch, install_dir, True, _crash_after_directory_swap)
+
+    assert InstallJournal(install_dir).get_state()["publishing"]
+    assert _install(install_dir, staged=True, resume=True)
+
+    assert _snapshot(install_dir) == finished
+    assert not any(install_dir.parent.glob(".claude.staging-*"))
+
+
+def test_publish_interrupted_after_swap_rolls_back(installed, monkeypatch):
+    install_dir, _, before = installed
+    _interrupt(monkeypatch, install_dir, True, _crash_after_directory_swap)
+
+    # The staged commands/sc is live now; its inode tells rollback to swap it back
+    live = install_dir / "commands" / "sc"
+    state = InstallJournal(install_dir).get_state()
+    swap = next(operation for operation in state["operations"] if operation.get("live") == str(live))
+    assert not swap["done"]
+    assert live.stat().st_ino == swap["staged_ino"]
+
+    assert _installer(install_dir, staged=True).rollback_interrupted()
+
+    assert _snapshot(install_dir) == before
+    assert not any(install_dir.parent.glob(".claude.staging-*"))
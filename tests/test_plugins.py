@@ -0,0 +1,95 @@
+"""
+Plugin components
+Components contributed through entry points are listed without importing
+them and only imported once selected
+"""
+
+import sys
+from importlib.metadata import EntryPoint
+from pathlib import Path
+
+import pytest
+
+from setup.core import registry as registry_module
+from setup.core.registry import ComponentRegistry, PLUGIN_ENTRY_POINT_GROUP
+
+
+COMPONENTS_DIR = Path(__file__).resolve().parent.parent / "setup" / "components"
+
+PLUGIN_MODULE = '''
+from pathlib import Path
+
+from setup.base.component import Component
+
+
+class ReviewComponent(Component):
+    METADATA = {
+        "name": "review",
+        "version": "1.2.0",
+        "description": "Code review commands",
+        "category": "commands"
+    }
+    DEPENDENCIES = ("core",)
+
+    def _get_source_dir(self):
+        return Path(__file__).parent / "review"
+
+    def _install(self, config):
+        return super()._install(config)
+
+    def _post_install(self):
+        return True
+
+    def uninstall(self):
+        return True
+'''
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    """A "review" plugin component in a module nothing has imported yet"""
+    (tmp_path / "superclaude_review.py").write_text(PLUGIN_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "superclaude_review", raising=False)
+
+    entry_points = [
+        EntryPoint("review", "superclaude_review:ReviewComponent", PLUGIN_ENTRY_POINT_GROUP),
+        EntryPoint("core", "superclaude_review:ReviewComponent", PLUGIN_ENTRY_POINT_GROUP),
+    ]
+    monkeypatch.setattr(registry_module, "_iter_entry_points",
+                        lambda group: entry_points if group == PLUGIN_ENTRY_POINT_GROUP else [])
+    return tmp_path / "registry.json"
+
+
+def test_plugin_is_listed_without_importing_it(plugin, capsys):
+    registry = ComponentRegistry(COMPONENTS_DIR, plugin)
+
+    assert "review" in registry.list_components()
+    assert registry.is_plugin("review")
+    assert registry.get_component_metadata("review")["category"] == "plugin"
+    assert "superclaude_review" not in sys.modules
+
+    # A plugin can't take the name of a built-in component
+    assert not registry.is_plugin("core")
+    assert "Ignoring plugin component core" in capsys.readouterr().out
+
+
+def test_selected_plugin_is_imported_and_ordered(plugin):
+    registry = ComponentRegistry(COMPONENTS_DIR, plugin)
+
+    assert registry.resolve_dependencies(["review"]) == ["core", "review"]
+
+    assert "superclaude_review" in sys.modules
+    assert registry.get_component_class("review").__name__ == "ReviewComponent"
+    assert registry.get_component_metadata("review")["description"] == "Code review commands"
+
+
+def test_resolved_plugin_metadata_is_cached(plugin, monkeypatch):
+    ComponentRegistry(COMPONENTS_DIR, plugin).resolve_dependencies(["review"])
+    monkeypatch.delitem(sys.modules, "superclaude_review")
+
+    registry = ComponentRegistry(COMPONENTS_DIR, plugin)
+
+    assert registry.get_component_metadata("review")["description"] == "Code review commands"
+    assert registry.get_dependencies("review") == {"core"}
+    assert "superclaude_review" not in sys.modules
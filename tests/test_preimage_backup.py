@@ -0,0 +1,50 @@
+"""
+Pre-image backups
+An update archives only the installed files it will overwrite or delete,
+in the layout 'SuperClaude backup --restore' reads
+"""
+
+import json
+import tarfile
+
+from setup.base.installer import Installer
+from setup.components.commands import CommandsComponent
+from setup.components.core import CoreComponent
+
+
+def _install(install_dir, config=None):
+    installer = Installer(install_dir)
+    installer.register_components([CoreComponent(install_dir), CommandsComponent(install_dir)])
+    assert installer.install_components(["core", "commands"], config or {})
+    return installer
+
+
+def test_backup_holds_only_overwritten_files(install_dir):
+    _install(install_dir)
+    (install_dir / "RULES.md").write_text("edited rules")
+    (install_dir / "commands" / "sc" / "build.md").unlink()
+
+    installer = _install(install_dir)
+
+    with tarfile.open(installer.backup_path) as archive:
+        names = set(archive.getnames())
+        metadata = json.load(archive.extractfile("backup_metadata.json"))
+        rules = archive.extractfile("RULES.md").read()
+
+    # The deleted command is only added back, so there is nothing to keep of it
+    assert names == {"backup_metadata.json", "RULES.md", ".superclaude-metadata.json", ".superclaude-manifest.json"}
+    assert metadata["backup_type"] == "pre-image"
+    assert sorted(metadata["files"]) == sorted(names - {"backup_metadata.json"})
+    assert rules == b"edited rules"
+
+
+def test_full_backup_on_request(install_dir):
+    _install(install_dir)
+    (install_dir / "RULES.md").write_text("edited rules")
+
+    installer = _install(install_dir, {"full_backup": True})
+
+    with tarfile.open(installer.backup_path) as archive:
+        names = {name.split("/", 1)[1] for name in archive.getnames() if "/" in name}
+
+    assert {"RULES.md", "FLAGS.md", "commands/sc/analyze.md"} <= names
@@ -0,0 +1,77 @@
+"""
+Component discovery cache
+Warm starts list and order components from the cache without importing
+component modules; a changed module invalidates the cache
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from setup.core.registry import ComponentRegistry
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+COMPONENTS_DIR = PROJECT_ROOT / "setup" / "components"
+
+_DISCOVERY_SCRIPT = """
+import json, sys
+from pathlib import Path
+from setup.core.registry import ComponentRegistry
+registry = ComponentRegistry(Path(sys.argv[1]), Path(sys.argv[2]))
+names = registry.list_components()
+order = registry.resolve_dependencies(["commands"])
+print(json.dumps([names, order, sorted(name for name in sys.modules if name.startswith("setup.components."))]))
+"""
+
+
+def _discover_in_subprocess(cache_file):
+    result = subprocess.run(
+        [sys.executable, "-c", _DISCOVERY_SCRIPT, str(COMPONENTS_DIR), str(cache_file)],
+        cwd=PROJECT_ROOT, env=dict(os.environ, HOME=str(cache_file.parent)),
+        capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_warm_start_imports_no_component_module(tmp_path):
+    cache_file = tmp_path / "registry.json"
+
+    cold_names, cold_order, cold_modules = _discover_in_subprocess(cache_file)
+    warm_names, warm_order, warm_modules = _discover_in_subprocess(cache_file)
+
+    assert cold_modules
+    assert warm_modules == []
+    assert (warm_names, warm_order) == (cold_names, cold_order)
+    assert cold_order == ["core", "commands"]
+
+
+def test_changed_module_invalidates_the_cache(tmp_path, monkeypatch):
+    cache_file = tmp_path / "registry.json"
+    ComponentRegistry(COMPONENTS_DIR, cache_file).discover_components()
+
+    walks = []
+    real_discover = ComponentRegistry._discover_components
+
+    def discover(registry):
+        walks.append(registry)
+        real_discover(registry)
+
+    monkeypatch.setattr(ComponentRegistry, "_discover_components", discover)
+
+    warm = ComponentRegistry(COMPONENTS_DIR, cache_file)
+    warm.discover_components()
+    assert walks == []
+    assert warm.get_component_class("core").__name__ == "CoreComponent"
+
+    # A component module with another size or mtime than the cached one
+    cache = json.loads(cache_file.read_text())
+    cache["fingerprint"]["modules"]["core"][1] += 1
+    cache_file.write_text(json.dumps(cache))
+
+    ComponentRegistry(COMPONENTS_DIR, cache_file).discover_components()
+    assert len(walks) == 1
+    assert json.loads(cache_file.read_text())["fingerprint"] != cache["fingerprint"]
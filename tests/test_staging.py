@@ -0,0 +1,81 @@
+"""
+Staged installation
+Publishing must only replace what the installer owns in the live directory
+"""
+
+import json
+
+from setup.base.staging import StagingArea
+from setup.components.commands import CommandsComponent
+from setup.managers.settings_manager import SettingsManager
+
+
+def _write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+def _read_json(path):
+    return json.loads(path.read_text())
+
+
+def test_staging_root_is_a_hidden_sibling(tmp_path):
+    for name in (".claude", "claude"):
+        staging = StagingArea(tmp_path / name)
+
+        assert staging.root.parent == tmp_path
+        assert staging.root.name.startswith(".claude.staging-")
+
+
+def test_publish_keeps_settings_edited_meanwhile(tmp_path):
+    install_dir = tmp_path / ".claude"
+    _write_json(install_dir / "settings.json", {"theme": "dark", "components": {"core": {"version": "2.0.0"}}})
+    staging = StagingArea(install_dir)
+    staging.create()
+
+    # The staged run moves its own data out of settings.json...
+    assert SettingsManager(staging.staging_dir).migrate_superclaude_data()
+    # ...while Claude changes the live file
+    _write_json(install_dir / "settings.json", {"theme": "light", "components": {"core": {"version": "2.0.0"}},
+                                                "model": "opus"})
+
+    staging.publish([])
+
+    assert _read_json(install_dir / "settings.json") == {"theme": "light", "model": "opus"}
+    assert _read_json(install_dir / ".superclaude-metadata.json")["components"] == {"core": {"version": "2.0.0"}}
+
+
+def test_publish_leaves_untouched_settings_alone(tmp_path):
+    install_dir = tmp_path / ".claude"
+    _write_json(install_dir / "settings.json", {"theme": "dark"})
+    staging = StagingArea(install_dir)
+    staging.create()
+    _write_json(install_dir / "settings.json", {"theme": "light"})
+    before = (install_dir / "settings.json").stat().st_ino
+
+    staging.publish([])
+
+    assert (install_dir / "settings.json").stat().st_ino == before
+    assert _read_json(install_dir / "settings.json") == {"theme": "light"}
+
+
+def test_legacy_commands_are_removed_only_when_publishing(tmp_path):
+    install_dir = tmp_path / ".claude"
+    legacy = install_dir / "commands" / "analyze.md"
+    own = install_dir / "commands" / "notes.md"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text("legacy")
+    own.write_text("mine")
+    staging = StagingArea(install_dir)
+    staging.create()
+    component = staging.stage_component(CommandsComponent(install_dir))
+
+    component._migrate_existing_commands()
+    assert legacy.is_file()
+
+    staging.publish([component])
+    assert not legacy.exists()
+    assert own.read_text() == "mine"
+
+    StagingArea.undo_retire({"live": str(legacy), "retired": str(staging.retired_dir / "commands" / "analyze.md")})
+    assert legacy.read_text() == "legacy"
@@ -0,0 +1,76 @@
+"""
+Startup-time budget of the SuperClaude CLI hub
+Quick commands must not import the operations they don't dispatch
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Milliseconds a quick command may add on top of a bare interpreter start
+STARTUP_BUDGET_MS = 300
+
+# Wall-clock budgets depend on the machine and its load, so they only run on request
+TIMING_TESTS = os.environ.get("SUPERCLAUDE_TIMING_TESTS") == "1"
+
+# Heavy operation modules that quick commands must leave alone
+HEAVY_MODULES = ("setup.operations.install", "setup.operations.update", "setup.operations.uninstall")
+
+QUICK_COMMANDS = (["--version"], ["--help"], ["backup", "--list"])
+
+_LOADED_MODULES_SCRIPT = """
+import json, runpy, sys
+sys.argv = ["SuperClaude"] + json.loads(sys.argv[1])
+try:
+    runpy.run_module("SuperClaude", run_name="__main__")
+except SystemExit:
+    pass
+print("\\n" + json.dumps(sorted(sys.modules)))
+"""
+
+
+def _run(args, home: Path) -> subprocess.CompletedProcess:
+    env = dict(os.environ, HOME=str(home))
+    return subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT, env=env,
+                          capture_output=True, text=True, timeout=60)
+
+
+def _best_time_ms(args, home: Path, runs: int = 5) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        _run(args, home)
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+@pytest.mark.parametrize("command", QUICK_COMMANDS, ids=" ".join)
+def test_quick_commands_skip_heavy_operations(command, tmp_path):
+    result = _run(["-c", _LOADED_MODULES_SCRIPT, json.dumps(command)], tmp_path)
+    assert result.returncode == 0, result.stderr
+
+    loaded = set(json.loads(result.stdout.strip().splitlines()[-1]))
+    assert not loaded.intersection(HEAVY_MODULES)
+    assert "setup.core.registry" not in loaded
+
+
+@pytest.mark.skipif(not TIMING_TESTS, reason="set SUPERCLAUDE_TIMING_TESTS=1 to check wall-clock budgets")
+@pytest.mark.parametrize("command", QUICK_COMMANDS, ids=" ".join)
+def test_quick_commands_start_within_budget(command, tmp_path):
+    # Warm the bytecode cache of the sources once, then compare best runs
+    _run(["-m", "SuperClaude", *command], tmp_path)
+    interpreter_ms = _best_time_ms(["-c", "pass"], tmp_path)
+    command_ms = _best_time_ms(["-m", "SuperClaude", *command], tmp_path)
+
+    assert command_ms - interpreter_ms < STARTUP_BUDGET_MS, (
+        f"'SuperClaude {' '.join(command)}' took {command_ms:.0f} ms "
+        f"({interpreter_ms:.0f} ms bare interpreter, budget {STARTUP_BUDGET_MS} ms)"
+    )
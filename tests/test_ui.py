@@ -0,0 +1,36 @@
+"""
+Console output shared by parallel component installs
+Lines printed by concurrent threads must stay whole
+"""
+
+import re
+import sys
+import threading
+
+from setup.utils.ui import line_atomic_output
+
+
+def test_threads_print_whole_lines(capsys):
+    def worker(index):
+        for count in range(200):
+            print(f"[DRY RUN] Would install component{index} {count}")
+        sys.stdout.flush()
+
+    with line_atomic_output():
+        threads = [threading.Thread(target=worker, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 8 * 200
+    assert all(re.fullmatch(r"\[DRY RUN\] Would install component\d \d+", line) for line in lines)
+
+
+def test_unfinished_line_is_written_on_exit(capsys):
+    with line_atomic_output():
+        print("Installing: ", end="")
+        assert capsys.readouterr().out == ""
+
+    assert capsys.readouterr().out == "Installing: "
@@ -0,0 +1,55 @@
+"""
+Post-install validation
+Files are checked against the plan's sizes and hashes, hashing only the
+files whose manifest entry no longer matches
+"""
+
+import pytest
+
+from setup.base.installer import Installer
+from setup.base.validation import ValidationEngine
+from setup.components.commands import CommandsComponent
+from setup.components.core import CoreComponent
+
+
+@pytest.fixture
+def installer(install_dir):
+    installer = Installer(install_dir)
+    installer.register_components([CoreComponent(install_dir), CommandsComponent(install_dir)])
+    assert installer.install_components(["core", "commands"], {})
+    return installer
+
+
+def _validate(installer, jobs):
+    return ValidationEngine(jobs).validate([installer.components["core"], installer.components["commands"]])
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_intact_installation_is_valid_without_hashing(installer, jobs):
+    results = _validate(installer, jobs)
+
+    assert list(results) == ["core", "commands"]
+    for name, result in results.items():
+        assert result.success, result.errors
+        assert result.files_checked == len(installer.plan.components[name].files)
+        assert result.files_hashed == 0
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_damaged_files_are_reported(installer, jobs):
+    install_dir = installer.install_dir
+    rules_size = (CoreComponent(install_dir)._get_source_dir() / "RULES.md").stat().st_size
+    (install_dir / "FLAGS.md").unlink()
+    (install_dir / "RULES.md").write_text("short")
+    analyze = install_dir / "commands" / "sc" / "analyze.md"
+    analyze.write_bytes(analyze.read_bytes()[::-1])
+
+    results = _validate(installer, jobs)
+
+    assert not results["core"].success
+    assert sorted(results["core"].errors) == sorted([
+        "Missing file: FLAGS.md",
+        f"Size mismatch: RULES.md (5 bytes, expected {rules_size})"
+    ])
+    assert results["commands"].errors == ["Content mismatch: commands/sc/analyze.md"]
+    assert results["commands"].files_hashed == 1